@@ -19,8 +19,16 @@ from gfapy.logger import Logger
 from gfapy.segment_end_path import SegmentEndsPath
 from gfapy.segment_end import *
 from gfapy.oriented_line import OrientedLine
-from gfapy.lines import Lines
+from gfapy.reference_list import ReferenceList
+from gfapy.sequence_store import SequenceStore, SequenceHandle
+from gfapy.packed_sequence import PackedSequence
+from gfapy.segment_table import SegmentTable
+from gfapy.adjacency import Adjacency
+from gfapy.lines import Lines, LinesView
 from gfapy.graph_operations import GraphOperations
 from gfapy.gfa import Gfa
+from gfapy.reader import iter_lines
+import gfapy.bgzf
+import gfapy.snapshot
 import gfapy.sequence
 import gfapy.field
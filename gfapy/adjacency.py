@@ -0,0 +1,213 @@
+import gfapy
+from array import array
+
+class Adjacency:
+  """Adjacency of the segment ends, in compressed sparse row format.
+
+  The nodes are the segment ends. The node of the end ``end_type`` of the
+  segment with dense ID ``segment_id`` (see `SegmentTable`) is
+  ``2 * segment_id`` for ``L`` and ``2 * segment_id + 1`` for ``R``; thus
+  ``node >> 1`` is the ID of the segment and ``node ^ 1`` is its other end.
+
+  The dovetail overlaps of the node ``n`` are stored in the positions
+  ``starts[n]`` to ``stops[n]`` (excluded) of the ``targets`` array,
+  which contains the node of the other segment end involved in the overlap,
+  and of the ``edges`` list, which contains the edge instances. The order of
+  the overlaps of a node is the same as in the dovetails_L/dovetails_R
+  lists of the segment.
+
+  The adjacency is obtained from the segment table (see
+  `SegmentTable.adjacency`), which constructs it on demand. When edges are
+  removed, the table removes them also from the adjacency, by moving the
+  following overlaps of the same node one position back; when segments or
+  edges are added, the adjacency is discarded.
+
+  Parameters:
+    table (gfapy.SegmentTable) : the segment table
+  """
+
+  def __init__(self, table):
+    self.starts = array("q")
+    self.stops = array("q")
+    self.targets = array("q")
+    self.edges = []
+    row = table._row
+    for line in table._lines:
+      refs = (line._refs or {}) if line is not None else {}
+      for end_type in ["L", "R"]:
+        self.starts.append(len(self.targets))
+        for edge in refs.get("dovetails_" + end_type, ()):
+          self.targets.append(self.__other_node(edge, line, end_type, row))
+          self.edges.append(edge)
+        self.stops.append(len(self.targets))
+
+  @staticmethod
+  def __other_node(edge, segment, end_type, row):
+    if edge.record_type == "L":
+      # fast path for links, avoiding the construction of segment ends
+      data = edge._data
+      other = data["from_segment"]
+      other_end_type = "R" if data["from_orient"] == "+" else "L"
+      if other is segment and other_end_type == end_type:
+        other = data["to_segment"]
+        other_end_type = "L" if data["to_orient"] == "+" else "R"
+    else:
+      other_end = edge.from_end
+      if other_end.segment is segment and other_end.end_type == end_type:
+        other_end = edge.to_end
+      other = other_end.segment
+      other_end_type = other_end.end_type
+    return 2 * row[id(other)] + (other_end_type == "R")
+
+  @staticmethod
+  def node(segment_id, end_type):
+    """The node of a segment end.
+
+    Parameters:
+      segment_id (int) : the dense ID of the segment
+      end_type (str) : L or R
+    """
+    return 2 * segment_id + (end_type == "R")
+
+  @staticmethod
+  def end_type(node):
+    """The end type (L or R) of a node."""
+    return "R" if node & 1 else "L"
+
+  def degree(self, node):
+    """Number of dovetail overlaps of a segment end."""
+    return self.stops[node] - self.starts[node]
+
+  def neighbours(self, node):
+    """Nodes connected by dovetail overlaps to a segment end."""
+    return self.targets[self.starts[node]:self.stops[node]]
+
+  def _remove_edge(self, edge, segment_ids):
+    """Remove the overlaps of an edge of the given segments."""
+    for segment_id in segment_ids:
+      for node in [2 * segment_id, 2 * segment_id + 1]:
+        i = self.starts[node]
+        while i < self.stops[node]:
+          if self.edges[i] is edge:
+            stop = self.stops[node] - 1
+            self.targets[i:stop] = self.targets[i + 1:stop + 1]
+            self.edges[i:stop] = self.edges[i + 1:stop + 1]
+            self.edges[stop] = None
+            self.stops[node] = stop
+          else:
+            i += 1
+
+class CutIndex:
+  """Articulation points, bridges and biconnected components of the graph.
+
+  The graph considered is the graph of the segments, connected by dovetail
+  overlaps, irrespective of the segment ends and orientations. The index
+  is computed in linear time using an iterative version of the algorithm of
+  Hopcroft and Tarjan.
+
+  The segment table (see `SegmentTable`) keeps the index after segments
+  and edges are removed, and collects in ``dirty`` the IDs of the
+  segments, whose information could be out of date: i.e. those in the
+  biconnected components of removed non-cut segments and removed edges.
+  The index of the other segments is still valid, as the removal only
+  affects the biconnected components, where it occurred.
+
+  Attributes:
+    articulation (bytearray) : 1 for segments, whose removal splits a
+      connected component, 0 otherwise
+    bridges (set) : the ``id()`` of the edges, whose removal splits a
+      connected component
+    block_of (array) : for each segment, the index of a biconnected
+      component containing it (the only one, if it is not an articulation)
+    blocks (list) : the IDs of the segments of each biconnected component
+    dirty (set) : IDs of the segments, whose information is out of date
+
+  Parameters:
+    adjacency (gfapy.Adjacency) : the adjacency of the segment ends
+  """
+
+  def __init__(self, adjacency):
+    starts = adjacency.starts
+    stops = adjacency.stops
+    targets = adjacency.targets
+    edges = adjacency.edges
+    n = len(starts) // 2
+    disc = array("q", [-1]) * n
+    low = array("q", [0]) * n
+    self.articulation = bytearray(n)
+    self.bridges = set()
+    self.block_of = array("q", [-1]) * n
+    self.blocks = []
+    self.dirty = set()
+    counter = 0
+    for root in range(n):
+      if disc[root] >= 0:
+        continue
+      disc[root] = low[root] = counter
+      counter += 1
+      n_children = 0
+      vertices = [root]
+      # depth first search stack: vertex, edge to the parent,
+      # current segment end and next position in its overlaps
+      stack = [root]
+      parent_edges = [None]
+      nodes = [2 * root]
+      positions = [starts[2 * root]]
+      while stack:
+        v = stack[-1]
+        node = nodes[-1]
+        i = positions[-1]
+        if i >= stops[node] and not node & 1:
+          node += 1
+          nodes[-1] = node
+          i = starts[node]
+        if i < stops[node]:
+          positions[-1] = i + 1
+          edge = edges[i]
+          if edge is parent_edges[-1]:
+            continue
+          w = targets[i] >> 1
+          if disc[w] < 0:
+            disc[w] = low[w] = counter
+            counter += 1
+            vertices.append(w)
+            stack.append(w)
+            parent_edges.append(edge)
+            nodes.append(2 * w)
+            positions.append(starts[2 * w])
+          elif disc[w] < low[v]:
+            low[v] = disc[w]
+          continue
+        stack.pop()
+        nodes.pop()
+        positions.pop()
+        edge = parent_edges.pop()
+        if not stack:
+          break
+        u = stack[-1]
+        if low[v] < low[u]:
+          low[u] = low[v]
+        if low[v] >= disc[u]:
+          if low[v] > disc[u]:
+            self.bridges.add(id(edge))
+          if u == root:
+            n_children += 1
+          else:
+            self.articulation[u] = 1
+          block_index = len(self.blocks)
+          block = []
+          while True:
+            x = vertices.pop()
+            self.block_of[x] = block_index
+            block.append(x)
+            if x == v:
+              break
+          block.append(u)
+          self.blocks.append(block)
+      if n_children == 0:
+        self.block_of[root] = len(self.blocks)
+        self.blocks.append([root])
+      elif n_children == 1:
+        self.block_of[root] = len(self.blocks) - 1
+      else:
+        self.articulation[root] = 1
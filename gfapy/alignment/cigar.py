@@ -139,6 +139,8 @@ class CIGAR(list):
           :attr:`~Operation.CODE`.
     """
 
+    __slots__ = ("length", "code")
+
     CODE_GFA1_ONLY = ["S", "H", "N", "X", "="]
     """Operations only valid in GFA1"""
 
@@ -0,0 +1,234 @@
+"""
+Reading of BGZF (blocked gzip) compressed files
+
+A BGZF file (e.g. written by ``bgzip``) is a series of gzip members,
+called blocks, each containing at most 64 kB of uncompressed data. The
+compressed size of each block is stored in its header, so that the blocks can
+be located without decompressing them. Thus the blocks can be decompressed in
+parallel threads (zlib releases the GIL while decompressing) and the file can
+be randomly accessed.
+
+Positions in a BGZF file are expressed as virtual offsets: the offset of the
+block in the compressed file, shifted left by 16 bits, plus the offset of the
+position in the uncompressed content of the block. The index of a BGZF file,
+which can be saved in the ``.gzi`` format of ``bgzip``, allows to convert
+uncompressed offsets to virtual offsets.
+"""
+import gfapy
+import struct
+import zlib
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+_MAGIC = b"\x1f\x8b\x08\x04"
+_HEADER = struct.Struct("<4sIBBH")
+_SUBFIELD = struct.Struct("<BBH")
+_TRAILER = struct.Struct("<II")
+_GZI_ENTRY = struct.Struct("<QQ")
+_GZI_COUNT = struct.Struct("<Q")
+
+def is_bgzf(filename):
+  """Check if a file is BGZF compressed.
+
+  Parameters:
+    filename (str)
+
+  Returns:
+    bool
+  """
+  with open(filename, "rb") as f:
+    header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size or header[:4] != _MAGIC:
+      return False
+    xlen = _HEADER.unpack(header)[4]
+    return _block_size(f.read(xlen)) is not None
+
+def iter_strings(filename, threads = 1, start = 0, end = None):
+  """Iterate over the lines of a BGZF file.
+
+  Parameters:
+    filename (str)
+    threads (int) : number of threads used for decompressing the blocks
+      (default: 1)
+    start (int) : virtual offset of the first line to read; it must be the
+      beginning of a line (default: 0, i.e. the beginning of the file)
+    end (int) : virtual offset at which reading stops; lines starting at
+      or after it are not returned (default: None, i.e. until the end of
+      the file)
+
+  Returns:
+    generator of (int, str) : virtual offset of the beginning of each line
+      and the line, without line terminator
+
+  Raises:
+    ~gfapy.error.FormatError: if the file is not a valid BGZF file
+  """
+  with open(filename, "rb") as f:
+    f.seek(start >> 16)
+    skip = start & 0xFFFF
+    rest = b""
+    rest_voffset = start
+    for coffset, content in _iter_decompressed_blocks(f, threads):
+      pos = skip
+      skip = 0
+      pieces = content[pos:].split(b"\n")
+      for piece in pieces[:-1]:
+        if rest:
+          line = rest + piece
+          voffset = rest_voffset
+          rest = b""
+        else:
+          line = piece
+          voffset = (coffset << 16) | pos
+        if end is not None and voffset >= end:
+          return
+        yield voffset, line.decode().rstrip("\r")
+        pos += len(piece) + 1
+      if pieces[-1]:
+        if not rest:
+          rest_voffset = (coffset << 16) | pos
+        rest += pieces[-1]
+    if rest and (end is None or rest_voffset < end):
+      yield rest_voffset, rest.decode().rstrip("\r")
+
+def build_index(filename):
+  """Compute the index of a BGZF file.
+
+  Only the block headers and trailers are read, i.e. no decompression is
+  necessary.
+
+  Returns:
+    list of (int, int) : compressed and uncompressed offset of the
+      beginning of each block
+  """
+  index = []
+  uoffset = 0
+  with open(filename, "rb") as f:
+    for coffset, data in _iter_blocks(f):
+      index.append((coffset, uoffset))
+      uoffset += _TRAILER.unpack_from(data, len(data) - _TRAILER.size)[1]
+  return index
+
+def write_index(filename, index_filename = None):
+  """Compute the index of a BGZF file and save it in ``.gzi`` format.
+
+  Parameters:
+    filename (str) : the BGZF file
+    index_filename (str) : the index file (default: filename + ".gzi")
+
+  Returns:
+    str : the name of the index file
+  """
+  if index_filename is None:
+    index_filename = filename + ".gzi"
+  # as in bgzip, the first block (offsets 0, 0) is implicit
+  index = build_index(filename)[1:]
+  with open(index_filename, "wb") as f:
+    f.write(_GZI_COUNT.pack(len(index)))
+    for entry in index:
+      f.write(_GZI_ENTRY.pack(*entry))
+  return index_filename
+
+def read_index(index_filename):
+  """Read the index of a BGZF file in ``.gzi`` format.
+
+  Returns:
+    list of (int, int) : compressed and uncompressed offset of the
+      beginning of each block
+  """
+  with open(index_filename, "rb") as f:
+    content = f.read()
+  n = _GZI_COUNT.unpack_from(content)[0]
+  index = [(0, 0)]
+  for i in range(n):
+    index.append(_GZI_ENTRY.unpack_from(content,
+                 _GZI_COUNT.size + i * _GZI_ENTRY.size))
+  return index
+
+def virtual_offset(index, uoffset):
+  """Convert an offset in the uncompressed content to a virtual offset.
+
+  Parameters:
+    index (list of (int, int)) : see `build_index` and `read_index`
+    uoffset (int) : offset in the uncompressed content of the file
+
+  Returns:
+    int
+  """
+  i = bisect_right([entry[1] for entry in index], uoffset) - 1
+  coffset, block_uoffset = index[i]
+  return (coffset << 16) | (uoffset - block_uoffset)
+
+def _block_size(extra):
+  """Total size of a block, from the BC subfield of its extra field."""
+  pos = 0
+  while pos + _SUBFIELD.size <= len(extra):
+    si1, si2, slen = _SUBFIELD.unpack_from(extra, pos)
+    if si1 == 66 and si2 == 67 and slen == 2:
+      return struct.unpack_from("<H", extra, pos + _SUBFIELD.size)[0] + 1
+    pos += _SUBFIELD.size + slen
+  return None
+
+def _iter_blocks(f):
+  """Iterate over the blocks of a BGZF file, from the current position.
+
+  Returns:
+    generator of (int, bytes) : offset of each block in the compressed file
+      and its compressed data, followed by the gzip trailer
+  """
+  coffset = f.tell()
+  while True:
+    header = f.read(_HEADER.size)
+    if not header:
+      return
+    if len(header) < _HEADER.size or header[:4] != _MAGIC:
+      raise gfapy.FormatError(
+          "Invalid BGZF block header at offset {}".format(coffset))
+    xlen = _HEADER.unpack(header)[4]
+    bsize = _block_size(f.read(xlen))
+    if bsize is None:
+      raise gfapy.FormatError(
+          "BGZF block at offset {} has no BC subfield".format(coffset))
+    datasize = bsize - _HEADER.size - xlen
+    data = f.read(datasize)
+    if len(data) != datasize or datasize < _TRAILER.size:
+      raise gfapy.FormatError(
+          "Truncated BGZF block at offset {}".format(coffset))
+    yield coffset, data
+    coffset += bsize
+
+def _inflate(data):
+  """Decompress the data of a block and check it against its trailer."""
+  crc, isize = _TRAILER.unpack_from(data, len(data) - _TRAILER.size)
+  content = zlib.decompress(data[:-_TRAILER.size], -zlib.MAX_WBITS)
+  if len(content) != isize or zlib.crc32(content) != crc:
+    raise gfapy.FormatError("BGZF block content does not match "+
+                            "its size or CRC32")
+  return content
+
+def _iter_decompressed_blocks(f, threads = 1):
+  """Iterate over the decompressed blocks of a BGZF file.
+
+  If threads > 1, the blocks are decompressed by a pool of threads; the
+  number of blocks in decompression is limited, so that memory usage does
+  not depend on the file size.
+
+  Returns:
+    generator of (int, bytes) : offset of each block in the compressed file
+      and its decompressed content
+  """
+  if threads <= 1:
+    for coffset, data in _iter_blocks(f):
+      yield coffset, _inflate(data)
+    return
+  with ThreadPoolExecutor(max_workers = threads) as executor:
+    pending = deque()
+    for coffset, data in _iter_blocks(f):
+      pending.append((coffset, executor.submit(_inflate, data)))
+      if len(pending) >= threads * 4:
+        coffset, future = pending.popleft()
+        yield coffset, future.result()
+    while pending:
+      coffset, future = pending.popleft()
+      yield coffset, future.result()
@@ -112,6 +112,13 @@ class Field(Validator, Parser, Writer):
   TAG_DATATYPE = ["A", "i", "f", "Z", "J", "H", "B"]
   """The names of all datatypes for tags."""
 
+  STRING_DATATYPE = ["A", "Z", "comment", "custom_record_type", "generic",
+                     "identifier_gfa2", "optional_identifier_gfa2",
+                     "orientation", "path_name_gfa1", "segment_name_gfa1",
+                     "sequence_gfa1", "sequence_gfa2"]
+  """The names of the datatypes, whose valid values are decoded into the
+  string itself (or into a placeholder, if the string is ``*``)."""
+
   FIELD_DATATYPE = TAG_DATATYPE + POSFIELD_DATATYPE
   """The names of all datatypes for positional fields and tags."""
 
@@ -1,8 +1,9 @@
 import gfapy
+import sys
 import re
 
 def unsafe_decode(string):
-  return string.split(" ")
+  return [sys.intern(s) for s in string.split(" ")]
 
 def decode(string):
   validate_encoded(string)
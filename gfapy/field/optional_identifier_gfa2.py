@@ -1,18 +1,19 @@
 import gfapy
+import sys
 import re
 
 def unsafe_decode(string):
   if string == "*":
     return gfapy.Placeholder()
   else:
-    return string
+    return sys.intern(string)
 
 def decode(string):
   if string == "*":
     return gfapy.Placeholder()
   else:
     validate_encoded(string)
-    return string
+    return sys.intern(string)
 
 def validate_encoded(string):
   if not re.match("^[!-~]+$", string):
@@ -1,8 +1,9 @@
 import gfapy
+import sys
 import re
 
 def unsafe_decode(string):
-  return gfapy.OrientedLine(string[:-1], string[-1])
+  return gfapy.OrientedLine(sys.intern(string[:-1]), string[-1])
 
 def decode(string):
   obj = unsafe_decode(string)
@@ -1,8 +1,9 @@
 import gfapy
+import sys
 import re
 
 def unsafe_decode(string):
-  return [ gfapy.OrientedLine(str(l[0:-1]), str(l[-1]))
+  return [ gfapy.OrientedLine(sys.intern(l[0:-1]), l[-1])
            for l in string.split(",")]
 
 def decode(string):
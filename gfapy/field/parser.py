@@ -3,6 +3,22 @@ Decoding of the GFA string representations into python objects
 """
 import gfapy
 import re
+import string as _string
+
+_TAGNAME_CHAR1 = frozenset(_string.ascii_letters)
+_TAGNAME_CHAR2 = frozenset(_string.ascii_letters + _string.digits)
+_TAG_DATATYPES = frozenset("AifZJHB")
+_TAG_RE = re.compile(r"^([A-Za-z][A-Za-z0-9]):([AifZJHB]):(.+)$")
+
+def _is_simple_tag(tag):
+  """Can the tag be split at the fixed positions of the separators?
+
+  This is the case for the valid tags, whose content contains no newlines;
+  the other strings are left to _TAG_RE.
+  """
+  return len(tag) > 5 and tag[2] == ":" and tag[4] == ":" and \
+      tag[0] in _TAGNAME_CHAR1 and tag[1] in _TAGNAME_CHAR2 and \
+      tag[3] in _TAG_DATATYPES and "\n" not in tag
 
 class Parser:
 
@@ -103,9 +119,41 @@ class Parser:
     list of (str, gfapy.Field.FIELD_DATATYPE)
       the parsed content of the field
     """
-    match = re.match(r"^([A-Za-z][A-Za-z0-9]):([AifZJHB]):(.+)$", tag)
+    if _is_simple_tag(tag):
+      return [tag[:2], tag[3], tag[5:]]
+    # rare cases (e.g. newlines in the content) are left to the regex
+    match = _TAG_RE.match(tag)
     if match:
       return [match.group(1), match.group(2), match.group(3)]
     else:
       raise gfapy.FormatError(
         "Expected GFA tag, found: {}".format(repr(tag)))
+
+  @staticmethod
+  def _parse_gfa_tags(tags):
+    """
+    Parses a list of GFA tags in the form **xx:d:content** into their
+    components (see :func:`_parse_gfa_tag`).
+
+    Parameters
+    ----------
+    tags : list of str
+      the GFA tags to parse
+
+    Raises
+    ------
+    gfapy.FormatError
+      if any of the strings does not represent a valid GFA tag
+
+    Returns
+    -------
+    list of list of (str, gfapy.Field.FIELD_DATATYPE, str)
+      the parsed content of the fields
+    """
+    retval = []
+    for tag in tags:
+      if _is_simple_tag(tag):
+        retval.append([tag[:2], tag[3], tag[5:]])
+      else:
+        retval.append(Parser._parse_gfa_tag(tag))
+    return retval
@@ -1,12 +1,13 @@
 import gfapy
+import sys
 import re
 
 def unsafe_decode(string):
-  return string
+  return sys.intern(string)
 
 def decode(string):
   validate_encoded(string)
-  return string
+  return sys.intern(string)
 
 def validate_encoded(string):
   if not re.match("^[!-)+-<>-~][!-~]*$", string):
@@ -35,4 +36,4 @@ def unsafe_encode(obj):
 def encode(obj):
   string = unsafe_encode(obj)
   validate_encoded(string)
-  return string
+  return sys.intern(string)
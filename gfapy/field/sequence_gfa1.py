@@ -19,6 +19,8 @@ def validate_encoded(string):
       "(it is not * and does not match the regular expression [A-Za-z=.]+")
 
 def validate_decoded(obj):
+  if isinstance(obj, (gfapy.SequenceHandle, gfapy.PackedSequence)):
+    obj = str(obj)
   if isinstance(obj, gfapy.Placeholder):
     pass
   elif isinstance(obj, str):
@@ -27,12 +29,15 @@ def validate_decoded(obj):
     raise gfapy.TypeError(
       "the class {} is incompatible with the datatype\n"
       .format(obj.__class__.__name__)+
-      "(accepted classes: str, gfapy.Placeholder)")
+      "(accepted classes: str, gfapy.Placeholder, gfapy.SequenceHandle, "+
+      "gfapy.PackedSequence)")
 
 def unsafe_encode(obj):
   return str(obj)
 
 def encode(obj):
+  if isinstance(obj, (gfapy.SequenceHandle, gfapy.PackedSequence)):
+    obj = str(obj)
   if isinstance(obj, gfapy.Placeholder):
     return str(obj)
   elif isinstance(obj, str):
@@ -42,4 +47,5 @@ def encode(obj):
     raise gfapy.TypeError(
       "the class {} is incompatible with the datatype\n"
       .format(obj.__class__.__name__)+
-      "(accepted classes: str, gfapy.Placeholder)")
+      "(accepted classes: str, gfapy.Placeholder, gfapy.SequenceHandle, "+
+      "gfapy.PackedSequence)")
@@ -3,10 +3,12 @@ from .lines import Lines
 from .graph_operations import GraphOperations
 from collections import defaultdict
 from .rgfa import RGFA
+from copy import deepcopy
 import sys
+import os
+import itertools
 
 from gzip import open as gzopen
-from gzip import BadGzipFile
 
 class Gfa(Lines,GraphOperations,RGFA):
   """Representation of the data in a GFA file.
@@ -20,6 +22,9 @@ class Gfa(Lines,GraphOperations,RGFA):
         default: automatic recognition)
     dialect (str): dialect ('standard' or 'rgfa';
         default: standard)
+    lazy (bool): if True, the lines added as strings are constructed
+        as lazy lines, i.e. their fields are decoded on first access
+        (see `~gfapy.line.line.Line`); default: False
 
   Raises:
     ~gfapy.error.ArgumentError: if the vlevel or version are invalid
@@ -29,7 +34,8 @@ class Gfa(Lines,GraphOperations,RGFA):
     ~gfapy.error.VersionError: if an unknown dialect is specified
   """
 
-  def __init__(self, *args, vlevel = 1, version = None, dialect = "standard"):
+  def __init__(self, *args, vlevel = 1, version = None, dialect = "standard",
+               lazy = False):
     if not isinstance(vlevel, int):
       raise gfapy.ArgumentError("vlevel is not an integer ({})".format(vlevel))
     if vlevel < 0:
@@ -40,7 +46,12 @@ class Gfa(Lines,GraphOperations,RGFA):
     if not dialect in ['standard', 'rgfa', None]:
       raise gfapy.VersionError("GFA dialect unknown ({})".format(dialect))
     self._vlevel = vlevel
+    self._lazy = lazy
     self._max_int_name = 0
+    self._segment_table = None
+    self._link_index = {}
+    self._gfa2_dovetails = {}
+    self._gfa2_containments = {}
     self._records = defaultdict(dict)
     self._records["H"] = gfapy.line.Header(["H"], vlevel = vlevel)
     self._records["H"].connect(self)
@@ -83,7 +94,7 @@ class Gfa(Lines,GraphOperations,RGFA):
           self.add_line(line)
       self.process_line_queue()
       if vlevel >= 1:
-        self.validate()
+        self.__validate_references()
     elif len(args) > 1:
       raise gfapy.ArgumentError("Wrong number of arguments for Gfa()"+
           "({})".format(len(args)))
@@ -118,8 +129,19 @@ class Gfa(Lines,GraphOperations,RGFA):
   def validate(self):
     """Validate the GFA instance
 
-    Checks if all references are solved correctly.
+    Checks if all references are solved correctly. For instances with
+    lazy lines, also the record-type specific checks of the lines (e.g.
+    the consistency of the LN tag and the sequence length of segments) are
+    performed, as they are not done when lazy lines are constructed.
+    These checks require decoding all lines, thus they are not done by the
+    validation performed automatically after constructing the instance or
+    reading a file.
     """
+    if self._lazy:
+      self.__validate_lazy_lines()
+    self.__validate_references()
+
+  def __validate_references(self):
     self.__validate_segment_references()
     self.__validate_path_links()
     self.__validate_group_items()
@@ -127,6 +149,42 @@ class Gfa(Lines,GraphOperations,RGFA):
     if self._dialect == "rgfa":
       self.validate_rgfa()
 
+  def pack_sequences(self):
+    """Store the sequences of the segments in packed form.
+
+    The sequences are replaced by `~gfapy.packed_sequence.PackedSequence`
+    instances, which use 2 bits for each A, C, G or T base. Placeholders and
+    sequences loaded on demand are left as they are.
+    """
+    for segment in self.iter_segments():
+      sequence = segment._data.get("sequence")
+      if isinstance(sequence, str) and not gfapy.is_placeholder(sequence):
+        segment._data["sequence"] = gfapy.PackedSequence(sequence)
+
+  @property
+  def segment_table(self):
+    """Columnar representation of the segments.
+
+    The table is constructed on the first access and then kept in sync with
+    the instance, until drop_segment_table() is called. Thus accessing it
+    makes all later changes of the segments and edges more expensive.
+
+    The graph operations which need the table (e.g. connected_components()
+    or is_cut_link()) use it, if it is maintained; otherwise they construct
+    a temporary table, which is dropped when they return. Accessing the table
+    before a series of such calls avoids constructing it for each of them.
+
+    Returns:
+      gfapy.SegmentTable
+    """
+    if self._segment_table is None:
+      self._segment_table = gfapy.SegmentTable(self)
+    return self._segment_table
+
+  def drop_segment_table(self):
+    """Stop maintaining the segment table."""
+    self._segment_table = None
+
   def __str__(self):
     return "\n".join([str(line) for line in self.lines])
 
@@ -190,55 +248,211 @@ class Gfa(Lines,GraphOperations,RGFA):
         gfa2.add_line(line.to_gfa2(raise_on_failure=False))
       return gfa2
 
-  # TODO: implement clone (see how clone for lines was implemented)
+  def clone(self):
+    """Copy of the Gfa instance.
+
+    Differently from copying each line using Line.clone(), the lines are
+    not converted to strings; the references of the copies are set in a
+    single pass over the lines. Virtual lines are not copied, but created
+    again, if necessary.
+
+    Returns:
+      gfapy.Gfa
+    """
+    gfa = self.__class__(vlevel = self._vlevel, version = self._version,
+                         dialect = self._dialect, lazy = self._lazy)
+    gfa._default = self._default.copy()
+    copies = {}
+    for record_type, lines in self._lines_by_record_type():
+      for line in lines:
+        self._copy_line(line, gfa, copies)
+    return gfa
+
+  RECORD_TYPES_ORDER = ["H", "#", "S", "L", "C", "E", "F", "G", "P", "O", "U"]
+  """Record types in an order where lines are preceded by the lines they
+  refer to (except groups, which can refer to other groups)."""
+
+  def _lines_by_record_type(self):
+    """Non-virtual lines, grouped by record type, in RECORD_TYPES_ORDER.
+
+    Custom records follow the predefined record types.
 
-  def read_file(self, filename, gzipped="auto"):
+    Returns:
+      generator of (str, list of gfapy.Line)
+    """
+    yield "H", [self.header]
+    for record_type in self.RECORD_TYPES_ORDER[1:] + self.custom_record_keys:
+      records = self._records.get(record_type, {})
+      if record_type == "F":
+        lines = [l for fragments in records.values() \
+                   for l in fragments.values()]
+      else:
+        lines = list(records.values())
+      lines = [l for l in lines if not l.virtual]
+      if lines:
+        yield record_type, lines
+
+  def _copy_line(self, line, gfa, copies):
+    """Copy a line and add the copy to another Gfa instance.
+
+    References to lines which were already copied (the copies dict maps
+    the id of the lines to their copies) are set to the copies; other
+    references are set to the names of the lines and resolved when the copy
+    is added to the instance.
+    """
+    data = {k: self._copy_value(v, copies) for k, v in line._data.items()}
+    cpy = line.__class__(data, vlevel = line.vlevel, version = line.version,
+                         dialect = line.dialect)
+    if line._datatype:
+      cpy._datatype = line._datatype.copy()
+    cpy._raw = line._raw
+    cpy._decoded = line._decoded
+    if isinstance(line, gfapy.line.CustomRecord):
+      cpy._positional_fieldnames = list(line._positional_fieldnames)
+    gfa._add_unique_line(cpy)
+    copies[id(line)] = cpy
+    return cpy
+
+  @staticmethod
+  def _copy_value(value, copies):
+    if isinstance(value, (str, int, float, gfapy.Placeholder, gfapy.LastPos,
+                          gfapy.SequenceHandle, gfapy.PackedSequence)):
+      return value
+    elif isinstance(value, gfapy.Line):
+      cpy = copies.get(id(value))
+      return value.name if cpy is None else cpy
+    elif isinstance(value, gfapy.OrientedLine):
+      return gfapy.OrientedLine(Gfa._copy_value(value.line, copies),
+                                value.orient)
+    elif type(value) is list:
+      return [Gfa._copy_value(v, copies) for v in value]
+    elif isinstance(value, gfapy.FieldArray):
+      return gfapy.FieldArray(value.datatype,
+                              [Gfa._copy_value(v, copies) for v in value])
+    else:
+      return deepcopy(value)
+
+  def read_file(self, filename, gzipped="auto", deferred_references=False,
+                workers=None, threads=1, record_types=None, drop_tags=None,
+                load_sequences=True, sequence_cache_size=None):
     """Read GFA data from a file and load it into the Gfa instance.
     By default, tries to automatically determine if the file is gzipped or uncompressed.
     This can be overridden by setting gzipped to `True` or `False`, forcing the file to be treated as compressed resp. uncompressed.
 
+    If deferred_references is set, all lines of the file are read
+    first and then added using add_lines(), i.e. sorted by record type,
+    so that referenced lines are added before the lines referencing them;
+    this avoids the creation of virtual lines, which is slow when the lines
+    of the file are not sorted (e.g. links before segments).
+
+    If workers is set to a number greater than 1, the lines of an
+    uncompressed file are parsed in parallel by the given number of
+    processes, and then added using add_lines(), as if deferred_references
+    was set. Gzipped files are always read by a single process.
+
+    If progress logging is enabled, the progress of reading the file is
+    logged in bytes. When deferred_references is set, the progress of
+    adding the lines is then logged separately, in lines. When parsing
+    in parallel, only the progress of adding the lines is logged.
+
+    Files compressed in the BGZF format (e.g. using bgzip) are decompressed
+    by the given number of threads.
+
+    The content to load can be restricted, before the lines are parsed:
+    if record_types is set, only lines of the given record types (and the
+    header) are loaded; tags in drop_tags are removed from all lines;
+    if load_sequences is False, the sequences of segments are replaced by
+    placeholders (and the sequence length is stored in the LN tag of GFA1
+    segments). Note that, if a record type is skipped, lines of other types
+    referring to it are unresolved.
+
+    If load_sequences is 'on_demand', the sequences of segments are
+    replaced by handles (see `~gfapy.sequence_store.SequenceHandle`), and
+    only read when accessed, with a cache of the given size (in bytes).
+    For uncompressed files, the sequences are read from the file itself
+    (which shall not be modified afterwards), otherwise they are copied
+    to a temporary file.
+
     Parameters:
       filename: str
       gzipped: "auto" (default)/True/False
+      deferred_references: bool (default: False)
+      workers: int (default: None, i.e. no parallel parsing)
+      threads: int (default: 1)
+      record_types: set of str (default: None, i.e. all)
+      drop_tags: set of str (default: None)
+      load_sequences: True (default)/False/"on_demand"
+      sequence_cache_size: int (default: None, i.e.
+        SequenceStore.DEFAULT_CACHE_SIZE)
     """
-    ## determine if the file is gzipped
-    # I'm not aware of a prettier way to robustly do this in python, unfortunately
     if gzipped == "auto":
-        with gzopen(filename, 'rb') as fin:
-            try:
-                fin.read(1)
-                gzipped = True
-            except BadGzipFile:
-                gzipped = False
-
-    # prepare appropriate opening call
-    openfn = lambda f: gzopen(f, "rt") if gzipped else open(f, "rt")
-
-    if self._progress:
-      linecount = 0
-      with openfn(filename) as f:
-        for _ in f:
-          linecount += 1
-      # TODO: better implementation of linecount
-      self._progress_log_init("read_file", "lines", linecount,
-                              "Parsing file {}".format(filename)+
-                              " containing {} lines".format(linecount))
-    with openfn(filename) as f:
-      for line in f:
-        self.add_line(line.rstrip('\r\n'))
+      gzipped = gfapy.reader._is_gzipped(filename)
+    projection = gfapy.reader._projection(record_types, drop_tags,
+                                          load_sequences)
+    sequence_store = None
+    if load_sequences == "on_demand":
+      if sequence_cache_size is None:
+        sequence_cache_size = gfapy.SequenceStore.DEFAULT_CACHE_SIZE
+      sequence_store = gfapy.SequenceStore(None if gzipped else filename,
+                                           cache_size = sequence_cache_size)
+
+    if workers is not None and workers > 1 and not gzipped:
+      lines = []
+      for chunk in gfapy.reader._iter_chunks_parallel(filename, workers,
+          version = self._version, vlevel = self._vlevel,
+          dialect = self._dialect, lazy = self._lazy,
+          record_types = record_types, drop_tags = drop_tags,
+          load_sequences = load_sequences, sequence_store = sequence_store):
+        lines.extend(chunk)
+      self.add_lines(lines)
+    elif sequence_store is None and not self._progress:
+      # the offsets of the lines are not needed
+      lines = gfapy.reader._iter_lines(filename, gzipped, threads, projection)
+      if deferred_references:
+        self.add_lines(list(lines))
+      else:
+        for line in lines:
+          self.add_line(line)
+    else:
+      lines = gfapy.reader._iter_lines_and_offsets(filename, gzipped, threads,
+                                                   projection)
+      if sequence_store is not None:
+        lines = gfapy.reader._with_sequence_handles(lines, sequence_store,
+            in_place = not gzipped, vlevel = self._vlevel,
+            dialect = self._dialect, lazy = self._lazy)
+      if self._progress:
+        filesize = os.path.getsize(filename)
+        self._progress_log_init("read_file", "bytes", filesize,
+                                "Parsing file {}".format(filename)+
+                                " of size {} bytes".format(filesize))
+      deferred_lines = []
+      nbytes = 0
+      for line, _, offset in lines:
+        if deferred_references:
+          deferred_lines.append(line)
+        else:
+          self.add_line(line)
         if self._progress:
-          self._progress_log("read_file")
+          self._progress_log("read_file", offset - nbytes)
+          nbytes = offset
+      if deferred_references:
+        # add_lines() logs its progress separately, in lines
+        self._progress_log_end("read_file")
+        self.add_lines(deferred_lines)
     if self._line_queue:
       self._version = self._version_guess
       self.process_line_queue()
     if self._progress:
       self._progress_log_end("read_file")
     if self._vlevel >= 1:
-      self.validate()
+      self.__validate_references()
     return self
 
   @classmethod
-  def from_file(cls, filename, vlevel = 1, version = None, dialect="standard"):
+  def from_file(cls, filename, vlevel = 1, version = None, dialect="standard",
+                deferred_references = False, lazy = False, workers = None,
+                threads = 1, record_types = None, drop_tags = None,
+                load_sequences = True, sequence_cache_size = None):
     """Create a Gfa instance from the contents of a GFA file.
 
     Parameters:
@@ -246,14 +460,59 @@ class Gfa(Lines,GraphOperations,RGFA):
       vlevel (int) : the validation level
       version (str) : the GFA version ('gfa1' or 'gfa2'; default:
           determine version automatically)
+      deferred_references (bool) : see read_file()
+      lazy (bool) : construct lazy lines, whose fields are decoded
+          on first access (default: False)
+      workers (int) : number of processes for parsing the file;
+          see read_file()
+      threads (int) : number of threads for decompressing BGZF files
+      record_types (set of str), drop_tags (set of str),
+          load_sequences (bool or "on_demand"),
+          sequence_cache_size (int) : select the content to load;
+          see read_file()
 
     Returns:
       gfapy.Gfa
     """
-    gfa = cls(vlevel = vlevel, version = version, dialect = dialect)
-    gfa.read_file(filename)
+    gfa = cls(vlevel = vlevel, version = version, dialect = dialect,
+              lazy = lazy)
+    gfa.read_file(filename, deferred_references = deferred_references,
+                  workers = workers, threads = threads,
+                  record_types = record_types, drop_tags = drop_tags,
+                  load_sequences = load_sequences,
+                  sequence_cache_size = sequence_cache_size)
     return gfa
 
+  def save_snapshot(self, filename):
+    """Save the content of the instance to a binary snapshot file.
+
+    The snapshot can be loaded using `load_snapshot`, which is faster
+    than reading a GFA file, as the lines are not parsed and validated
+    again (see the `~gfapy.snapshot` module for the format).
+
+    Parameters:
+      filename (str)
+    """
+    gfapy.snapshot.save(self, filename)
+
+  @classmethod
+  def load_snapshot(cls, filename, vlevel = 1):
+    """Create a Gfa instance from a snapshot file saved by `save_snapshot`.
+
+    Parameters:
+      filename (str)
+      vlevel (int) : the validation level of the instance; the content of
+        the snapshot is not validated, as it was valid when the snapshot
+        was saved
+
+    Returns:
+      gfapy.Gfa
+
+    Raises:
+      ~gfapy.error.FormatError: if the file is not a snapshot
+    """
+    return gfapy.snapshot.load(filename, vlevel = vlevel, gfa_class = cls)
+
   def to_file(self, filename, gzipped="auto"):
     """Write the content of the instance to a GFA file
     By default, uses the filename ending to determine if the file should be gz-compressed or not.
@@ -278,7 +537,7 @@ class Gfa(Lines,GraphOperations,RGFA):
     self.lines == other.lines
 
   def __lenstats(self):
-    sln = [ s.try_length for s in self.segments ]
+    sln = [ s.try_length for s in self.iter_segments() ]
     sln = sorted(sln)
     n = len(sln)
     tlen = 0
@@ -295,8 +554,12 @@ class Gfa(Lines,GraphOperations,RGFA):
     q = (sln[0], sln[(n//4)-2], sln[(n//2)-1], sln[((n*3)//4)-1], sln[-1])
     return (q, n50, tlen)
 
+  def __validate_lazy_lines(self):
+    for line in self.lines:
+      line._validate_record_type_specific_info()
+
   def __validate_segment_references(self):
-    for s in self.segments:
+    for s in self.iter_segments():
       if s.virtual:
         raise gfapy.NotFoundError("Segment {} ".format(s.name)+
             "does not exist\nReferences to {} ".format(s.name)+
@@ -328,7 +591,7 @@ class Gfa(Lines,GraphOperations,RGFA):
   def __validate_gfa2_positions(self):
     if self.version == "gfa1":
       return
-    for line in self.edges + self.fragments:
+    for line in itertools.chain(self.iter_edges(), self.iter_fragments()):
       line.validate_positions()
 
   def _validate_version(self):
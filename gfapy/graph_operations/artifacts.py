@@ -1,5 +1,8 @@
+from gfapy.segment_table import with_segment_table
+
 class Artifacts:
 
+  @with_segment_table
   def remove_small_components(self, minlen):
     """Remove connected components with combined segment length < minlen.
 
@@ -10,11 +13,12 @@ class Artifacts:
     Parameters:
       minlen (int) : the minimal length of the components to keep.
     """
-    for cc in filter(lambda c: sum([self.segment(sn).length for sn in c]) \
-                     < minlen, self.connected_components()):
-      for s in cc:
-        self.rm(s)
+    table = self.segment_table
+    labels, sizes, lengths = self._label_connected_components()
+    self.rm_many([table.segment(i) for i in table.segment_ids \
+                  if lengths[labels[i]] < minlen])
 
+  @with_segment_table
   def remove_dead_ends(self, minlen):
     """Remove dead end segments from the graph.
 
@@ -29,9 +33,10 @@ class Artifacts:
     Parameters:
       minlen (int) : the minimal length of an end to keep.
     """
-    for s in self.segments:
-      c = s._connectivity()
-      if s.length < minlen and \
-        (c[0]==0 or c[1]==0) and \
-          not self.is_cut_segment(s):
-        self.rm(s)
+    table = self.segment_table
+    for i in table.segment_ids:
+      if 0 <= table.length[i] < minlen and \
+        (table.degree_L[i] == 0 or table.degree_R[i] == 0):
+        s = table.segment(i)
+        if not self.is_cut_segment(s):
+          self.rm(s)
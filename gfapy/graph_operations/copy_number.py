@@ -1,3 +1,6 @@
+from math import isnan
+from gfapy.segment_table import with_segment_table
+
 class CopyNumber:
 
   def set_default_count_tag(self, tag):
@@ -8,6 +11,7 @@ class CopyNumber:
     """Set the unit length to be used by default for the coverage computation"""
     self._default["unit_length"] = unit_length
 
+  @with_segment_table
   def delete_low_coverage_segments(self, mincov, count_tag=None,
                                    unit_length=None):
     """Remove the segments whose coverage is smaller than a specified value.
@@ -16,16 +20,26 @@ class CopyNumber:
       mincov (int) : the minimal coverage to keep a segment
       count_tag (str) : the name of the tag to use for coverage computation
       unit_length (int) : the unit length to use for coverage computation
+
+    Raises:
+      ~gfapy.error.NotFoundError: if the count tag or the length of a segment
+        is undefined; in this case no segment is removed
     """
     if unit_length is None:
       unit_length = self._default["unit_length"]
     if count_tag is None:
       count_tag = self._default["count_tag"]
-    for s in self.segments:
-      cov = s.coverage(count_tag=count_tag, unit_length=unit_length)
-      if cov < mincov:
-        s.disconnect()
+    table = self.segment_table
+    coverage = table.coverage(count_tag=count_tag, unit_length=unit_length)
+    for i in table.segment_ids:
+      if isnan(coverage[i]):
+        # raises the exception explaining why the coverage is undefined
+        table.segment(i).try_get_coverage(count_tag=count_tag,
+                                          unit_length=unit_length)
+    self.rm_many([table.segment(i) for i, cov in enumerate(coverage) \
+                  if cov < mincov])
 
+  @with_segment_table
   def compute_copy_numbers(self, single_copy_coverage, mincov=None,
                            count_tag=None, cn_tag="cn", unit_length=None):
     """Compute the estimated copy numbers of all segments, from their coverage.
@@ -44,8 +58,14 @@ class CopyNumber:
       count_tag = self._default["count_tag"]
     if unit_length is None:
       unit_length = self._default["unit_length"]
-    for s in self.segments:
-      cov = s.try_get_coverage(count_tag=count_tag, unit_length=unit_length)
+    table = self.segment_table
+    coverage = table.coverage(count_tag=count_tag, unit_length=unit_length)
+    for i in table.segment_ids:
+      s = table.segment(i)
+      cov = coverage[i]
+      if isnan(cov):
+        # raises the exception explaining why the coverage is undefined
+        cov = s.try_get_coverage(count_tag=count_tag, unit_length=unit_length)
       if cov < mincov:
         cn = 0
       elif cov < single_copy_coverage:
@@ -54,6 +74,7 @@ class CopyNumber:
         cn = round(cov / single_copy_coverage)
       s.set(cn_tag, cn)
 
+  @with_segment_table
   def apply_copy_numbers(self, count_tag="cn", distribute="auto",
                          origin_tag="or", conserve_components=True):
     """Multiply each segment per its copy number.
@@ -1,7 +1,9 @@
 import gfapy
+from gfapy.segment_table import with_segment_table
 
 class LinearPaths:
 
+  @with_segment_table
   def linear_path(self, segment, exclude = None):
     """Find a linear path which contains the specified segment
 
@@ -9,24 +11,11 @@ class LinearPaths:
       segment (str, Line): the segment to analyse
       exclude : (API private)
     """
-    if isinstance(segment, gfapy.Line):
-      segment_name = segment.name
-    else:
-      segment_name = segment
-      segment = self.segment(segment_name)
-    cs = segment._connectivity()
     if exclude is None:
       exclude = set()
-    segpath = gfapy.SegmentEndsPath()
-    for i, et in enumerate(["L", "R"]):
-      if cs[i] == 1:
-        exclude.add(segment_name)
-        if len(segpath) > 0:
-          segpath.pop()
-        segpath += self.__traverse_linear_path(
-            gfapy.SegmentEnd(segment, et), exclude)
-    return segpath
+    return self.__linear_path(self.segment_table.segment_id(segment), exclude)
 
+  @with_segment_table
   def linear_paths(self, redundant_junctions=False):
     """Find linear paths of dovetail overlaps connecting segments.
 
@@ -35,33 +24,33 @@ class LinearPaths:
         end of each path which involves them; this mimics the construction
         of contigs in string graph assemblers Readjoiner and SGA; default: False
     """
+    if not redundant_junctions:
+      return [self.__segment_ends_path(nodes) \
+              for nodes in self.__linear_paths_nodes()]
     exclude = set()
-    if redundant_junctions:
-      junction_exclude = set()
+    junction_exclude = set()
     retval = []
-    segnames = self.segment_names
+    segment_ids = self.segment_table.segment_ids
     if self._progress:
-      self._progress_log_init("linear_paths", "segments", len(segnames),
-          "Detect linear paths ({})".format(len(segnames)))
-    for sn in segnames:
+      self._progress_log_init("linear_paths", "segments", len(segment_ids),
+          "Detect linear paths ({})".format(len(segment_ids)))
+    for segment_id in segment_ids:
       if self._progress:
         self._progress_log("linear_paths")
-      if sn in exclude:
+      if segment_id in exclude:
         continue
-      lp = self.linear_path(sn, exclude)
-      if not redundant_junctions:
-        if len(lp) > 1:
-          retval.append(lp)
+      lp = self.__segment_ends_path(
+          self.__linear_path_nodes(segment_id, exclude))
+      if lp:
+        self._extend_linear_path_to_junctions(lp)
+        retval.append(lp)
       else:
-        if lp:
-          self._extend_linear_path_to_junctions(lp)
-          retval.append(lp)
-        else:
-          retval += self._junction_junction_paths(sn, junction_exclude)
+        retval += self._junction_junction_paths(segment_id, junction_exclude)
     if self._progress:
       self._progress_log_end("linear_paths")
     return retval
 
+  @with_segment_table
   def merge_linear_path(self, segpath, redundant_junctions=False, jntag="jn",
                         enable_tracking=False, merged_name=None,
                         cut_counts=False):
@@ -74,42 +63,23 @@ class LinearPaths:
     """
     if len(segpath) < 2:
       return self
-    if segpath[0] in [True, False]:
-      first_redundant = segpath.pop(0)
-      last_redundant = segpath.pop()
-    else:
-      first_redundant = False
-      last_redundant = False
-    segpath = [gfapy.SegmentEnd(s) for s in segpath]
-    merged, first_reversed, last_reversed = \
-        self.__create_merged_segment(segpath,
-            redundant_junctions=redundant_junctions, jntag=jntag,
-            merged_name=merged_name,cut_counts=cut_counts,
-            enable_tracking=enable_tracking)
-    self.append(merged)
-    if first_redundant:
-      self._link_duplicated_first(merged, self.segment(segpath[0].segment),
-                                   first_reversed, jntag)
-    else:
-      self.__link_merged(merged.name, segpath[0].inverted(), first_reversed)
-    if last_redundant:
-      self._link_duplicated_last(merged, self.segment(segpath[-1].segment),
-                                  last_reversed, jntag)
-    else:
-      self.__link_merged(merged.name, segpath[-1], last_reversed)
-    idx1 = 1 if first_redundant else 0
-    idx2 = -1 if last_redundant else None
-    for sn_et in segpath[idx1:idx2]:
-      self.segment(sn_et.segment).disconnect()
-      if self._progress:
-        self._progress_log("merge_linear_paths", 0.05)
+    self.__merge_paths([self.__path_nodes(segpath)],
+        redundant_junctions=redundant_junctions, jntag=jntag,
+        merged_name=merged_name, cut_counts=cut_counts,
+        enable_tracking=enable_tracking)
     return self
 
+  @with_segment_table
   def merge_linear_paths(self, redundant_junctions=False, jntag="jn",
                         merged_name=None, enable_tracking=False,
                         cut_counts=False):
     """Find and merge linear paths of dovetail overlaps connecting segments.
 
+    The paths are found using the adjacency of the segment ends (see
+    `SegmentTable.adjacency`); the merged segments are computed first and
+    the graph is then modified at once: the merged segments are removed and
+    the new segments and the links to them are added.
+
     Note:
       Besides obviously the dovetail overlaps, all lines refererring to the
       merged segments (containments, internal edges, paths, sets, fragments,
@@ -138,50 +108,117 @@ class LinearPaths:
       jntag (str) : the tag to use for the temporary storage of junction
         information, if the redundant_junctions flag is set (default: jn)
     """
-    paths = self.linear_paths(redundant_junctions)
+    if redundant_junctions:
+      paths = [self.__path_nodes(path) \
+               for path in self.linear_paths(redundant_junctions)]
+    else:
+      paths = [(nodes, False, False) for nodes in self.__linear_paths_nodes()]
     if self._progress:
-      psize = sum([len(path) for path in paths])
+      psize = sum([len(path[0]) for path in paths])
       self._progress_log_init("merge_linear_paths", "segments", psize,
           "Merge {} linear paths ".format(len(paths))+
           "({} segments)".format(psize))
-    for path in paths:
-      self.merge_linear_path(path, redundant_junctions=redundant_junctions,
-                             jntag=jntag, merged_name=merged_name,
-                             cut_counts=cut_counts,
-                             enable_tracking=enable_tracking)
+    self.__merge_paths(paths, redundant_junctions=redundant_junctions,
+                       jntag=jntag, merged_name=merged_name,
+                       cut_counts=cut_counts, enable_tracking=enable_tracking)
     if self._progress:
       self._progress_log_end("merge_linear_paths")
     if redundant_junctions:
       self._remove_junctions(jntag)
     return self
 
-  def __traverse_linear_path(self, segment_end, exclude):
-    lst = gfapy.SegmentEndsPath()
-    current = gfapy.SegmentEnd(segment_end)
-    current.segment = self.segment(current.segment)
+  def __linear_paths_nodes(self):
+    """Linear paths of at least two segments, as lists of nodes.
+
+    A single sweep over the segments is done; each path is the list of
+    the nodes (see `Adjacency`) of the segment ends, from which the path
+    exits the segments.
+    """
+    exclude = set()
+    retval = []
+    segment_ids = self.segment_table.segment_ids
+    if self._progress:
+      self._progress_log_init("linear_paths", "segments", len(segment_ids),
+          "Detect linear paths ({})".format(len(segment_ids)))
+    for segment_id in segment_ids:
+      if self._progress:
+        self._progress_log("linear_paths")
+      if segment_id in exclude:
+        continue
+      nodes = self.__linear_path_nodes(segment_id, exclude)
+      if len(nodes) > 1:
+        retval.append(nodes)
+    if self._progress:
+      self._progress_log_end("linear_paths")
+    return retval
+
+  def __linear_path(self, segment_id, exclude):
+    return self.__segment_ends_path(
+        self.__linear_path_nodes(segment_id, exclude))
+
+  def __segment_ends_path(self, nodes):
+    table = self.segment_table
+    return gfapy.SegmentEndsPath([table.segment_end(n) for n in nodes])
+
+  def __path_nodes(self, segpath):
+    """Nodes of a path of segment ends and redundant junctions flags."""
+    if segpath[0] in [True, False]:
+      first_redundant = segpath[0]
+      last_redundant = segpath[-1]
+      segpath = segpath[1:-1]
+    else:
+      first_redundant = False
+      last_redundant = False
+    table = self.segment_table
+    nodes = []
+    for sn_et in segpath:
+      sn_et = gfapy.SegmentEnd(sn_et)
+      nodes.append(gfapy.Adjacency.node(table.segment_id(sn_et.segment),
+                                        sn_et.end_type))
+    return nodes, first_redundant, last_redundant
+
+  def __linear_path_nodes(self, segment_id, exclude):
+    adjacency = self.segment_table.adjacency
+    nodes = []
+    for node in [2 * segment_id, 2 * segment_id + 1]:
+      if adjacency.degree(node) == 1:
+        exclude.add(segment_id)
+        if nodes:
+          nodes.pop()
+        nodes += self.__traverse_linear_path(node, exclude)
+    return nodes
+
+  def __traverse_linear_path(self, node, exclude):
+    adjacency = self.segment_table.adjacency
+    starts = adjacency.starts
+    stops = adjacency.stops
+    targets = adjacency.targets
+    lst = []
+    current = node
     while True:
-      after = current.segment.dovetails_of_end(current.end_type)
-      before = current.segment.dovetails_of_end(gfapy.invert(current.end_type))
-      if (len(before) == 1 and len(after) == 1) or not lst:
-        lst.append(gfapy.SegmentEnd(current.name, current.end_type))
-        exclude.add(current.name)
-        current = after[0].other_end(current).inverted()
-        if current.name in exclude:
+      n_after = stops[current] - starts[current]
+      before = current ^ 1
+      n_before = stops[before] - starts[before]
+      if (n_before == 1 and n_after == 1) or not lst:
+        lst.append(current)
+        exclude.add(current >> 1)
+        current = targets[starts[current]] ^ 1
+        if (current >> 1) in exclude:
           break
-      elif len(before) == 1:
-        lst.append(gfapy.SegmentEnd(current.name, current.end_type))
-        exclude.add(current.name)
+      elif n_before == 1:
+        lst.append(current)
+        exclude.add(current >> 1)
         break
       else:
         break
-    if segment_end.end_type == "L":
-      return list(reversed(lst))
-    else:
+    if node & 1:
       return lst
+    else:
+      # reverse direction: the path is reversed and the ends are inverted
+      return [n ^ 1 for n in reversed(lst)]
 
-  def __sum_of_counts(self, segpath, multfactor = 1):
+  def __sum_of_counts(self, segs, multfactor = 1):
     retval = {}
-    segs = [self.try_get_segment(sn_et.segment) for sn_et in segpath]
     for count_tag in ["KC","RC","FC"]:
       for s in segs:
         if count_tag in s.tagnames:
@@ -214,7 +251,8 @@ class LinearPaths:
       else:
         o = segment.get("or")
     if init:
-      merged.sequence = [s]
+      merged.sequence = gfapy.Placeholder() if gfapy.is_placeholder(s) \
+                        else [s]
       if merged_name:
         merged.name = [merged_name]
       else:
@@ -225,7 +263,8 @@ class LinearPaths:
         merged.set("or",[o])
         merged.mp = mp
     else:
-      if gfapy.is_placeholder(segment.sequence):
+      if gfapy.is_placeholder(segment.sequence) or \
+          gfapy.is_placeholder(merged.sequence):
         merged.sequence = gfapy.Placeholder()
       else:
         merged.sequence.append(s)
@@ -281,29 +320,94 @@ class LinearPaths:
     else:
       return [lastpos-pos+1 for pos in pos_array].reverse()
 
-  def __create_merged_segment(self, segpath, redundant_junctions=False,
+  def __merge_paths(self, paths, redundant_junctions=False, jntag="jn",
+                    merged_name=None, enable_tracking=False, cut_counts=False):
+    """Merge paths given as (nodes, first_redundant, last_redundant).
+
+    All merged segments and the clones of the dovetail overlaps of the
+    first and last segment end of each path are computed first, so that
+    the graph is left unchanged if any path cannot be merged. An overlap
+    connecting two paths is cloned only once, with both ends renamed. Then
+    the merged segments are removed and the new lines are added.
+    """
+    table = self.segment_table
+    adjacency = table.adjacency
+    merged_lines = []
+    renamed = {}
+    to_remove = []
+    for nodes, first_redundant, last_redundant in paths:
+      merged, first_reversed, last_reversed = \
+          self.__create_merged_segment(nodes,
+              redundant_junctions=redundant_junctions, jntag=jntag,
+              merged_name=merged_name, cut_counts=cut_counts,
+              enable_tracking=enable_tracking)
+      merged_lines.append(merged)
+      if not first_redundant:
+        renamed[nodes[0] ^ 1] = (merged.name, first_reversed)
+      if not last_redundant:
+        renamed[nodes[-1]] = (merged.name, last_reversed)
+      idx1 = 1 if first_redundant else 0
+      idx2 = -1 if last_redundant else None
+      to_remove += [n >> 1 for n in nodes[idx1:idx2]]
+    removed = set(to_remove)
+    end_links = {}
+    for node in renamed:
+      for i in range(adjacency.starts[node], adjacency.stops[node]):
+        end_links.setdefault(id(adjacency.edges[i]), adjacency.edges[i])
+    new_links = []
+    for l in end_links.values():
+      l2 = self.__link_merged(l, renamed, removed)
+      if l2 is not None:
+        new_links.append(l2)
+    self.rm_many(list(end_links.values()) +
+                 [table.segment(i) for i in to_remove])
+    if self._progress:
+      self._progress_log("merge_linear_paths", 0.05 * len(to_remove))
+    for merged in merged_lines:
+      self.add_line(merged)
+    for merged, (nodes, first_redundant, last_redundant) in \
+        zip(merged_lines, paths):
+      if first_redundant:
+        self._link_duplicated_first(merged,
+            self.segment(table.segment_end(nodes[0]).segment),
+            not nodes[0] & 1, jntag)
+      if last_redundant:
+        self._link_duplicated_last(merged,
+            self.segment(table.segment_end(nodes[-1]).segment),
+            not nodes[-1] & 1, jntag)
+    for l in new_links:
+      self.add_line(l)
+
+  def __create_merged_segment(self, nodes, redundant_junctions=False,
       jntag="jn", merged_name=None, enable_tracking=False, cut_counts=False):
-    merged = self.try_get_segment(segpath[0].segment).clone()
+    table = self.segment_table
+    adjacency = table.adjacency
+    segments = [table.segment(n >> 1) for n in nodes]
+    merged = segments[0].clone()
     merged.set(jntag, None)
     merged_vlevel = merged.vlevel
     merged.vlevel = 0
     total_cut = 0
-    a = segpath[0]
-    first_reversed = (a.end_type == "L")
+    a = nodes[0]
+    first_reversed = not a & 1
     last_reversed = None
     if merged_name == "short":
       merged_name = self.unused_name()
-    self._add_segment_to_merged(merged, self.segment(a.segment),
+    self._add_segment_to_merged(merged, segments[0],
         first_reversed, 0, True, enable_tracking=enable_tracking,
         merged_name=merged_name)
     if self._progress:
       self._progress_log("merge_linear_paths", 0.95)
-    for i in range(len(segpath)-1):
-      b = gfapy.SegmentEnd(segpath[i+1]).inverted()
-      ls = self.segment(a.segment).end_relations(a.end_type, b, "dovetails")
+    for i in range(1, len(nodes)):
+      b = nodes[i] ^ 1
+      ls = [adjacency.edges[j] for j in \
+            range(adjacency.starts[a], adjacency.stops[a]) \
+            if adjacency.targets[j] == b]
       if len(ls) != 1:
-        msg = "A single link was expected between {}".format(a) + \
-              "and {}".format(b) + "{} were found".format(len(ls))
+        msg = "A single link was expected between {} ".format(
+              table.segment_end(a)) + \
+              "and {}, ".format(table.segment_end(b)) + \
+              "{} were found".format(len(ls))
         raise gfapy.ValueError(msg)
       l = ls[0]
       if not l.overlap:
@@ -314,11 +418,11 @@ class LinearPaths:
         raise gfapy.ValueError(
             "Merging is only allowed if all operations are M/=")
       total_cut += cut
-      last_reversed = (b.end_type == "R")
-      self._add_segment_to_merged(merged, self.segment(b.segment),
+      last_reversed = bool(b & 1)
+      self._add_segment_to_merged(merged, segments[i],
           last_reversed, cut, False, enable_tracking=enable_tracking,
           merged_name=merged_name)
-      a = gfapy.SegmentEnd(b).inverted()
+      a = nodes[i]
       if self._progress:
         self._progress_log("merge_linear_paths", 0.95)
     merged.vlevel = merged_vlevel
@@ -344,28 +448,47 @@ class LinearPaths:
       factor = 1
       if cut_counts:
         factor = merged.length / (total_cut+merged.length)
-      for count_tag,count in self.__sum_of_counts(segpath,factor).items():
+      for count_tag,count in self.__sum_of_counts(segments,factor).items():
         merged.set(count_tag, count)
     return merged, first_reversed, last_reversed
 
-  def __link_merged(self, merged_name, segment_end, is_reversed):
-    to_disconnect = self.segment(segment_end.segment).dovetails_of_end(
-                                                 segment_end.end_type)
-    to_add = []
-    for l in to_disconnect:
-      l2 = l.clone()
-      if l2.to_segment == segment_end.segment:
-        l2.to_segment = merged_name
-        if is_reversed:
-          l2.to_orient = gfapy.invert(l2.to_orient)
-      else:
-        l2.from_segment = merged_name
-        if is_reversed:
-          l2.from_orient = gfapy.invert(l2.from_orient)
-      to_add.append(l2)
-    for l in to_disconnect:
-      l.disconnect()
-    for l in to_add:
-      self.add_line(l)
+  def __link_merged(self, link, renamed, removed):
+    """Clone of an edge, where the merged segment ends are renamed.
 
+    Parameters:
+      link (Line) : the edge
+      renamed (dict) : for the nodes of the segment ends to rename, the
+        name of the merged segment and a flag, whether it is reversed
+      removed (set) : IDs of the segments which are removed
 
+    Returns:
+      Line or None : None, if the edge connects to a removed segment end,
+        which is not renamed
+    """
+    table = self.segment_table
+    l2 = link.clone()
+    if l2.record_type == "E":
+      # the roles of sid1 and sid2 depend on the orientations, thus
+      # they are determined before changing any of them
+      fields = ["sid1", "sid2"] if l2._is_sid1_from() else ["sid2", "sid1"]
+    else:
+      fields = [None, None]
+    for segment_end, field, attrs in \
+        [(link.from_end, fields[0], ("from_segment", "from_orient")),
+         (link.to_end, fields[1], ("to_segment", "to_orient"))]:
+      segment_id = table.segment_id(segment_end.segment)
+      node = gfapy.Adjacency.node(segment_id, segment_end.end_type)
+      if node in renamed:
+        merged_name, is_reversed = renamed[node]
+        if field is not None:
+          oriented_segment = l2.get(field)
+          oriented_segment.line = merged_name
+          if is_reversed:
+            oriented_segment.orient = gfapy.invert(oriented_segment.orient)
+        else:
+          setattr(l2, attrs[0], merged_name)
+          if is_reversed:
+            setattr(l2, attrs[1], gfapy.invert(getattr(l2, attrs[1])))
+      elif segment_id in removed:
+        return None
+    return l2
@@ -51,7 +51,7 @@ class Multiplication:
       raise gfapy.ArgumentError("Mulitiplication factor must be >= 0"+
           " ({} found)".format(factor))
     elif factor == 0:
-      if conserve_components and factor == 1 and self.is_cut_segment(segment):
+      if conserve_components and self.is_cut_segment(segment):
         return self
       else:
         self.rm(segment)
@@ -2,32 +2,43 @@ import gfapy
 
 class RedundantLinearPaths:
 
-  def _junction_junction_paths(self, sn, exclude):
+  def _junction_junction_paths(self, segment_id, exclude):
+    table = self.segment_table
+    adjacency = table.adjacency
     retval = []
-    exclude.add(sn)
-    s = self.segment(sn)
-    for dL in s.dovetails_L:
-      eL = dL.other_end(gfapy.SegmentEnd(s, "L"))
-      if (eL.name in exclude) or (len(eL.segment.dovetails_of_end(eL.end_type)) == 1):
-        retval.append([True, eL, gfapy.SegmentEnd(s, "R"), True])
-    for dR in s.dovetails_R:
-      eR = dR.other_end(gfapy.SegmentEnd(s, "R"))
-      if (eR.name in exclude) or (len(eR.segment.dovetails_of_end(eR.end_type)) == 1):
-        retval.append([True, gfapy.SegmentEnd(s, "R"), eR.inverted(), True])
+    exclude.add(segment_id)
+    node_L = 2 * segment_id
+    node_R = node_L + 1
+    for target in adjacency.neighbours(node_L):
+      if (target >> 1) not in exclude and adjacency.degree(target) > 1:
+        retval.append([True, table.segment_end(target),
+                       table.segment_end(node_R), True])
+    for target in adjacency.neighbours(node_R):
+      if (target >> 1) not in exclude and adjacency.degree(target) > 1:
+        retval.append([True, table.segment_end(node_R),
+                       table.segment_end(target ^ 1), True])
     return retval
 
   def _extend_linear_path_to_junctions(self, segpath):
-    segfirst = self.segment(segpath[0].segment)
-    segfirst_d = segfirst.dovetails_of_end(gfapy.invert(segpath[0].end_type))
-    redundant_first = (len(segfirst_d) > 0)
-    if len(segfirst_d) == 1:
-      segpath.insert(0, segfirst_d[0].other_end(segpath[0].inverted()))
+    table = self.segment_table
+    adjacency = table.adjacency
+    first = adjacency.node(table.segment_id(segpath[0].segment),
+                           segpath[0].end_type) ^ 1
+    last = adjacency.node(table.segment_id(segpath[-1].segment),
+                          segpath[-1].end_type)
+    if adjacency.degree(first) == 1 and \
+        adjacency.neighbours(first)[0] == last:
+      # circular path: its ends are connected to each other, not to junctions
+      segpath.insert(0, False)
+      segpath.append(False)
+      return
+    redundant_first = (adjacency.degree(first) > 0)
+    if adjacency.degree(first) == 1:
+      segpath.insert(0, table.segment_end(adjacency.neighbours(first)[0]))
     segpath.insert(0, redundant_first)
-    seglast = self.segment(segpath[-1].segment)
-    seglast_d = seglast.dovetails_of_end(segpath[-1].end_type)
-    redundant_last = (len(seglast_d) > 0)
-    if len(seglast_d) == 1:
-      segpath.append(seglast_d[0].other_end(segpath[-1].inverted()))
+    redundant_last = (adjacency.degree(last) > 0)
+    if adjacency.degree(last) == 1:
+      segpath.append(table.segment_end(adjacency.neighbours(last)[0] ^ 1))
     segpath.append(redundant_last)
 
   def _link_duplicated_first(self, merged, first, is_reversed, jntag):
@@ -41,14 +52,14 @@ class RedundantLinearPaths:
     else:
       first.get(jntag)["R"].append([merged.name, "+"])
     # create temporary link
-    ln = len(first.sequence)
+    ln = first.length
     if self._version == "gfa1":
-      tmp_link = gfapy.line.edge.Link([first.name, \
+      tmp_link = gfapy.line.edge.Link(["L", first.name, \
         "-" if is_reversed else "+", merged.name, "+", \
-        "{}M".format(ln), "co:Z:temporary"])
+        self.__junction_overlap(ln), "co:Z:temporary"])
       self.add_line(tmp_link)
     elif self._version == "gfa2":
-      tmp_link = gfapy.line.edge.GFA2(["*",first.name + \
+      tmp_link = gfapy.line.edge.GFA2(["E", "*", first.name + \
         ("-" if is_reversed else "+"), merged.name+"+",
         "0" if is_reversed else str(ln-1), # on purpose fake
         "1" if is_reversed else "{}$".format(ln), # on purpose fake
@@ -68,15 +79,15 @@ class RedundantLinearPaths:
     else:
       last.get(jntag)["L"].append([merged.name, "+"])
     # create temporary link
-    ln = len(last.sequence)
+    ln = last.length
     if self._version == "gfa1":
-      tmp_link = gfapy.line.edge.Link([merged.name, "+",
+      tmp_link = gfapy.line.edge.Link(["L", merged.name, "+",
           last.name, "-" if is_reversed else "+",
-          "{}M".format(ln), "co:Z:temporary"])
+          self.__junction_overlap(ln), "co:Z:temporary"])
       self.add_line(tmp_link)
     elif self._version == "gfa2":
-      mln = len(merged.sequence)
-      tmp_link = gfapy.line.edge.GFA2(["*",merged.name+"+", \
+      mln = merged.length
+      tmp_link = gfapy.line.edge.GFA2(["E", "*", merged.name+"+", \
         last.name+("-" if is_reversed else "+"),
         str(mln - ln), "{}$".format(mln),
         str(ln-1) if is_reversed else "0", # on purpose fake
@@ -86,28 +97,35 @@ class RedundantLinearPaths:
     else:
       raise gfapy.AssertionError()
 
+  @staticmethod
+  def __junction_overlap(ln):
+    # the length of junctions with placeholder sequence can be unknown in GFA1
+    return "*" if ln is None else "{}M".format(ln)
+
   def _remove_junctions(self, jntag):
     if jntag is None:
       jntag = "jn"
     for s in self.segments:
       jndata = s.get(jntag)
       if jndata:
-        ln = len(s.sequence)
-        for m1, dir1 in jndata["L"].items():
-          for m2, dir2 in jndata["R"].items():
+        ln = s.length
+        # merged segments ending (L) and starting (R) with the junction
+        for m1, dir1 in jndata["L"]:
+          for m2, dir2 in jndata["R"]:
             if self._version == "gfa1":
-              l = gfapy.line.edge.Link([m1,dir1,m2,dir2,"{}M".format(ln)])
+              l = gfapy.line.edge.Link(["L", m1, dir1, m2, dir2,
+                                        self.__junction_overlap(ln)])
               self.add_line(l)
             elif self._version == "gfa2":
-              m1ln = len(self.segment(m1).sequence)
-              m2ln = len(self.segment(m2).sequence)
+              m1ln = self.segment(m1).length
+              m2ln = self.segment(m2).length
               r1 = (dir1 == "-")
               r2 = (dir2 == "-")
-              l = gfapy.line.edge.GFA2(["*", m1+dir1, m2+dir2,
+              l = gfapy.line.edge.GFA2(["E", "*", m1+dir1, m2+dir2,
                  "0" if r1 else str(m1ln-ln),
                  str(ln) if r1 else str(m1ln)+"$",
-                 "0" if r2 else str(m2ln-ln),
-                 str(ln) if r1 else str(m2ln)+"$",
+                 str(m2ln-ln) if r2 else "0",
+                 str(m2ln)+"$" if r2 else str(ln),
                  str(ln)+"M"])
               self.add_line(l)
             else:
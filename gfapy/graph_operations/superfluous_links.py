@@ -1,7 +1,9 @@
 import gfapy
+from gfapy.segment_table import with_segment_table
 
 class SuperfluousLinks:
 
+  @with_segment_table
   def enforce_segment_mandatory_links(self, segment, conserve_components=True):
     """Enforce mandatory dovetails overlaps of a given segment to other
     segments, by removing all other dovetail overlaps between those segments.
@@ -40,6 +42,7 @@ class SuperfluousLinks:
       self._delete_other_links(oe, se[et],
                               conserve_components=conserve_components)
 
+  @with_segment_table
   def enforce_all_mandatory_links(self, conserve_components=True):
     """Enforce mandatory dovetails between pairs of segments, by removing all
        other dovetail overlaps between those segments.
@@ -1,10 +1,21 @@
 import gfapy
+from array import array
+from collections import deque
+from gfapy.segment_table import with_segment_table
 
 class Topology:
 
+  @with_segment_table
   def is_cut_link(self, link):
     """Does the removal of a dovetail overlap split a connected component?
 
+    The cut links are the bridges of the graph, whose nodes are the
+    segments and whose edges are the dovetail overlaps, regardless of the
+    segment ends they connect; i.e. the connected components are the same
+    as computed by connected_components(). Until version 1.2.3, a link was
+    also reported as cut link if one of its segments had no dovetail
+    overlaps at the other end, as the segment could then not be traversed.
+
     Note:
       only dovetail overlaps are considered as connections
 
@@ -16,24 +27,22 @@ class Topology:
     """
     if link.is_circular():
       return False
-    if not link.get("from_segment").dovetails_of_end(\
-             gfapy.invert(link.from_end.end_type)):
-      return True
-    if not link.to_segment.dovetails_of_end(gfapy.invert(link.to_end.end_type)):
-      return True
-    c = {}
-    for et in ["from", "to"]:
-      c[et] = set()
-      visited = set()
-      segend = link.get("from_segment") if et == "from" else link.to_segment
-      visited.add(segend.name)
-      visited.add(link.other_end(segend).name)
-      self.__traverse_component(segend, c[et], visited)
-    return c["from"] != c["to"]
+    table = self.segment_table
+    ends = [table.segment_id(link.from_end.segment),
+            table.segment_id(link.to_end.segment)]
+    cut_index = table.cut_index
+    if ends[0] in cut_index.dirty or ends[1] in cut_index.dirty:
+      return self.__are_disconnected(ends, skip_edge = link)
+    return id(link) in cut_index.bridges
 
+  @with_segment_table
   def is_cut_segment(self, segment):
     """Does the removal of a segment split a connected component?
 
+    The cut segments are the articulation points of the graph, whose nodes
+    are the segments and whose edges are the dovetail overlaps, regardless
+    of the segment ends they connect (see is_cut_link()).
+
     Note:
       only dovetail overlaps are considered as connections
 
@@ -43,23 +52,83 @@ class Topology:
     Returns:
        bool
     """
-    if isinstance(segment, str):
-      segment = self.try_get_segment(segment)
-    if segment._connectivity() in [(0,0),(0,1),(1,0)]:
+    table = self.segment_table
+    segment_id = table.segment_id(segment)
+    if table.degree_L[segment_id] + table.degree_R[segment_id] < 2:
       return False
-    start_points = set()
-    for et in ["L", "R"]:
-      for l in segment.dovetails_of_end(et):
-        start_points.add(l.other_end(\
-            gfapy.SegmentEnd(segment.name, et)).inverted())
-    cc = []
-    for start_point in start_points:
-      cc.append(set())
-      visited = set()
-      visited.add(segment.name)
-      self.__traverse_component(start_point, cc[-1], visited)
-    return any(c != cc[0] for c in cc)
+    cut_index = table.cut_index
+    if segment_id in cut_index.dirty:
+      adjacency = table.adjacency
+      neighbours = set()
+      for node in [2 * segment_id, 2 * segment_id + 1]:
+        for target in adjacency.neighbours(node):
+          neighbours.add(target >> 1)
+      neighbours.discard(segment_id)
+      if len(neighbours) < 2:
+        return False
+      return self.__are_disconnected(neighbours, skip_segment = segment_id)
+    return bool(cut_index.articulation[segment_id])
+
+  def __are_disconnected(self, segment_ids, skip_segment = None,
+                         skip_edge = None):
+    """Are some of the segments disconnected from the others?
+
+    Used for the segments, whose information in the cut index is out of
+    date. A breadth first search is started from each of the segments; the
+    searches are run alternately and merged when they meet. The graph is
+    traversed without the segment skip_segment and the edge skip_edge.
+    Thus the time is proportional to the size of the explored
+    neighbourhoods, and not to the size of the graph.
+
+    Returns:
+      bool : True, if a search ends without having met all others
+    """
+    adjacency = self.segment_table.adjacency
+    starts = adjacency.starts
+    stops = adjacency.stops
+    targets = adjacency.targets
+    edges = adjacency.edges
+    segment_ids = list(segment_ids)
+    owner = {}
+    if skip_segment is not None:
+      owner[skip_segment] = -1
+    queues = []
+    for search, segment_id in enumerate(segment_ids):
+      owner[segment_id] = search
+      queues.append(deque([segment_id]))
+    merged_into = list(range(len(segment_ids)))
+    def find(search):
+      while merged_into[search] != search:
+        search = merged_into[search]
+      return search
+    n_groups = len(segment_ids)
+    while True:
+      for search, queue in enumerate(queues):
+        if not queue:
+          continue
+        segment_id = queue.popleft()
+        for node in [2 * segment_id, 2 * segment_id + 1]:
+          for i in range(starts[node], stops[node]):
+            if edges[i] is skip_edge:
+              continue
+            other = targets[i] >> 1
+            other_search = owner.get(other)
+            if other_search is None:
+              owner[other] = search
+              queue.append(other)
+            elif other_search >= 0:
+              a = find(other_search)
+              b = find(search)
+              if a != b:
+                merged_into[a] = b
+                n_groups -= 1
+                if n_groups == 1:
+                  return False
+      if len(set(find(s) for s, q in enumerate(queues) if q)) < n_groups:
+        # the searches of a group have been exhausted
+        return True
 
+  @with_segment_table
   def segment_connected_component(self, segment, visited = None):
     """Compute the connected component to which a segment belong.
 
@@ -68,24 +137,20 @@ class Topology:
 
     Parameters:
       segment (str, Line) : a segment name or instance
+      visited (set) : names of segments which shall not be traversed;
+        the names of the segments of the component are added to it
 
     Returns:
        list : a list of segment instances
     """
+    table = self.segment_table
+    segment_id = table.segment_id(segment)
     if visited is None:
       visited = set()
-    if isinstance(segment, gfapy.Line):
-      segment_name = segment.name
-    else:
-      segment_name = segment
-      segment = self.segment(segment)
-    visited.add(segment_name)
-    c = set()
-    c.add(segment)
-    for e in ["L", "R"]:
-      self.__traverse_component(gfapy.SegmentEnd(segment, e), c, visited)
-    return list(c)
+    return [table.segment(i) for i in \
+            self.__traverse_component(segment_id, visited)]
 
+  @with_segment_table
   def connected_components(self):
     """Compute the connected components of the graph.
 
@@ -96,13 +161,72 @@ class Topology:
        list : a list of lists of segment instances; each sublist is
          a connected component
     """
-    components = []
-    visited = set()
-    for sn in self.segment_names:
-      if sn not in visited:
-        components.append(self.segment_connected_component(sn, visited))
+    table = self.segment_table
+    labels, sizes, lengths = self._label_connected_components()
+    components = [[] for i in range(len(sizes))]
+    for segment_id in table.segment_ids:
+      components[labels[segment_id]].append(table.segment(segment_id))
     return components
 
+  @with_segment_table
+  def connected_components_stats(self):
+    """Size of the connected components of the graph.
+
+    Note:
+      only dovetail overlaps are considered as connections
+
+    Returns:
+      list : a list of tuples (number of segments, total length of the
+        segments), one for each connected component, in the same order as
+        connected_components(); segments with unknown length are counted
+        as having length 0
+    """
+    labels, sizes, lengths = self._label_connected_components()
+    return list(zip(sizes, lengths))
+
+  def _label_connected_components(self):
+    """Assign to each segment the index of its connected component.
+
+    The components are computed in a single pass over the adjacency of the
+    segment table, using an iterative traversal.
+
+    Returns:
+      (array, list, list) : the index of the component of each row of the
+        segment table (-1 for unused rows), and the number of segments and
+        the total length of each component
+    """
+    table = self.segment_table
+    adjacency = table.adjacency
+    starts = adjacency.starts
+    stops = adjacency.stops
+    targets = adjacency.targets
+    length = table.length
+    labels = array("q", [-1]) * len(length)
+    sizes = []
+    lengths = []
+    for start in table.segment_ids:
+      if labels[start] >= 0:
+        continue
+      label = len(sizes)
+      labels[start] = label
+      stack = [start]
+      size = 0
+      total_length = 0
+      while stack:
+        segment_id = stack.pop()
+        size += 1
+        if length[segment_id] > 0:
+          total_length += length[segment_id]
+        for node in [2 * segment_id, 2 * segment_id + 1]:
+          for i in range(starts[node], stops[node]):
+            other = targets[i] >> 1
+            if labels[other] < 0:
+              labels[other] = label
+              stack.append(other)
+      sizes.append(size)
+      lengths.append(total_length)
+    return labels, sizes, lengths
+
   def split_connected_components(self):
     """Split the connected components of the graph.
 
@@ -112,12 +236,75 @@ class Topology:
     Returns:
       list of Gfa
     """
-    retval = []
-    for cc in self.connected_components():
-      gfa2 = self.clone
-      gfa2.rm(gfa2.segment_names - cc)
-      retval.append(gfa2)
-    return retval
+    return [self.subgraph(cc) for cc in self.connected_components()]
+
+  def subgraph(self, segments):
+    """Copy of the subgraph induced by a set of segments.
+
+    The subgraph contains the header, the segments and the lines which only
+    refer to the segments or to other lines of the subgraph (edges, gaps,
+    fragments, paths and sets). Comments and custom records are not
+    contained in the subgraph.
+
+    The time needed is proportional to the size of the subgraph, as only the
+    lines referring to the segments are considered.
+
+    Parameters:
+      segments (list of str or gfapy.line.segment.GFA1 or
+        gfapy.line.segment.GFA2) : the segments or their names
+
+    Returns:
+      gfapy.Gfa
+    """
+    gfa = self.__class__(vlevel = self._vlevel, version = self._version,
+                         dialect = self._dialect, lazy = self._lazy)
+    gfa._default = self._default.copy()
+    copies = {}
+    self._copy_line(self.header, gfa, copies)
+    candidates = {}
+    # lines referring to copied lines are candidates for the subgraph
+    stack = []
+    for s in segments:
+      s = self.try_get_segment(s)
+      if id(s) not in copies:
+        self._copy_line(s, gfa, copies)
+        stack.append(s)
+    while stack:
+      for l in stack.pop().all_references:
+        if isinstance(l, gfapy.OrientedLine):
+          l = l.line
+        if id(l) not in candidates and not l.virtual:
+          candidates[id(l)] = l
+          stack.append(l)
+    order = {rt: i for i, rt in enumerate(self.RECORD_TYPES_ORDER)}
+    pending = sorted([l for l in candidates.values() if l.record_type in order],
+                     key = lambda l: order[l.record_type])
+    # groups can refer to groups which are copied later in the same pass,
+    # thus the pass is repeated until no further line is copied
+    while pending:
+      left = []
+      for l in pending:
+        if all(id(r) in copies for r in self.__referenced_lines(l)):
+          self._copy_line(l, gfa, copies)
+        else:
+          left.append(l)
+      if len(left) == len(pending):
+        break
+      pending = left
+    return gfa
+
+  @staticmethod
+  def __referenced_lines(line):
+    """Lines referenced by the reference fields of a line."""
+    for field in line.__class__.REFERENCE_FIELDS:
+      values = line._data.get(field)
+      if not isinstance(values, list):
+        values = [values]
+      for v in values:
+        if isinstance(v, gfapy.OrientedLine):
+          v = v.line
+        if isinstance(v, gfapy.Line):
+          yield v
 
   @property
   def n_dead_ends(self):
@@ -129,7 +316,7 @@ class Topology:
       int
     """
     n = 0
-    for s in self.segments:
+    for s in self.iter_segments():
       if not s.dovetails_L: n+=1
       if not s.dovetails_R: n+=1
     return n
@@ -142,7 +329,7 @@ class Topology:
       int
     """
     n = 0
-    for s in self.segments:
+    for s in self.iter_segments():
       n += len(s.dovetails_L)
       n += len(s.dovetails_R)
     return n // 2
@@ -155,7 +342,7 @@ class Topology:
       int
     """
     n = 0
-    for s in self.segments:
+    for s in self.iter_segments():
       n += len(s.internals)
     return n // 2
 
@@ -167,7 +354,7 @@ class Topology:
       int
     """
     n = 0
-    for s in self.segments:
+    for s in self.iter_segments():
       n += len(s.edges_to_contained)
       n += len(s.edges_to_containers)
     return n // 2
@@ -175,16 +362,32 @@ class Topology:
   def info(self, short):
     pass
 
-  def __traverse_component(self, segment_end, c, visited):
-    s = segment_end.segment
-    assert(isinstance(s, gfapy.Line))
-    for l in s.dovetails_of_end(segment_end.end_type):
-      oe = l.other_end(segment_end)
-      sn = oe.name
-      s = oe.segment
-      if sn in visited:
-        continue
-      visited.add(sn)
-      c.add(s)
-      for e in ["L","R"]:
-        self.__traverse_component(gfapy.SegmentEnd(s, e), c, visited)
+  def __traverse_component(self, segment_id, visited):
+    """IDs of the segments connected to a segment, whose names are not in
+    visited.
+
+    The segment ends are traversed using the adjacency of the segment table;
+    the names of the traversed segments are added to visited.
+    """
+    table = self.segment_table
+    adjacency = table.adjacency
+    starts = adjacency.starts
+    stops = adjacency.stops
+    targets = adjacency.targets
+    component = [segment_id]
+    visited.add(table.segment(segment_id).name)
+    seen = {segment_id}
+    stack = [segment_id]
+    while stack:
+      segment_id = stack.pop()
+      for node in [2 * segment_id, 2 * segment_id + 1]:
+        for i in range(starts[node], stops[node]):
+          other = targets[i] >> 1
+          if other not in seen:
+            seen.add(other)
+            name = table.segment(other).name
+            if name not in visited:
+              visited.add(name)
+              component.append(other)
+              stack.append(other)
+    return component
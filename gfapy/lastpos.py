@@ -47,6 +47,9 @@ class LastPos:
         new_instance.validate()
       return new_instance
 
+  def __reduce__(self):
+    return (self.__class__, (self.value, True))
+
   def validate(self):
     """Checks that the value is a positive integer.
 
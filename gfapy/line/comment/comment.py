@@ -19,6 +19,8 @@ class Comment(Writer, Tags, Construction, VersionConversion, Line):
   Trying to set or get tag values raises exceptions.
   """
 
+  __slots__ = ()
+
   RECORD_TYPE = "#"
   POSFIELDS = ["content", "spacer"]
   DATATYPE = {
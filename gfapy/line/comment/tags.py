@@ -2,6 +2,8 @@ import gfapy
 
 class Tags:
 
+  __slots__ = ()
+
   def set(self, fieldname, value):
     """Set the value of a field.
 
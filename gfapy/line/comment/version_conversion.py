@@ -1,5 +1,7 @@
 class VersionConversion:
 
+  __slots__ = ()
+
   def _to_gfa1_a(self): return self.to_list()
   def _to_gfa2_a(self): return self.to_list()
 
@@ -1,4 +1,6 @@
 class Writer:
+  __slots__ = ()
+
   def __str__(self):
     return "#" + str(self.spacer) + str(self.content)
 
@@ -3,6 +3,8 @@ from copy import deepcopy
 
 class Cloning:
 
+  __slots__ = ()
+
   def clone(self):
     """Copy of a gfapy.Line instance.
     The copy will be disconnected, ie do not belong to the GFA and do not
@@ -29,6 +31,8 @@ class Cloning:
         data_cpy[k] = v
     cpy = self.__class__(data_cpy, vlevel = self.vlevel,
                          virtual = self.virtual, version = self.version)
-    cpy._datatype = self._datatype.copy()
+    if self._datatype:
+      cpy._datatype = self._datatype.copy()
+    cpy._decoded = self._decoded
     # cpy._refs and cpy._gfa are not set, so that the cpy is disconnected
     return cpy
@@ -2,6 +2,8 @@ import gfapy
 
 class Connection:
 
+  __slots__ = ()
+
   def is_connected(self):
     """
     In a connected line, some of the fields are converted
@@ -58,19 +60,23 @@ class Connection:
     -------
     list
     """
-    if not self._refs:
-      self._refs = {}
     return [x for y in self._refs.values() for x in y]
 
   def _add_reference(self, line, key, append = True):
     if not self._refs:
       self._refs = {}
-    if key not in self._refs:
-      self._refs[key] = []
+    refs = self._refs.get(key)
+    if refs is None:
+      refs = []
+      self._refs[key] = refs
+    elif refs.__class__ is list and len(refs) >= gfapy.ReferenceList.THRESHOLD:
+      # many references: switch to constant time removal
+      refs = gfapy.ReferenceList(refs)
+      self._refs[key] = refs
     if append:
-      self._refs[key].append(line)
+      refs.append(line)
     else:
-      self._refs[key].insert(0, line)
+      refs.insert(0, line)
 
   def _initialize_references(self):
     """
@@ -1,18 +1,32 @@
 from collections import OrderedDict
-from functools import partial
+from types import MappingProxyType
 import re
 import gfapy
-from .dynamic_fields import DynamicField
 
-try:
-  from functools import partialmethod
-except ImportError:
-  #for compatibility with old python versions
-  def partialmethod(method, **kwargs):
-    return lambda self: method(self, **kwargs)
+_FIELD_ACCESSORS_TEMPLATE = '''
+def getter(self):
+  v = self._data.get({fieldname!r})
+  if v.__class__ is str:
+    if {string_is_decoded}:
+      return v
+  elif v is not None and self.vlevel < 3{not_a_handle}:
+    return v
+  return self.get({fieldname!r})
+
+def setter(self, value):
+  self._set_existing_field({fieldname!r}, value)
+
+def try_get(self):
+  v = getter(self)
+  if v is None:
+    raise gfapy.NotFoundError("No value defined for tag {fieldname}")
+  return v
+'''
 
 class Construction:
 
+  __slots__ = ()
+
   DELAYED_PARSING_DATATYPES = [
                                 "alignment_gfa1",
                                 "alignment_gfa2",
@@ -43,8 +57,17 @@ class Construction:
   * different: different syntax in different versions
   """
 
+  _EMPTY_MAPPING = MappingProxyType({})
+  """
+  Shared read-only default for _datatype and _refs.
+
+  Most lines have no tags with a non-predefined datatype and no references
+  (e.g. before they are added to a Gfa instance); thus a dict is only
+  created when the first entry is stored.
+  """
+
   def __new__(cls, data, vlevel = 1, virtual = False, dialect = "standard",
-      version = None):
+      version = None, lazy = False):
     if isinstance(data, str):
       data = data.split("\t")
     if isinstance(data, list) and cls.RECORD_TYPE == None:
@@ -52,15 +75,17 @@ class Construction:
     return object.__new__(cls)
 
   def __init__(self, data, vlevel = 1, virtual = False,
-               version = None, dialect = "standard"):
+               version = None, dialect = "standard", lazy = False):
     self._dialect = dialect.lower()
     self.vlevel = vlevel
     self._virtual = virtual
-    self._datatype = {}
+    self._datatype = self._EMPTY_MAPPING
     self._data = {}
     self._gfa = None
     self._version = version
-    self._refs = {}
+    self._refs = self._EMPTY_MAPPING
+    self._raw = None
+    self._decoded = False
     if self.__class__ == gfapy.Line:
       raise gfapy.AssertionError("Line subclass unknown")
     if isinstance(data, dict):
@@ -71,18 +96,23 @@ class Construction:
       if self.__class__ == gfapy.line.Comment:
         data = gfapy.Line._init_comment_data(data)
       elif isinstance(data, str):
+        if lazy and vlevel < 2:
+          self._raw = data
         data = data.split(gfapy.Line.SEPARATOR)
+      elif lazy and vlevel < 2:
+        self._raw = gfapy.Line.SEPARATOR.join(data)
       if self.version is None:
         self._compute_version(data[0])
       else:
         self._validate_version()
       self._initialize_positional_fields(data)
       self._initialize_tags(data)
-      if self.vlevel >= 1:
+      if self.vlevel >= 1 and self._raw is None:
         self._validate_record_type_specific_info()
       if self.version is None:
         raise gfapy.RuntimeError("version could not be determined, "+
             "record_type={}".format(self.record_type))
+      self._decoded = self._raw is None
 
   @staticmethod
   def _init_comment_data(data):
@@ -135,7 +165,10 @@ class Construction:
     return len(self.POSFIELDS)
 
   def _init_field_value(self, n ,t, s, errmsginfo = None):
-    if self.vlevel >= 1:
+    if self._raw is not None:
+      # lazy line: the field is decoded on first access
+      pass
+    elif self.vlevel >= 1:
       s = gfapy.Field._parse_gfa_field(s, t, safe = True, fieldname = n,
                             line = errmsginfo)
     elif t not in self.DELAYED_PARSING_DATATYPES:
@@ -161,9 +194,26 @@ class Construction:
                        errmsginfo = strings)
 
   def _initialize_tags(self, strings):
-    for i in range(len(self.POSFIELDS)+1, len(strings)):
-      self._initialize_tag(*(gfapy.Field._parse_gfa_tag(strings[i])),
-          errmsginfo = strings)
+    first_tag = len(self.POSFIELDS)+1
+    if len(strings) <= first_tag:
+      return
+    tags = gfapy.Field._parse_gfa_tags(strings[first_tag:])
+    if self.vlevel > 0:
+      # the tag names were already validated by the parser
+      predefined_tags = self.__class__.PREDEFINED_TAGS
+      data = self._data
+      for n, t, s in tags:
+        if n in data:
+          raise gfapy.NotUniqueError(
+            "Tag {} found multiple times".format(n))
+        elif n in predefined_tags:
+          self._validate_predefined_tag_type(n, t)
+        else:
+          self._store_datatype(n, t)
+        self._init_field_value(n, t, s, errmsginfo = strings)
+    else:
+      for n, t, s in tags:
+        self._initialize_tag(n, t, s, errmsginfo = strings)
 
   def _initialize_tag(self, n, t, s, errmsginfo = None):
     if (self.vlevel > 0):
@@ -174,10 +224,10 @@ class Construction:
         self._validate_predefined_tag_type(n, t)
       else:
         self._validate_custom_tagname(n)
-        self._datatype[n] = t
+        self._store_datatype(n, t)
     else:
       if not self._field_datatype(t):
-        self._datatype[n] = t
+        self._store_datatype(n, t)
     self._init_field_value(n, t, s, errmsginfo = errmsginfo)
 
   @staticmethod
@@ -263,17 +313,42 @@ class Construction:
     if cls.NAME_FIELD and cls.NAME_FIELD not in fieldnames:
       fieldnames.append(cls.NAME_FIELD)
     for fieldname in fieldnames:
-      def get_method(self, fieldname):
-        return self.get(fieldname)
-      def set_method(self, value, fieldname):
-        return self._set_existing_field(fieldname, value)
-      setattr(cls, fieldname,
-          DynamicField(partial(get_method, fieldname = fieldname),
-                       partial(set_method, fieldname = fieldname)))
-      def try_get_method(self, fieldname):
-        return self.try_get(fieldname)
-      setattr(cls, "try_get_" + fieldname,
-              partialmethod(try_get_method, fieldname = fieldname))
+      getter, setter, try_get = \
+          cls._field_accessors(fieldname, cls.DATATYPE.get(fieldname))
+      setattr(cls, fieldname, property(getter, setter))
+      setattr(cls, "try_get_" + fieldname, try_get)
+
+  @classmethod
+  def _field_accessors(cls, fieldname, datatype):
+    """
+    Generate the getter, setter and try_get method of a field.
+
+    The getter returns the value stored in the line data, if it is known
+    to be decoded, i.e. if it is not a string (or a sequence loaded on
+    demand) or, for datatypes decoded into strings, if all fields were
+    decoded when the line was constructed and no string was stored
+    afterwards. Otherwise, and at validation level 3, it falls back to
+    `get`, which decodes and validates the value.
+    """
+    if datatype in gfapy.Field.STRING_DATATYPE:
+      string_is_decoded = \
+          "self._decoded and v != \"*\" and self.vlevel < 3"
+    else:
+      string_is_decoded = "False"
+    if datatype in ["sequence_gfa1", "sequence_gfa2"]:
+      not_a_handle = " and v.__class__ is not gfapy.SequenceHandle"
+    else:
+      not_a_handle = ""
+    source = _FIELD_ACCESSORS_TEMPLATE.format(fieldname = fieldname,
+        string_is_decoded = string_is_decoded, not_a_handle = not_a_handle)
+    namespace = {"gfapy": gfapy}
+    exec(compile(source, "<{} accessors of {}>".format(fieldname, cls.__name__),
+                 "exec"), namespace)
+    for method, name in [("getter", fieldname), ("setter", fieldname),
+                         ("try_get", "try_get_" + fieldname)]:
+      namespace[method].__name__ = name
+      namespace[method].__qualname__ = "{}.{}".format(cls.__name__, name)
+    return namespace["getter"], namespace["setter"], namespace["try_get"]
 
   @classmethod
   def _define_field_aliases(cls):
@@ -290,14 +365,16 @@ class Construction:
   @classmethod
   def _define_reference_getters(cls):
     for k in cls.DEPENDENT_LINES + cls.OTHER_REFERENCES:
-      def get_method(self, k):
-        return self._refs.get(k , [])
-      def set_method(self, value, k):
-        raise gfapy.AttributeError(
-            "References collections cannot be set directly")
-      setattr(cls, k,
-          DynamicField(partial(get_method, k = k),
-                       partial(set_method, k = k)))
+      setattr(cls, k, property(*cls._reference_accessors(k)))
+
+  @staticmethod
+  def _reference_accessors(k):
+    def getter(self):
+      return self._refs.get(k, [])
+    def setter(self, value):
+      raise AttributeError(
+          "References collections cannot be set directly")
+    return getter, setter
     def all_references(self):
       return [ item for item in [ values for values in self._refs ] ]
 
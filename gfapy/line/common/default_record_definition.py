@@ -2,6 +2,8 @@ class DefaultRecordDefinition:
   """
   Provides default values for the constants for the definition of record types.
   """
+
+  __slots__ = ()
   RECORD_TYPE = None
   POSFIELDS = []
   PREDEFINED_TAGS = []
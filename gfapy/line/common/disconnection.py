@@ -2,6 +2,8 @@ import gfapy
 
 class Disconnection:
 
+  __slots__ = ()
+
   def disconnect(self):
     """
     Remove the line from the GFA instance it belongs to, if any.
@@ -24,19 +26,16 @@ class Disconnection:
     self._gfa = None
 
   def _delete_reference(self, line, key):
-    if key not in self._refs: return
-    idx = None
-    for i, x in enumerate(self._refs[key]):
-      if x is line:
-        idx = i
-    if idx is None:
+    refs = self._refs.get(key)
+    if refs is None:
+      return
+    if refs.__class__ is not list:
+      refs.discard(line)
       return
-    elif idx == 0:
-      self._refs[key].pop(0)
-    elif idx == len(self._refs[key])-1:
-      self._refs[key].pop()
-    else:
-      self._refs[key] = (self._refs[key][0:idx] + self._refs[key][idx+1:])
+    for idx in range(len(refs) - 1, -1, -1):
+      if refs[idx] is line:
+        del refs[idx]
+        return
 
   def _delete_first_reference(self, key):
     if not self._refs or not self._refs[key]:
@@ -81,10 +80,13 @@ class Disconnection:
        self._remove_backreference(ref[i], k)
 
   def _disconnect_dependent_line(self, ref):
+    # lines referring twice to this line (e.g. a link connecting an end
+    # of a segment to itself) are already disconnected the second time
     if isinstance(ref, gfapy.Line):
-      ref.disconnect()
+      if ref._gfa is not None:
+        ref.disconnect()
     elif isinstance(ref, gfapy.OrientedLine):
-      if isinstance(ref.line, gfapy.Line):
+      if isinstance(ref.line, gfapy.Line) and ref.line._gfa is not None:
         ref.line.disconnect()
     elif isinstance(ref, list):
       for i in range(len(ref)):
@@ -104,7 +106,8 @@ class Disconnection:
 
   def _disconnect_dependent_lines(self):
     for k in self.__class__.DEPENDENT_LINES:
-      for ref in self._refs.get(k, []):
+      # copy, as disconnecting a line removes it from the list
+      for ref in list(self._refs.get(k, [])):
         self._disconnect_dependent_line(ref)
 
   def _remove_nonfield_backreferences(self):
@@ -113,4 +116,4 @@ class Disconnection:
         self._remove_backreference(ref, k)
 
   def _remove_nonfield_references(self):
-    self._refs = {}
+    self._refs = self._EMPTY_MAPPING
@@ -2,6 +2,8 @@ import gfapy
 
 class Equivalence:
 
+  __slots__ = ()
+
   def __hash__(self):
     name = self.get("name")
     if name:
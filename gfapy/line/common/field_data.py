@@ -2,6 +2,8 @@ import gfapy
 
 class FieldData:
 
+  __slots__ = ()
+
   @property
   def positional_fieldnames(self):
     """Name of the positional fields.
@@ -66,13 +68,14 @@ class FieldData:
     elif self.virtual:
       raise gfapy.RuntimeError("Virtual lines do not have tags")
     elif (self.vlevel == 0) or self._is_valid_custom_tagname(fieldname):
-      self._define_field_methods(fieldname)
       if self._datatype.get(fieldname, None) is not None:
         return self._set_existing_field(fieldname, value)
       elif value is not None:
-        self._datatype[fieldname] = \
-            gfapy.Field._get_default_gfa_tag_datatype(value)
+        self._raw = None
+        self._store_datatype(fieldname,
+            gfapy.Field._get_default_gfa_tag_datatype(value))
         self._data[fieldname] = value
+        self._update_segment_table(fieldname)
         return self._data[fieldname]
     else:
       raise gfapy.FormatError(
@@ -102,15 +105,21 @@ class FieldData:
       t = self._field_datatype(fieldname)
       if t != "Z" and t != "seq":
         # value was not parsed or was set to a string by the user
-        self._data[fieldname] = gfapy.Field._parse_gfa_field(v, t,
-                                                    safe = (self.vlevel >= 1),
-                                                    fieldname = fieldname,
-                                                    line = self)
-        return self._data[fieldname]
+        v = gfapy.Field._parse_gfa_field(v, t, safe = (self.vlevel >= 1),
+                                         fieldname = fieldname, line = self)
+        self._data[fieldname] = v
+        if self._raw is not None and not isinstance(v, (str, int, float,
+                                     gfapy.Placeholder, gfapy.LastPos)):
+          # the decoded value could be modified in place
+          self._raw = None
+        return v
       else:
         if (self.vlevel >= 3):
           gfapy.Field._validate_gfa_field(v, t, fieldname)
     elif v is not None:
+      if isinstance(v, gfapy.SequenceHandle):
+        # sequence loaded on demand; the handle is kept in the line
+        v = str(v)
       if (self.vlevel >= 3):
         t = self._field_datatype(fieldname)
         gfapy.Field._validate_gfa_field(v, t, fieldname)
@@ -160,13 +169,17 @@ class FieldData:
       The deleted value or None, if the field was not defined.
     """
     if tagname in self.tagnames:
+      self._raw = None
       if tagname in self._datatype:
         self._datatype.pop(tagname)
-      return self._data.pop(tagname)
+      value = self._data.pop(tagname)
+      self._update_segment_table(tagname)
+      return value
     else:
       return None
 
   def _set_existing_field(self, fieldname, value, set_reference = False):
+    self._raw = None
     renaming_connected = False
     if self._gfa:
       if not set_reference and \
@@ -188,9 +201,18 @@ class FieldData:
         self._field_or_default_datatype(fieldname, value)
         gfapy.Field._validate_gfa_field(value, self._field_datatype(fieldname),
             fieldname)
+      elif value.__class__ is str:
+        # the string will be decoded and validated when it is read
+        self._decoded = False
       self._data[fieldname] = value
     if renaming_connected:
       self._gfa._register_line(self)
+    else:
+      self._update_segment_table(fieldname)
+
+  def _update_segment_table(self, fieldname):
+    if self._gfa is not None and self._gfa._segment_table is not None:
+      self._gfa._segment_table._field_changed(self, fieldname)
 
   def _dealias_fieldname(self, fieldname):
     return self.__class__.FIELD_ALIAS.get(fieldname, fieldname)
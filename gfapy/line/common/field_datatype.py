@@ -2,6 +2,8 @@ import gfapy
 
 class FieldDatatype:
 
+  __slots__ = ()
+
   def get_datatype(self, fieldname):
     """
     Returns a string, which specifies the datatype of a field.
@@ -50,6 +52,13 @@ class FieldDatatype:
         "{} is not a valid custom tag name".format(fieldname))
     if datatype not in gfapy.Field.TAG_DATATYPE:
       raise gfapy.ArgumentError("Unknown datatype: {}".format(datatype))
+    self._raw = None
+    self._decoded = False
+    self._store_datatype(fieldname, datatype)
+
+  def _store_datatype(self, fieldname, datatype):
+    if not self._datatype:
+      self._datatype = {}
     self._datatype[fieldname] = datatype
 
   def _field_datatype(self, fieldname):
@@ -62,5 +71,5 @@ class FieldDatatype:
       if value is None:
         return None
       t = gfapy.Field._get_default_gfa_tag_datatype(value)
-      self._datatype[fieldname] = t
+      self._store_datatype(fieldname, t)
     return t
@@ -5,6 +5,8 @@ import gfapy
 
 class UpdateReferences:
 
+  __slots__ = ()
+
   def _update_references(self, oldref, newref, key_in_ref):
     """
     This is called on lines which were referenced by virtual lines,
@@ -39,6 +41,36 @@ class UpdateReferences:
                                     .intersection(self._refs.keys())
                                     .intersection(keys)))
 
+  def _remove_references(self, oldrefs, keys):
+    """
+    Remove the references to multiple lines, which are being disconnected.
+
+    The result is the same as calling _update_references(oldref, None, key)
+    for each of the lines, but the lists of references are scanned only
+    once (see Gfa.rm_many).
+
+    Parameters
+    ----------
+    oldrefs : dict
+      The lines, indexed by their id().
+    keys : set
+      Fieldnames and/or _refs keys, where the references may be stored.
+    """
+    for fn in self.__class__.REFERENCE_FIELDS:
+      if fn in keys:
+        for oldref in oldrefs.values():
+          self.__update_reference_in_field(fn, oldref, str(oldref))
+    for key in self.__class__.DEPENDENT_LINES + \
+               self.__class__.OTHER_REFERENCES:
+      lst = self._refs.get(key)
+      if not lst or key not in keys:
+        continue
+      if isinstance(lst, gfapy.ReferenceList):
+        for oldref in oldrefs.values():
+          lst.replace(oldref, None)
+      else:
+        lst[:] = [e for e in lst if oldrefs.get(id(e)) is not e]
+
   def _backreference_keys(self, ref, key_in_ref):
     """
     Return a list of fields and/or @ref keys, which indicates
@@ -83,6 +115,9 @@ class UpdateReferences:
       self.__update_reference_in_list(value, oldref, newref)
 
   def __update_reference_in_list(self, lst, oldref, newref):
+    if isinstance(lst, gfapy.ReferenceList):
+      lst.replace(oldref, newref)
+      return
     found = False
     for idx, elem in enumerate(lst):
       if isinstance(elem, gfapy.Line):
@@ -1,8 +1,10 @@
-import re
 import gfapy
+from gfapy.field.parser import _TAGNAME_CHAR1, _TAGNAME_CHAR2
 
 class Validate:
 
+  __slots__ = ()
+
   def validate_field(self, fieldname):
     """
     Raises an error if the content of the field does not correspond to
@@ -60,7 +62,8 @@ class Validate:
 
   @staticmethod
   def _is_valid_custom_tagname(tagname):
-    return (re.match(r"^[A-Za-z][A-Za-z0-9]$", tagname))
+    return (len(tagname) == 2 and tagname[0] in _TAGNAME_CHAR1 and
+            tagname[1] in _TAGNAME_CHAR2)
 
   def _validate_record_type_specific_info(self):
     pass
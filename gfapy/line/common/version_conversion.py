@@ -8,6 +8,8 @@ except ImportError:
 
 class VersionConversion:
 
+  __slots__ = ()
+
   @property
   def version(self):
     """
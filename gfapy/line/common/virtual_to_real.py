@@ -6,6 +6,8 @@ import gfapy
 
 class VirtualToReal:
 
+  __slots__ = ()
+
   @property
   def virtual(self):
     """
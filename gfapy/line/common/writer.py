@@ -2,6 +2,8 @@ import gfapy
 
 class Writer:
 
+  __slots__ = ()
+
   def __str__(self):
     """
     Returns
@@ -9,6 +11,8 @@ class Writer:
     str
       A string representation of self.
     """
+    if self._raw is not None:
+      return self._raw
     return gfapy.Line.SEPARATOR.join(self.to_list())
 
   def to_str(self, add_virtual_commentary=True):
@@ -38,6 +42,9 @@ class Writer:
     str list
       A list of string representations of the fields.
     """
+    if self._raw is not None:
+      # lazy line, not modified since its construction
+      return self._raw.split(gfapy.Line.SEPARATOR)
     a = []
     errors = []
     try:
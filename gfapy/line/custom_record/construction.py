@@ -2,6 +2,8 @@ import gfapy
 
 class Construction:
 
+  __slots__ = ()
+
   @property
   def positional_fieldnames(self):
     """The names of the positional fields.
@@ -56,4 +58,4 @@ class Construction:
       n = "field{}".format(i)
       self._init_field_value(n, "generic", strings[i], errmsginfo = strings)
       self.positional_fieldnames.append(n)
-      self._datatype[n] = "generic"
+      self._store_datatype(n, "generic")
@@ -16,6 +16,8 @@ class CustomRecord(Construction, Line):
     positional fields with name field1, field2, etc
   """
 
+  __slots__ = ("_positional_fieldnames",)
+
   RECORD_TYPE = None
   POSFIELDS = ["record_type"]
   DATATYPE = {
@@ -1,5 +1,7 @@
 class AlignmentType:
 
+  __slots__ = ()
+
   def is_internal(self):
     """Does the edge represent an internal alignment?
 
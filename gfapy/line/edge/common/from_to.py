@@ -2,6 +2,8 @@ import gfapy
 
 class FromTo:
 
+  __slots__ = ()
+
   def is_circular(self):
     """Does the edge represent an alignment of a segment with itself?
 
@@ -1,5 +1,7 @@
 class Canonical:
 
+  __slots__ = ()
+
   def is_canonical(self):
     """Checks if a containment line is in the canonical form.
 
@@ -25,6 +25,8 @@ class Containment(Containment_ToGFA2, Pos, Canonical, Other,
     sequence. This is not indicated in the specification, but examples where
     done with this assumption in the GFA forum.
   """
+
+  __slots__ = ()
   RECORD_TYPE = "C"
   POSFIELDS = ["from_segment", "from_orient", "to_segment",
                "to_orient", "pos", "overlap"]
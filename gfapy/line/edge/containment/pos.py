@@ -2,6 +2,8 @@ import gfapy
 
 class Pos:
 
+  __slots__ = ()
+
   @property
   def rpos(self):
     """The rightmost coordinate of the contained sequence in the container.
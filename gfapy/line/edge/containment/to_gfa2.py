@@ -2,6 +2,8 @@ import gfapy
 
 class ToGFA2:
 
+  __slots__ = ()
+
   @property
   def from_coords(self):
     """
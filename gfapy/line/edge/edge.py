@@ -5,4 +5,5 @@ class Edge(Line):
   Superclass for edge lines, i.e. E lines of GFA2 files
   and L and C lines of GFA1 files.
   """
-  pass
+
+  __slots__ = ()
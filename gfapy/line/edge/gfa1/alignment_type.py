@@ -1,4 +1,6 @@
 class AlignmentType:
+  __slots__ = ()
+
   @property
   def _alignment_type(self):
     return self.record_type
@@ -2,6 +2,8 @@ import gfapy
 
 class OrientedSegments:
 
+  __slots__ = ()
+
   @property
   def oriented_from(self):
     """
@@ -2,6 +2,8 @@ import gfapy
 
 class Other:
 
+  __slots__ = ()
+
   def other_oriented_segment(self, oriented_segment, tolerant = False):
     """
     Parameters
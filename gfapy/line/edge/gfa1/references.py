@@ -1,6 +1,8 @@
 import gfapy
 
 class References:
+  __slots__ = ()
+
   def _initialize_references(self):
     for d in ["from_segment", "to_segment"]:
       s = self._gfa.segment(self.get(d))
@@ -5,6 +5,8 @@ class ToGFA2:
   Access of / conversion from a GFA1 link/containment as / to a GFA2 edge.
   """
 
+  __slots__ = ()
+
   @property
   def eid(self):
     """The content of the ID tag"""
@@ -2,6 +2,8 @@ import gfapy
 
 class AlignmentType:
 
+  __slots__ = ()
+
   @property
   def _alignment_type(self):
     """The alignment type (C, L or I).
@@ -11,6 +11,8 @@ class GFA2(Other, References, GFA2_AlignmentType, AlignmentType, FromTo,
            ToGFA1, Validation, Edge):
   """An edge line of a GFA2 file."""
 
+  __slots__ = ()
+
   RECORD_TYPE = "E"
   POSFIELDS = ["eid", "sid1", "sid2", "beg1", "end1", "beg2", "end2",
                "alignment"]
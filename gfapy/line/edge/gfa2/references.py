@@ -2,6 +2,8 @@ import gfapy
 
 class References:
 
+  __slots__ = ()
+
   def _initialize_references(self):
     st1 = self._substring_type(self.beg1, self.end1)[0]
     st2 = self._substring_type(self.beg2, self.end2)[0]
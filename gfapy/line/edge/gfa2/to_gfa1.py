@@ -2,6 +2,8 @@ import gfapy
 
 class ToGFA1:
 
+  __slots__ = ()
+
   def _to_gfa1_a(self):
     """List of the field content of the line in GFA1.
     """
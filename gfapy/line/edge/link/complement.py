@@ -2,6 +2,8 @@ import gfapy
 
 class Complement:
 
+  __slots__ = ()
+
   def complement(self):
     """Creates the equivalent link with from and to inverted.
 
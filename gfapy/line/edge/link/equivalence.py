@@ -2,16 +2,11 @@ import gfapy
 
 class Equivalence:
 
-  def __hash__(self):
-    """
-    Computes an hash for including the link in a dict,
-    so that the hash of a link and its complement is the same.
-    Thereby, tags are not considered.
-    """
-    hash(str(self.from_end)) + \
-    hash(str(self.to_end)) + \
-    hash(str(self.overlap)) + \
-    hash(str(self.overlap.complement()))
+  __slots__ = ()
+
+  # links are mutable, thus they are hashed by identity, so that
+  # changing a link does not change its hash in sets and dicts
+  __hash__ = object.__hash__
 
   def is_eql(self, other):
     """
@@ -23,6 +23,8 @@ class Link(Link_ToGFA2, GFA1_ToGFA2, Link_References, Equivalence, Complement, \
     potentially clashes with the tag namespace.
   """
 
+  __slots__ = ()
+
   RECORD_TYPE = "L"
   POSFIELDS = ["from_segment", "from_orient", "to_segment", "to_orient",
                "overlap"]
@@ -1,5 +1,7 @@
 class References:
 
+  __slots__ = ()
+
   def _process_not_unique(self, previous):
     if self.is_complement(previous):
       pass
@@ -1,5 +1,7 @@
 class ToGFA2:
 
+  __slots__ = ()
+
   @property
   def from_coords(self):
     """GFA2 positions of the alignment on the **from** segment.
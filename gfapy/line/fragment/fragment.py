@@ -6,6 +6,8 @@ class Fragment(References, Validation, Line):
   """
   A fragment line of a GFA2 file
   """
+
+  __slots__ = ()
   RECORD_TYPE = "F"
   POSFIELDS = ["sid", "external", "s_beg", "s_end", "f_beg", "f_end",
                "alignment"]
@@ -2,6 +2,8 @@ import gfapy
 
 class References():
 
+  __slots__ = ()
+
   def _initialize_references(self):
     s = self._gfa.segment(self.get("sid"))
     if s is None:
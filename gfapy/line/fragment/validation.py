@@ -2,6 +2,8 @@ import gfapy
 
 class Validation:
 
+  __slots__ = ()
+
   def validate_positions(self):
     "Checks that positions suffixed by $ are the last position of segments"
     if self.is_connected():
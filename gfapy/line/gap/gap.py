@@ -5,6 +5,8 @@ class Gap(References, Line):
   """
   A gap line of a GFA2 file
   """
+
+  __slots__ = ()
   RECORD_TYPE = "G"
   POSFIELDS = ["gid", "sid1", "sid2", "disp", "var"]
   FIELD_ALIAS = { "name" : "gid" }
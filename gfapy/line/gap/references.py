@@ -1,6 +1,8 @@
 import gfapy
 
 class References:
+  __slots__ = ()
+
   def _initialize_references(self):
     for snum in [1,2]:
       sid = "sid{}".format(snum)
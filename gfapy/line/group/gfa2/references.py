@@ -2,6 +2,8 @@ import gfapy
 
 class References:
 
+  __slots__ = ()
+
   def _prepare_and_check_ref(self, ref):
     if isinstance(ref, str):
       ref = self._line_for_ref_symbol(ref)
@@ -2,6 +2,8 @@ import gfapy
 
 class SameID:
 
+  __slots__ = ()
+
   def _process_not_unique(self, previous):
     self._gfa = previous.gfa
     self._initialize_references()
@@ -3,4 +3,5 @@ class Group(Line):
   """
   A group is a U O or P line
   """
-  pass
+
+  __slots__ = ()
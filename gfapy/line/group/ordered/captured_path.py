@@ -2,6 +2,8 @@ import gfapy
 
 class CapturedPath:
 
+  __slots__ = ()
+
   @property
   def captured_segments(self):
     return [ x for x in self.captured_path if isinstance(x.line, gfapy.line.segment.GFA2) ]
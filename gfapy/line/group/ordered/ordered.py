@@ -11,6 +11,8 @@ class Ordered(Ordered_References, CapturedPath, GFA2_References, SameID,
   An ordered group line of a GFA2 file
   """
 
+  __slots__ = ()
+
   RECORD_TYPE = "O"
   POSFIELDS = ["pid", "items"]
   FIELD_ALIAS = { "name" : "pid" }
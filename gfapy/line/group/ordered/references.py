@@ -2,6 +2,8 @@ import gfapy
 
 class References:
 
+  __slots__ = ()
+
   def append_item(self, item):
     """
     Add an item to the group as last item.
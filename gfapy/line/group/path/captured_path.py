@@ -2,6 +2,8 @@ import gfapy
 
 class CapturedPath:
 
+  __slots__ = ()
+
   @property
   def captured_edges(self):
     if not self.is_connected():
@@ -7,6 +7,8 @@ from ..group import Group
 
 class Path(Topology, References, Validation, CapturedPath, ToGFA2, Group):
   """A path line of a GFA1 file"""
+
+  __slots__ = ()
   RECORD_TYPE = "P"
   POSFIELDS = ["path_name", "segment_names", "overlaps"]
   FIELD_ALIAS = { "name" : "path_name" }
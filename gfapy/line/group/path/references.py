@@ -2,6 +2,8 @@ import gfapy
 
 class References:
 
+  __slots__ = ()
+
   def _compute_required_links(self):
     """
     Computes the list of links which are required to support
@@ -48,6 +50,8 @@ class References:
     self._initialize_segments()
 
   def _initialize_links(self):
+    if not self._refs:
+      self._refs = {}
     self._refs["links"] = []
     for from_segment, to_segment, cigar in self._compute_required_links():
       l = None
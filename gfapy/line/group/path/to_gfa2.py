@@ -2,6 +2,8 @@ import gfapy
 
 class ToGFA2:
 
+  __slots__ = ()
+
   def _to_gfa2_a(self):
     items = []
     for oline in self.captured_path:
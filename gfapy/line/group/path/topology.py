@@ -1,5 +1,7 @@
 class Topology:
 
+  __slots__ = ()
+
   def is_circular(self):
     """
     Is the path circular? In this case the number of CIGARs must be
@@ -1,6 +1,8 @@
 import gfapy
 
 class Validation:
+  __slots__ = ()
+
   def _validate_lists_size(self):
     n_overlaps = len(self.overlaps)
     n_segments = len(self.segment_names)
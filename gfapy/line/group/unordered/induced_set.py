@@ -2,6 +2,8 @@ import gfapy
 
 class InducedSet:
 
+  __slots__ = ()
+
   @property
   def induced_set(self):
     if not self.is_connected:
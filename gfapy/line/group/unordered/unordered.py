@@ -6,6 +6,8 @@ from ..group import Group
 
 class Unordered(UnorderedReferences, InducedSet, References, SameID, Group):
   """An unordered group line of a GFA2 file"""
+
+  __slots__ = ()
   RECORD_TYPE = "U"
   POSFIELDS = ["pid", "items"]
   FIELD_ALIAS = {"name" : "pid"}
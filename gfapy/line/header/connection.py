@@ -2,6 +2,8 @@ import gfapy
 
 class Connection:
 
+  __slots__ = ()
+
   def connect(self, gfa):
     if gfa.header is not self:
       raise gfapy.RuntimeError(
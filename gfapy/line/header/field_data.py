@@ -5,6 +5,8 @@ class FieldData:
   Disallow editing the VN tag in connected header lines
   """
 
+  __slots__ = ()
+
   def _set_existing_field(self, fieldname, value, set_reference=False):
     if fieldname == "VN" and self.get("VN") is not None and self.is_connected():
       raise gfapy.RuntimeError(
@@ -15,6 +15,8 @@ class Header(VersionConversion, Multiline, Connection, FieldData, Line):
   gfapy.Line
   """
 
+  __slots__ = ()
+
   RECORD_TYPE = "H"
   PREDEFINED_TAGS = ["VN", "TS"]
   DATATYPE = {
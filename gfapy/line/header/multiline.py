@@ -7,6 +7,8 @@ class Multiline:
   times in different lines).
   """
 
+  __slots__ = ()
+
   SINGLE_DEFINITION_TAGS = ["VN", "TS"]
 
   def add(self, tagname, value, datatype = None):
@@ -1,5 +1,7 @@
 class VersionConversion:
 
+  __slots__ = ()
+
   def _to_gfa2_a(self):
     """
     Return the string representation of the tags, changing the value
@@ -36,6 +36,14 @@ class Line(Construction, DynamicFields, Writer, VersionConversion,
     dialect (str) : one of 'rgfa' and 'standard'; the GFA dialect; if not
       specified then the dialect is set to 'standard'; 'rgfa' is only valid
       when version is 'gfa1'
+    lazy (bool) : if True (default: False), the fields are decoded only
+      when they are accessed for the first time, and the original string is
+      kept and output when the line is converted to string, as long as the
+      line is not modified; the validation of a field is thereby delayed to
+      its first access, while the record-type specific checks (e.g. the
+      consistency of the LN tag and the sequence length of segments) are
+      only done by validate() or, for lines of a Gfa instance, by
+      Gfa.validate(); ignored for comment lines and if vlevel is 2 or higher
 
   Notes:
     The private interface to the Line constructor also allows to pass a
@@ -54,6 +62,9 @@ class Line(Construction, DynamicFields, Writer, VersionConversion,
     an instance of a subclass of gfapy.line.Line
   """
 
+  __slots__ = ("_data", "_datatype", "_refs", "_gfa", "_version",
+               "_dialect", "_virtual", "_raw", "_decoded", "vlevel")
+
   SEPARATOR = "\t"
   """Separator in the string representation of GFA lines"""
 
@@ -2,6 +2,8 @@ import gfapy
 
 class Coverage:
 
+  __slots__ = ()
+
   def coverage(self, count_tag = "RC", unit_length = 1):
     """Compute the coverage from the value a count_tag (RC, KC or FC).
 
@@ -11,6 +11,8 @@ class GFA1(WriterWoSequence, References, Coverage,
   A segment line of a GFA file
   """
 
+  __slots__ = ()
+
   VERSION = "gfa1"
   RECORD_TYPE = "S"
   POSFIELDS = ["name", "sequence"]
@@ -2,6 +2,8 @@ import gfapy
 
 class GFA1ToGFA2:
 
+  __slots__ = ()
+
   def _to_gfa2_a(self):
     """
     Returns
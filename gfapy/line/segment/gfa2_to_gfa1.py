@@ -2,6 +2,8 @@ import gfapy
 
 class GFA2ToGFA1:
 
+  __slots__ = ()
+
   def _to_gfa1_a(self, slen_tag = "LN"):
     """
     Notes:
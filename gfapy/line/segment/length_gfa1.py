@@ -2,6 +2,8 @@ import gfapy
 
 class LengthGFA1:
 
+  __slots__ = ()
+
   @property
   def length(self):
     """
@@ -20,6 +22,10 @@ class LengthGFA1:
     """
     if self.LN:
       return self.LN
+    sequence = self._data.get("sequence")
+    if sequence.__class__ is gfapy.SequenceHandle:
+      # sequence loaded on demand: the length is known without reading it
+      return len(sequence)
     elif not gfapy.is_placeholder(self.sequence):
       return len(self.sequence)
     else:
@@ -7,6 +7,8 @@ class Segment(Line):
   Parent class for classes representing segment lines
   """
 
+  __slots__ = ()
+
   @staticmethod
   def _subclass(data):
     n_positionals = len(data)-1
@@ -1,5 +1,7 @@
 class WriterWoSequence:
 
+  __slots__ = ()
+
   def __str__(self, without_sequence = False):
     """
     Parameters
@@ -6,6 +6,8 @@ class Unknown(Line):
   and has not been found yet (ie is always virtual)
   """
 
+  __slots__ = ()
+
   RECORD_TYPE = "\n"
   POSFIELDS = ["name"]
   DATATYPE = {"name": "identifier_gfa2"}
@@ -1,2 +1,3 @@
 from .lines import Lines
+from .views import LinesView
 import gfapy.line
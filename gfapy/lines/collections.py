@@ -1,3 +1,5 @@
+import gfapy
+
 class Collections:
   @property
   def comments(self):
@@ -86,10 +88,9 @@ class Collections:
     if self._version == "gfa1":
       return self._gfa1_links
     elif self._version == "gfa2":
-      return [ e for e in self._gfa2_edges if e.is_dovetail() ]
+      return list(self._gfa2_dovetails.values())
     else:
-      return self._gfa1_links + \
-        [ e for e in self._gfa2_edges if e.is_dovetail() ]
+      return self._gfa1_links + list(self._gfa2_dovetails.values())
 
   @property
   def containments(self):
@@ -107,10 +108,10 @@ class Collections:
     if self._version == "gfa1":
       return self._gfa1_containments
     elif self._version == "gfa2":
-      return [ e for e in self._gfa2_edges if e.is_containment() ]
+      return list(self._gfa2_containments.values())
     else:
       return self._gfa1_containments + \
-        [ e for e in self._gfa2_edges if e.is_containment() ]
+        list(self._gfa2_containments.values())
 
   @property
   def paths(self):
@@ -156,6 +157,127 @@ class Collections:
       cr += list(collection.values())
     return cr
 
+  def iter_segments(self):
+    """Iterate over the segment (S) lines, without constructing a list.
+
+    Note:
+      the Gfa instance shall not be modified during the iteration
+    """
+    return iter(self._records["S"].values())
+
+  def iter_segment_names(self):
+    """Iterate over the names of the segment (S) lines.
+
+    Note:
+      the Gfa instance shall not be modified during the iteration
+    """
+    return iter(self._records["S"].keys())
+
+  def iter_edges(self):
+    """Iterate over the edge lines (see edges), without constructing a list.
+
+    Note:
+      the Gfa instance shall not be modified during the iteration
+    """
+    return iter(self.view("edges"))
+
+  def iter_dovetails(self):
+    """Iterate over the dovetail edge lines (see dovetails), without
+    constructing a list.
+
+    Note:
+      the Gfa instance shall not be modified during the iteration
+    """
+    return iter(self.view("dovetails"))
+
+  def iter_containments(self):
+    """Iterate over the containment edge lines (see containments), without
+    constructing a list.
+
+    Note:
+      the Gfa instance shall not be modified during the iteration
+    """
+    return iter(self.view("containments"))
+
+  def iter_paths(self):
+    """Iterate over the path lines (see paths), without constructing a list.
+
+    Note:
+      the Gfa instance shall not be modified during the iteration
+    """
+    return iter(self.view("paths"))
+
+  def iter_fragments(self):
+    """Iterate over the fragment (F) lines, without constructing a list.
+
+    Note:
+      the Gfa instance shall not be modified during the iteration
+    """
+    return iter(self.view("fragments"))
+
+  VIEWS = ["segments", "edges", "dovetails", "containments", "paths",
+           "fragments", "sets", "gaps", "comments"]
+  """Collections of lines, for which views can be created."""
+
+  def view(self, collection):
+    """Live view of a collection of lines.
+
+    Differently from the corresponding property (e.g. segments for
+    the segments collection), no list is constructed. The view supports
+    len(), iteration and membership tests (with line instances or names).
+
+    Parameters:
+      collection (str) : one of VIEWS
+
+    Returns:
+      gfapy.LinesView
+
+    Raises:
+      gfapy.ArgumentError : if the collection is not one of VIEWS
+    """
+    return gfapy.LinesView(self, collection)
+
+  def _storages(self, collection):
+    """The dictionaries, in which the lines of a collection are stored."""
+    r = self._records
+    if collection == "segments":
+      return [r["S"]]
+    elif collection == "edges":
+      if self._version == "gfa1":
+        return [r["L"], r["C"]]
+      elif self._version == "gfa2":
+        return [r["E"]]
+      else:
+        return [r["L"], r["C"], r["E"]]
+    elif collection == "dovetails":
+      if self._version == "gfa1":
+        return [r["L"]]
+      elif self._version == "gfa2":
+        return [self._gfa2_dovetails]
+      else:
+        return [r["L"], self._gfa2_dovetails]
+    elif collection == "containments":
+      if self._version == "gfa1":
+        return [r["C"]]
+      elif self._version == "gfa2":
+        return [self._gfa2_containments]
+      else:
+        return [r["C"], self._gfa2_containments]
+    elif collection == "paths":
+      return [r["P"], r["O"]]
+    elif collection == "fragments":
+      return list(r["F"].values())
+    elif collection == "sets":
+      return [r["U"]]
+    elif collection == "gaps":
+      return [r["G"]]
+    elif collection == "comments":
+      return [r["#"]]
+    else:
+      raise gfapy.ArgumentError(
+          "Unknown collection of lines: {}\n".format(collection)+
+          "Known collections: {}".format(", ".join(self.VIEWS)))
+
   @property
   def _gfa1_containments(self):
     d = self._records["C"]
@@ -32,6 +32,163 @@ class Creators:
 
   append = add_line
 
+  ADD_LINES_ORDER = {"H": 0, "#": 0, "S": 1, "L": 2, "C": 2, "E": 2,
+                     "F": 3, "G": 3, "P": 4, "O": 4, "U": 4}
+  """Order in which add_lines() adds the lines, depending on the record type.
+
+  Lines are added after the lines they can refer to; lines of record types
+  not listed here (custom records) are added last.
+  """
+
+  def add_lines(self, gfa_lines):
+    """Add multiple lines to a GFA instance.
+
+    Differently from calling add_line() on each line, the lines are not
+    added in the order of the input, but sorted by record type, so that
+    the lines which are referenced by other lines (e.g. segments) are added
+    before the lines referencing them (e.g. links or paths). Thereby no
+    virtual line is created, when the referenced line is contained in the
+    input (see the references chapter of the manual). Groups are added after
+    the groups they refer to, if these are contained in the input
+    (except in case of circular references); otherwise, the order of the
+    lines of the same record type is kept. Comments are added in the order
+    of the input, together with the header lines; the Gfa instance does
+    not store their position relative to the other lines.
+
+    Parameters:
+      gfa_lines (iterable of str or Line): the lines to add, as line
+        instances or strings, containing a line of a GFA file
+
+    Raises:
+      gfapy.error.VersionError : If a wrong line type is used, for the GFA
+        version
+      gfapy.error.FormatError : If the content of a line string is
+        not valid
+    """
+    n_groups = max(self.ADD_LINES_ORDER.values()) + 2
+    groups = [[] for i in range(n_groups)]
+    for gfa_line in gfa_lines:
+      if gfa_line is None:
+        continue
+      if isinstance(gfa_line, str):
+        rt = gfa_line.split("\t", 1)[0]
+        if rt.startswith("#"):
+          rt = "#"
+      else:
+        rt = gfa_line.record_type
+      groups[self.ADD_LINES_ORDER.get(rt, n_groups - 1)].append(gfa_line)
+    # groups referring to groups are added after them, so that no virtual
+    # line is created; afterwards the order of the input is restored
+    i = self.ADD_LINES_ORDER["O"]
+    items = [self.__group_items(gfa_line) for gfa_line in groups[i]]
+    order = self.__group_order(items)
+    if order is not None:
+      groups[i] = [groups[i][j] for j in order]
+      n_stored = {rt: len(self._records.get(rt, {})) for rt in ["O", "U"]}
+    if self._progress:
+      n_lines = sum([len(group) for group in groups])
+      self._progress_log_init("add_lines", "lines", n_lines,
+                              "Adding {} lines".format(n_lines))
+    for group in groups:
+      for gfa_line in group:
+        self.add_line(gfa_line)
+        if self._progress:
+          self._progress_log("add_lines")
+    if order is not None:
+      self.__restore_group_order(items, order, n_stored)
+    if self._progress:
+      self._progress_log_end("add_lines")
+
+  @staticmethod
+  def __group_items(gfa_line):
+    """Record type and name of a group line, and identifiers of its items.
+
+    Returns:
+      (str, str, list of str) : the name is None and the list of items
+        is empty, for lines which are not GFA2 groups
+    """
+    if isinstance(gfa_line, str):
+      fields = gfa_line.split("\t", 3)
+      rt = fields[0]
+      if rt not in ["O", "U"] or len(fields) < 3:
+        return rt, None, []
+      items = fields[2].split(" ")
+      if rt == "O":
+        items = [item[:-1] for item in items]
+      return rt, fields[1], items
+    rt = gfa_line.record_type
+    if rt not in ["O", "U"]:
+      return rt, None, []
+    items = gfa_line.get("items")
+    if not isinstance(items, list):
+      items = []
+    return rt, gfa_line.name, [item if isinstance(item, str) else item.name \
+                               for item in items]
+
+  @staticmethod
+  def __group_order(items):
+    """Order in which group lines are added, after the groups they refer to.
+
+    References to groups not contained in the input and circular references
+    are ignored.
+
+    Parameters:
+      items (list) : the output of __group_items for each line
+
+    Returns:
+      list of int or None : indices of the lines; None if the order
+        of the input can be kept
+    """
+    index = {}
+    for i, (_, name, _) in enumerate(items):
+      if name is not None and name != "*":
+        index.setdefault(name, i)
+    if not index:
+      return None
+    visited = [False] * len(items)
+    order = []
+    for i in range(len(items)):
+      if visited[i]:
+        continue
+      visited[i] = True
+      stack = [(i, iter(items[i][2]))]
+      while stack:
+        j, refs = stack[-1]
+        for ref in refs:
+          k = index.get(ref)
+          if k is not None and not visited[k]:
+            visited[k] = True
+            stack.append((k, iter(items[k][2])))
+            break
+        else:
+          stack.pop()
+          order.append(j)
+    if order == list(range(len(items))):
+      return None
+    return order
+
+  def __restore_group_order(self, items, order, n_stored):
+    """Sort the groups added in the given order as in the input.
+
+    Parameters:
+      n_stored (dict) : number of groups of each record type stored before
+        adding the lines; the groups added later follow them
+    """
+    for rt in ["O", "U"]:
+      records = self._records.get(rt)
+      if records is None:
+        continue
+      positions = [j for j in order if items[j][0] == rt]
+      keys = list(records.keys())
+      added = keys[n_stored[rt]:]
+      if len(added) != len(positions):
+        # lines queued until the version is known
+        continue
+      keys[n_stored[rt]:] = [key for _, key in sorted(zip(positions, added))]
+      lines = [records[key] for key in keys]
+      records.clear()
+      records.update(zip(keys, lines))
+
   def process_line_queue(self):
     """Process the lines kept by side while parsing GFA of unknown version.
 
@@ -48,6 +205,23 @@ class Creators:
       self.add_line(self._line_queue[i])
     self._line_queue = []
 
+  def __classify_gfa2_edge(self, gfa_line):
+    # the positions cannot be changed while the line is connected, thus
+    # the alignment type is computed only once, when the line is registered
+    data = gfa_line._data
+    if any(data.get(f) is None for f in ["sid1", "sid2", "beg1", "end1",
+                                         "beg2", "end2"]):
+      return
+    try:
+      alignment_type = gfa_line._alignment_type
+    except gfapy.Error:
+      # invalid positions, reported on validation
+      return
+    if alignment_type == "L":
+      self._gfa2_dovetails[id(gfa_line)] = gfa_line
+    elif alignment_type == "C":
+      self._gfa2_containments[id(gfa_line)] = gfa_line
+
   def _register_line(self, gfa_line):
     self._api_private_check_gfa_line(gfa_line, "_register_line")
     storage_key = gfa_line.__class__.STORAGE_KEY
@@ -73,6 +247,36 @@ class Creators:
       if gfa_line.record_type not in self._records:
         self._records[gfa_line.record_type] = {}
       self._records[gfa_line.record_type][id(gfa_line)] = gfa_line
+    if gfa_line.record_type == "L":
+      self._index_link(gfa_line)
+    elif gfa_line.record_type == "E":
+      self.__classify_gfa2_edge(gfa_line)
+    elif gfa_line.record_type == "S":
+      # renamed segment or virtual segment substituted by a real one
+      for l in self._segment_links(gfa_line):
+        self._index_link(l)
+    if self._segment_table is not None:
+      self._segment_table._register(gfa_line)
+
+  def _add_unique_line(self, gfa_line):
+    """Connect a line, which is known not to be a duplicate.
+
+    Used for lines copied from a valid Gfa instance (e.g. by clone()). The
+    search for duplicates of links is skipped, as it requires the alignments
+    to be decoded. The data of header lines is merged into the header.
+    """
+    if gfa_line.record_type == "H":
+      self.header._data.update(gfa_line._data)
+      if not gfa_line._decoded:
+        self.header._decoded = False
+      for tagname, datatype in gfa_line._datatype.items():
+        self.header._store_datatype(tagname, datatype)
+    elif gfa_line.record_type == "L":
+      gfa_line._gfa = self
+      gfa_line._initialize_references()
+      self._register_line(gfa_line)
+    else:
+      gfa_line.connect(self)
 
   def __add_line_unknown_version(self, gfa_line):
     if isinstance(gfa_line, str):
@@ -89,7 +293,7 @@ class Creators:
     elif rt == "H":
       self._n_input_header_lines += 1
       if isinstance(gfa_line, str):
-        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel,
+        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel, lazy=self._lazy,
             dialect=self._dialect)
       self.header._merge(gfa_line)
       if gfa_line.VN:
@@ -105,7 +309,7 @@ class Creators:
         self.process_line_queue()
     elif rt == "S":
       if isinstance(gfa_line, str):
-        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel,
+        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel, lazy=self._lazy,
             dialect=self._dialect)
       self._version = gfa_line.version
       self._version_explanation = \
@@ -116,7 +320,7 @@ class Creators:
       self._version = "gfa2"
       self._version_explanation = "implied by: presence of a {} line".format(rt)
       if isinstance(gfa_line, str):
-        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel,
+        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel, lazy=self._lazy,
             version=self._version, dialect=self._dialect)
       self.process_line_queue()
       gfa_line.connect(self)
@@ -129,10 +333,10 @@ class Creators:
   def __add_line_GFA1(self, gfa_line):
     if isinstance(gfa_line, str):
       if gfa_line[0] == "S":
-        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel,
+        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel, lazy=self._lazy,
             dialect=self._dialect)
       else:
-        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel,
+        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel, lazy=self._lazy,
             dialect=self._dialect, version="gfa1")
     elif gfa_line.__class__ in gfapy.Lines.GFA2Specific:
       raise gfapy.VersionError(
@@ -163,10 +367,10 @@ class Creators:
   def __add_line_GFA2(self, gfa_line):
     if isinstance(gfa_line, str):
       if gfa_line[0] == "S":
-        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel,
+        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel, lazy=self._lazy,
             dialect=self._dialect)
       else:
-        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel,
+        gfa_line = gfapy.Line(gfa_line, vlevel=self._vlevel, lazy=self._lazy,
                                         version="gfa2", dialect=self._dialect)
     elif gfa_line.__class__ in gfapy.Lines.GFA1Specific:
       raise gfapy.VersionError(
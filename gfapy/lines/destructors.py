@@ -16,16 +16,102 @@ class Destructors:
     """
     self.try_get_line(gfa_line).disconnect()
 
+  def rm_many(self, gfa_lines):
+    """Remove multiple lines from the Gfa instance.
+
+    The result is the same as calling rm() on each of the lines, but the
+    lines depending on the removed lines (e.g. the edges of a removed
+    segment) are collected first, and the references to the removed lines
+    are deleted from each of the remaining lines in a single pass.
+
+    Parameters:
+      gfa_lines (iterable of Line or str): the lines or their identifiers
+
+    Raises:
+      gfapy.error.NotFoundError : if a line is specified using an identifier,
+        and no line exists in the Gfa instance, with that identifier
+      gfapy.error.RuntimeError : if a line is not connected to the Gfa
+        instance
+    """
+    removed = {}
+    to_remove = []
+    for gfa_line in gfa_lines:
+      gfa_line = self.try_get_line(gfa_line)
+      if gfa_line._gfa is not self:
+        raise gfapy.RuntimeError(
+          "Line {} is not connected to the GFA instance".format(gfa_line))
+      self.__collect_removed(gfa_line, removed, to_remove)
+    # (remaining line, removed lines, keys of the references to them)
+    backreferences = {}
+    for gfa_line in to_remove:
+      for k in gfa_line.__class__.REFERENCE_FIELDS:
+        self.__collect_backreferences(backreferences, removed, gfa_line, k,
+                                      gfa_line.get(k))
+      for k in gfa_line.__class__.OTHER_REFERENCES:
+        self.__collect_backreferences(backreferences, removed, gfa_line, k,
+                                      gfa_line._refs.get(k))
+    for ref, oldrefs, keys in backreferences.values():
+      ref._remove_references(oldrefs, keys)
+    for gfa_line in to_remove:
+      gfa_line._remove_field_references()
+      gfa_line._remove_nonfield_references()
+      self._unregister_line(gfa_line, update_segment_table = False)
+      gfa_line._gfa = None
+    if self._segment_table is not None:
+      self._segment_table._unregister_many(to_remove,
+          [ref for ref, oldrefs, keys in backreferences.values() \
+           if ref.record_type == "S"])
+
+  def __collect_removed(self, gfa_line, removed, to_remove):
+    """Add a line to to_remove, after the lines depending on it.
+
+    The order is the same in which rm() disconnects the lines.
+    """
+    if id(gfa_line) in removed:
+      return
+    removed[id(gfa_line)] = gfa_line
+    for k in gfa_line.__class__.DEPENDENT_LINES:
+      for dependent in self.__lines_in_reference(gfa_line._refs.get(k)):
+        self.__collect_removed(dependent, removed, to_remove)
+    to_remove.append(gfa_line)
+
+  @staticmethod
+  def __lines_in_reference(ref):
+    if isinstance(ref, gfapy.Line):
+      yield ref
+    elif isinstance(ref, gfapy.OrientedLine):
+      if isinstance(ref.line, gfapy.Line):
+        yield ref.line
+    elif ref:
+      for elem in ref:
+        if isinstance(elem, gfapy.Line):
+          yield elem
+        elif isinstance(elem, gfapy.OrientedLine) and \
+            isinstance(elem.line, gfapy.Line):
+          yield elem.line
+
+  def __collect_backreferences(self, backreferences, removed, gfa_line, k,
+                               ref):
+    for line in self.__lines_in_reference(ref):
+      if removed.get(id(line)) is line:
+        continue
+      entry = backreferences.get(id(line))
+      if entry is None:
+        entry = (line, {}, set())
+        backreferences[id(line)] = entry
+      entry[1][id(gfa_line)] = gfa_line
+      entry[2].update(line._backreference_keys(gfa_line, k))
+
   def _delete_other_links(self, segment_end, other_end,
                          conserve_components = False):
     segment_end = gfapy.SegmentEnd(segment_end)
     other_end = gfapy.SegmentEnd(other_end)
     s = self.try_get_segment(segment_end.segment)
-    for d in s.dovetails_of_end(segment_end.end_type):
+    for d in list(s.dovetails_of_end(segment_end.end_type)):
       if not conserve_components or not self.is_cut_link(d):
         d.disconnect()
 
-  def _unregister_line(self, gfa_line):
+  def _unregister_line(self, gfa_line, update_segment_table = True):
     self._api_private_check_gfa_line(gfa_line, "unregister_line")
     rt = gfa_line.record_type
     if rt == "H":
@@ -46,3 +132,13 @@ class Destructors:
         self._records[rt].pop(subkey)
     else:
       collection.pop(id(gfa_line))
+    if rt == "L":
+      self._unindex_link(gfa_line)
+    elif rt == "E":
+      self._gfa2_dovetails.pop(id(gfa_line), None)
+      self._gfa2_containments.pop(id(gfa_line), None)
+    elif rt == "S":
+      for l in self._segment_links(gfa_line):
+        self._unindex_link(l)
+    if update_segment_table and self._segment_table is not None:
+      self._segment_table._unregister(gfa_line)
@@ -91,6 +91,10 @@ class Finders:
 
   def _search_duplicate(self, gfa_line):
     if gfa_line.record_type == "L":
+      # the fields (e.g. the overlap) of lazy lines are decoded only if
+      # other links between the same segment ends exist
+      if self._link_key_of(gfa_line) not in self._link_index:
+        return None
       return self._search_link(gfa_line.oriented_from, gfa_line.oriented_to,
                                gfa_line.alignment)
     elif gfa_line.record_type in self.RECORDS_WITH_NAME:
@@ -99,15 +103,83 @@ class Finders:
       return None
 
   def _search_link(self, orseg1, orseg2, cigar):
-    s = self.segment(orseg1.line)
-    if s is None:
+    candidates = self._link_index.get(self._link_key(orseg1.name,
+        orseg1.orient, orseg2.name, orseg2.orient))
+    if candidates is None:
       return None
-    for l in s.dovetails:
-      if isinstance(l, gfapy.line.edge.Link) and \
-          l.is_compatible(orseg1, orseg2, cigar, True):
+    if isinstance(candidates, gfapy.Line):
+      candidates = (candidates,)
+    for l in candidates:
+      if l.is_compatible(orseg1, orseg2, cigar, True):
         return l
     return None
 
+  @staticmethod
+  def _link_key(from_name, from_orient, to_name, to_orient):
+    """Key of the links between two segment ends in the link index.
+
+    The key is the same for a link and its complement: it is the pair of
+    segment ends (segment name, end type), connected by the link, sorted
+    and flattened into a single tuple (name1, end1, name2, end2).
+    """
+    from_et = "R" if from_orient == "+" else "L"
+    to_et = "L" if to_orient == "+" else "R"
+    if (to_et < from_et) if to_name == from_name else (to_name < from_name):
+      return (to_name, to_et, from_name, from_et)
+    return (from_name, from_et, to_name, to_et)
+
+  @staticmethod
+  def _link_key_of(link):
+    data = link._data
+    from_segment = data.get("from_segment")
+    to_segment = data.get("to_segment")
+    if isinstance(from_segment, gfapy.Line):
+      from_segment = from_segment.name
+    if isinstance(to_segment, gfapy.Line):
+      to_segment = to_segment.name
+    return Finders._link_key(from_segment, data.get("from_orient"),
+                             to_segment, data.get("to_orient"))
+
+  def _index_link(self, link):
+    """Add a link to the link index.
+
+    Most pairs of segment ends are connected by a single link, which is
+    then stored directly as value of the index; a list is only used for
+    the pairs connected by multiple links.
+    """
+    key = self._link_key_of(link)
+    bucket = self._link_index.get(key)
+    if bucket is None:
+      self._link_index[key] = link
+    elif isinstance(bucket, gfapy.Line):
+      if bucket is not link:
+        self._link_index[key] = [bucket, link]
+    elif not any(l is link for l in bucket):
+      bucket.append(link)
+
+  def _unindex_link(self, link):
+    key = self._link_key_of(link)
+    bucket = self._link_index.get(key)
+    if bucket is None:
+      return
+    if isinstance(bucket, gfapy.Line):
+      if bucket is link:
+        del self._link_index[key]
+      return
+    bucket[:] = [l for l in bucket if l is not link]
+    if len(bucket) == 1:
+      self._link_index[key] = bucket[0]
+    elif not bucket:
+      del self._link_index[key]
+
+  def _segment_links(self, segment):
+    """Links of a segment, whose keys in the link index contain its name."""
+    refs = segment._refs or {}
+    for key in ["dovetails_L", "dovetails_R"]:
+      for l in refs.get(key, ()):
+        if l.record_type == "L":
+          yield l
+
   def __line_by_name(self, name):
     for rt in self.RECORDS_WITH_NAME:
       if rt not in self._records:
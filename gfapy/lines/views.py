@@ -0,0 +1,49 @@
+import gfapy
+
+class LinesView:
+  """Live view of a collection of lines of a Gfa instance.
+
+  Differently from the lists returned by the properties of the Gfa instance
+  (e.g. segments), the view does not copy the lines: the length, the
+  iteration and the membership tests use the storage of the Gfa instance
+  and always reflect its current content.
+
+  Note:
+    the Gfa instance shall not be modified while iterating over the view;
+    for this, a list shall be used (e.g. list(view))
+
+  Parameters:
+    gfa (gfapy.Gfa) : the Gfa instance
+    collection (str) : the collection of lines (see `Collections.view`)
+  """
+
+  def __init__(self, gfa, collection):
+    self._gfa = gfa
+    self._collection = collection
+    gfa._storages(collection) # check the collection name
+
+  def __len__(self):
+    return sum(len(d) for d in self._gfa._storages(self._collection))
+
+  def __iter__(self):
+    for d in self._gfa._storages(self._collection):
+      yield from d.values()
+
+  def __contains__(self, item):
+    """Is a line (or the line with a given name) in the collection?"""
+    if not isinstance(item, gfapy.Line):
+      item = self._gfa.line(item)
+      if item is None:
+        return False
+    name = item.get("name")
+    for d in self._gfa._storages(self._collection):
+      if d.get(id(item)) is item:
+        return True
+      if name is not None and not gfapy.is_placeholder(name) and \
+          d.get(name) is item:
+        return True
+    return False
+
+  def __repr__(self):
+    return "<gfapy.LinesView of the {} ({} lines)>".format(
+        self._collection, len(self))
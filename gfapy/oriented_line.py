@@ -21,6 +21,8 @@ class OrientedLine:
       orientation the second
   """
 
+  __slots__ = ("__line", "__orient", "__editable")
+
   def __new__(cls, *args):
     if isinstance(args[0], OrientedLine):
       return args[0]
@@ -151,6 +153,10 @@ class OrientedLine:
   def __getattr__(self, name):
     return getattr(self.__line, name)
 
+  def __reduce__(self):
+    # required for pickling, as attribute lookups are delegated to the line
+    return (self.__class__, (self.__line, self.__orient))
+
   def _block(self):
     self.__editable = False
 
@@ -0,0 +1,187 @@
+import gfapy
+import re
+from bisect import bisect_right
+
+_BASES = "ACGT"
+_PACK_TABLE = str.maketrans("ACGTacgt", "01230123")
+_UNPACK_TABLE = {ord("{:x}".format(i)): _BASES[i >> 2] + _BASES[i & 3] \
+                 for i in range(16)}
+# complement of each base in a byte (3 - code) and reversal of the
+# order of the four bases in the byte
+_RC_BYTE_TABLE = bytes(sum((3 - ((b >> (2 * i)) & 3)) << (2 * (3 - i)) \
+                           for i in range(4)) for b in range(256))
+_NON_ACGT_RE = re.compile(r"[^ACGTacgt]+")
+_LOWERCASE_RE = re.compile(r"[a-z]+")
+
+class PackedSequence:
+  """Nucleotidic sequence stored using 2 bits for each base.
+
+  The bases A, C, G and T are stored using 2 bits each. Any other character
+  (e.g. N or other IUPAC codes) is stored in a list of exceptions, as runs
+  of consecutive characters; lower case characters are stored as runs of
+  positions. Thus the memory usage is about a quarter of that of a string,
+  for sequences which mainly consist of ACGT.
+
+  Instances can be used as value of the sequence field of segments (see
+  `Gfa.pack_sequences`). They support the operations of strings usually
+  applied to sequences (length, indexing, slicing, iteration, comparison,
+  concatenation); the conversion to string unpacks the sequence.
+  The reverse complement (see `gfapy.sequence.rc`) is computed on the
+  packed representation.
+
+  Parameters:
+    sequence (str) : the sequence to pack
+  """
+
+  def __init__(self, sequence):
+    sequence = str(sequence)
+    self._length = len(sequence)
+    self._exceptions = [(m.start(), m.group()) \
+                        for m in _NON_ACGT_RE.finditer(sequence)]
+    self._lowercase = [m.span() for m in _LOWERCASE_RE.finditer(sequence)]
+    if self._exceptions:
+      sequence = _NON_ACGT_RE.sub(lambda m: "A" * len(m.group()), sequence)
+    self._data = self._pack(sequence)
+
+  @staticmethod
+  def _pack(sequence):
+    """Pack a sequence consisting only of ACGTacgt."""
+    if not sequence:
+      return b""
+    digits = sequence.translate(_PACK_TABLE)
+    digits += "0" * (-len(digits) % 4)
+    return int(digits, 4).to_bytes(len(digits) // 4, "big")
+
+  def _unpack(self, start, stop):
+    """Unpack the characters from start (included) to stop (excluded)."""
+    if start >= stop:
+      return ""
+    first = start // 4
+    last = (stop + 3) // 4
+    offset = start - first * 4
+    string = self._data[first:last].hex().translate(_UNPACK_TABLE)
+    string = string[offset:offset + stop - start]
+    if self._lowercase:
+      string = self._apply_runs(string, start, stop,
+          ((s, string[s-start:e-start].lower()) for s, e in \
+           self._overlapping(self._lowercase, start, stop)))
+    if self._exceptions:
+      string = self._apply_runs(string, start, stop,
+          self._overlapping(self._exceptions, start, stop))
+    return string
+
+  @staticmethod
+  def _overlapping(runs, start, stop):
+    """Runs (as (start, end) or (start, string)) overlapping a range."""
+    i = bisect_right(runs, (start,))
+    if i > 0:
+      i -= 1
+    while i < len(runs):
+      run = runs[i]
+      rstart = run[0]
+      if rstart >= stop:
+        break
+      rend = run[1] if isinstance(run[1], int) else rstart + len(run[1])
+      if rend > start:
+        if isinstance(run[1], int):
+          yield (max(rstart, start), min(rend, stop))
+        else:
+          yield (max(rstart, start),
+                 run[1][max(start - rstart, 0):stop - rstart])
+      i += 1
+
+  @staticmethod
+  def _apply_runs(string, start, stop, runs):
+    """Replace runs (start, substring) of a string starting at start."""
+    pieces = []
+    prev = 0
+    for rstart, substring in runs:
+      rstart -= start
+      pieces.append(string[prev:rstart])
+      pieces.append(substring)
+      prev = rstart + len(substring)
+    if not pieces:
+      return string
+    pieces.append(string[prev:])
+    return "".join(pieces)
+
+  def rc(self, valid = False):
+    """Reverse complement of the sequence.
+
+    The reverse complement of the bases stored in 2 bits is computed without
+    unpacking them; for the exceptions, see `gfapy.sequence.rc`.
+
+    Parameters:
+      valid (bool) : if True, the reverse complement of any invalid character
+        is the character itself
+
+    Returns:
+      gfapy.PackedSequence
+
+    Raises:
+      gfapy.error.ValueError : if the sequence contains characters without
+        a Watson-Crick complement
+    """
+    retval = PackedSequence.__new__(PackedSequence)
+    retval._length = self._length
+    nbytes = len(self._data)
+    data = self._data.translate(_RC_BYTE_TABLE)[::-1]
+    padding = nbytes * 4 - self._length
+    if padding:
+      # the padding bases are now at the beginning
+      value = int.from_bytes(data, "big") << (2 * padding)
+      data = (value & ((1 << (8 * nbytes)) - 1)).to_bytes(nbytes, "big")
+    retval._data = data
+    retval._exceptions = [(self._length - s - len(r),
+                           gfapy.sequence.rc(r, valid = valid)) \
+                          for s, r in reversed(self._exceptions)]
+    retval._lowercase = [(self._length - e, self._length - s) \
+                         for s, e in reversed(self._lowercase)]
+    return retval
+
+  def __str__(self):
+    return self._unpack(0, self._length)
+
+  def __repr__(self):
+    return "gfapy.PackedSequence({})".format(repr(str(self)))
+
+  def __len__(self):
+    return self._length
+
+  def __getitem__(self, key):
+    if isinstance(key, slice):
+      start, stop, step = key.indices(self._length)
+      if step != 1:
+        return str(self)[key]
+      return self._unpack(start, stop)
+    if key < 0:
+      key += self._length
+    if key < 0 or key >= self._length:
+      raise IndexError("sequence index out of range")
+    return self._unpack(key, key + 1)
+
+  def __iter__(self):
+    return iter(str(self))
+
+  def __eq__(self, other):
+    if isinstance(other, PackedSequence):
+      if self._length != other._length:
+        return False
+      if self._data == other._data and \
+          self._exceptions == other._exceptions and \
+          self._lowercase == other._lowercase:
+        return True
+      other = str(other)
+    if isinstance(other, str):
+      return len(other) == self._length and str(self) == other
+    else:
+      return NotImplemented
+
+  def __hash__(self):
+    return hash(str(self))
+
+  def __add__(self, other):
+    return str(self) + str(other)
+
+  def __radd__(self, other):
+    return str(other) + str(self)
@@ -0,0 +1,403 @@
+"""
+Reading of GFA files, line by line
+"""
+import gfapy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from gzip import GzipFile
+
+def iter_lines(filename, version = None, vlevel = 1, dialect = "standard",
+               gzipped = "auto", lazy = False, threads = 1,
+               record_types = None, drop_tags = None, load_sequences = True):
+  """Iterate over the lines of a GFA file, without constructing a Gfa.
+
+  Each line of the file is parsed into an instance of the appropriate
+  subclass of `~gfapy.line.line.Line`, which is yielded to the caller and
+  not stored anywhere. The lines are not connected to a Gfa instance, thus
+  references to other lines are not resolved and the reference fields
+  contain the identifiers of the referenced lines. Memory usage is
+  thereby independent from the size of the file.
+
+  If the version is not specified, it is determined while reading, from
+  the VN tag of the header, the syntax of the segment lines or the presence
+  of GFA2-specific record types. Lines which precede the line determining
+  the version are parsed as if the version was unknown (e.g. L lines are
+  parsed as GFA1 links). Empty lines are skipped.
+
+  Parameters:
+    filename (str) : the name of the GFA file
+    version (str) : 'gfa1' or 'gfa2'; default: determine the version
+      automatically
+    vlevel (int) : the validation level (default: 1)
+    dialect (str) : 'standard' (default) or 'rgfa'
+    gzipped : "auto" (default)/True/False; see `Gfa.read_file()`
+    lazy (bool) : if True, the fields of the lines are decoded only on
+      first access, and unmodified lines are output as the original string
+      (default: False)
+    threads (int) : number of threads for decompressing BGZF compressed
+      files (default: 1)
+    record_types, drop_tags, load_sequences : select the content
+      to load; see `Gfa.read_file()`
+
+  Returns:
+    generator of gfapy.Line
+
+  Raises:
+    ~gfapy.error.VersionError: if an unknown version is specified
+    ~gfapy.error.FormatError: if a line is invalid
+  """
+  if version not in ['gfa1', 'gfa2', None]:
+    raise gfapy.VersionError("GFA version unknown ({})".format(version))
+  projection = _projection(record_types, drop_tags, load_sequences)
+  for string in _iter_lines(filename, gzipped, threads, projection):
+    if not string:
+      continue
+    line = gfapy.Line(string, vlevel = vlevel, version = version,
+                      dialect = dialect, lazy = lazy)
+    if version is None:
+      version = _version_implied_by(line)
+    yield line
+
+def _version_implied_by(line):
+  """GFA version implied by a line, or None if the line does not imply it"""
+  rt = line.record_type
+  if rt == "H":
+    vn = line.VN
+    if vn == "1.0":
+      return "gfa1"
+    elif vn == "2.0":
+      return "gfa2"
+  elif rt == "S":
+    return line.version
+  elif rt in ["E", "F", "G", "U", "O"]:
+    return "gfa2"
+  return None
+
+def _is_gzipped(filename):
+  with open(filename, "rb") as f:
+    return f.read(2) == b"\x1f\x8b"
+
+def _iter_lines_and_offsets(filename, gzipped = "auto", threads = 1,
+                            projection = None):
+  """Iterate over the lines of a file, without line terminators.
+
+  Uncompressed files are read in binary mode, so that the offsets
+  are byte positions. BGZF compressed files are decompressed
+  by the given number of threads.
+
+  Parameters:
+    filename (str)
+    gzipped : "auto" (default)/True/False; if "auto", it is determined
+      automatically if the file is compressed
+    threads (int) : number of threads for decompressing BGZF files
+    projection (function) : applied to each line, see `_projection`
+
+  Returns:
+    generator of (str, int, int) : the lines, together with the offsets
+      of their beginning and end in the file; for gzipped files, the
+      offsets are approximate positions in the compressed data, which
+      can be used for progress logging
+  """
+  if projection is not None:
+    for string, start, end in \
+        _iter_lines_and_offsets(filename, gzipped, threads):
+      string = projection(string)
+      if string is not None:
+        yield string, start, end
+    return
+  if gzipped == "auto":
+    gzipped = _is_gzipped(filename)
+  if gzipped and gfapy.bgzf.is_bgzf(filename):
+    for voffset, string in gfapy.bgzf.iter_strings(filename, threads):
+      yield string, voffset >> 16, voffset >> 16
+    return
+  with open(filename, "rb") as f:
+    if gzipped:
+      with GzipFile(fileobj = f) as gzf:
+        start = 0
+        for string in gzf:
+          end = f.tell()
+          yield string.decode().rstrip("\r\n"), start, end
+          start = end
+    else:
+      start = 0
+      for string in f:
+        end = start + len(string)
+        yield string.decode().rstrip("\r\n"), start, end
+        start = end
+
+def _iter_lines(filename, gzipped = "auto", threads = 1, projection = None):
+  """Iterate over the lines of a file, without line terminators.
+
+  Same as `_iter_lines_and_offsets`, but only the lines are returned.
+  Uncompressed files are read in text mode, which is much faster than
+  computing the offsets of each line.
+
+  Returns:
+    generator of str
+  """
+  if gzipped == "auto":
+    gzipped = _is_gzipped(filename)
+  if gzipped:
+    for string, _, _ in _iter_lines_and_offsets(filename, True, threads,
+                                                projection):
+      yield string
+    return
+  with open(filename, encoding = "utf-8", newline = "\n") as f:
+    if projection is None:
+      for string in f:
+        yield string.rstrip("\r\n")
+    else:
+      for string in f:
+        string = projection(string.rstrip("\r\n"))
+        if string is not None:
+          yield string
+
+def _projection(record_types = None, drop_tags = None, load_sequences = True):
+  """Create a function selecting the content of the lines to load.
+
+  The function is applied to the strings of the lines, before
+  constructing the line instances.
+
+  Parameters:
+    record_types (set of str) : if specified, the lines of other record
+      types (except the header) are skipped; comments are
+      specified as '#'
+    drop_tags (set of str) : if specified, these tags are removed
+    load_sequences (bool) : if False, the sequences of the segments are
+      replaced by placeholders; in GFA1 segments, a LN tag is added, if
+      not present, which contains the sequence length
+
+  Returns:
+    function or None : the function returns the projected string, or None
+      if the line shall be skipped; None is returned instead of a function,
+      if all lines are loaded completely
+  """
+  if record_types is None and not drop_tags and load_sequences:
+    return None
+  def project(string):
+    tab = string.find("\t")
+    rt = string if tab < 0 else string[:tab]
+    if rt[:1] == "#":
+      rt = "#"
+    if record_types is not None and rt != "H" and rt not in record_types:
+      return None
+    if rt == "#" or tab < 0 or \
+        (not drop_tags and (load_sequences or rt != "S")):
+      return string
+    fields = string.split("\t")
+    n_positionals = _n_positional_fields(fields)
+    tags = fields[n_positionals:]
+    if drop_tags:
+      tags = [t for t in tags if t[:2] not in drop_tags]
+    if rt == "S" and not load_sequences and n_positionals in [3, 4]:
+      # GFA1: S name sequence; GFA2: S sid slen sequence
+      seqfield = n_positionals - 1
+      sequence = fields[seqfield]
+      if sequence != "*":
+        fields[seqfield] = "*"
+        if n_positionals == 3 and not any(t[:3] == "LN:" for t in tags):
+          tags.append("LN:i:{}".format(len(sequence)))
+    return "\t".join(fields[:n_positionals] + tags)
+  return project
+
+def _n_positional_fields(fields):
+  """Number of fields of a line (including the record type) before the tags.
+
+  The same criterion is used as for the recognition of the version of
+  segment lines: the tags are the trailing fields with the tag syntax.
+  """
+  n = len(fields)
+  while n > 1:
+    field = fields[n-1]
+    if len(field) < 5 or field[2] != ":" or field[4] != ":":
+      break
+    n -= 1
+  return n
+
+def _extract_sequence(string):
+  """Replace the sequence of a segment line string by a placeholder.
+
+  Returns:
+    (str, int, str) or None : the modified string, the offset of the
+      sequence in the original (encoded) string and the sequence; None if the
+      sequence is a placeholder, or the number of positional fields is invalid
+  """
+  fields = string.split("\t")
+  n_positionals = _n_positional_fields(fields)
+  if n_positionals not in [3, 4] or fields[n_positionals-1] == "*":
+    return None
+  # GFA1: S name sequence; GFA2: S sid slen sequence
+  seqfield = n_positionals - 1
+  sequence = fields[seqfield]
+  offset = len("\t".join(fields[:seqfield]).encode()) + 1
+  fields[seqfield] = "*"
+  return "\t".join(fields), offset, sequence
+
+def _with_sequence_handles(lines, store, in_place, vlevel = 1,
+                           dialect = "standard", lazy = False):
+  """Replace the sequences of segment lines by handles to a sequence store.
+
+  Parameters:
+    lines : generator of (str, int, int), see `_iter_lines_and_offsets`
+    store (gfapy.SequenceStore)
+    in_place (bool) : if True, the file of the store is the file from which
+      the lines are read; otherwise the sequences are added to the store
+    vlevel, dialect, lazy : used for the construction of the segments
+
+  Returns:
+    generator of (str or gfapy.Line, int, int) : segments with a
+      sequence are returned as line instances; other lines are not modified
+  """
+  for string, start, end in lines:
+    if string[:2] == "S\t":
+      extracted = _extract_sequence(string)
+      if extracted is not None:
+        string, offset, sequence = extracted
+        if in_place:
+          handle = store.handle(start + offset, len(sequence))
+        else:
+          handle = store.add(sequence)
+        string = _segment_with_handle(string, handle, sequence, vlevel,
+                                      dialect, lazy)
+    yield string, start, end
+
+def _segment_with_handle(string, handle, sequence, vlevel, dialect, lazy):
+  line = gfapy.Line(string, vlevel = vlevel, dialect = dialect, lazy = lazy)
+  if vlevel >= 1:
+    gfapy.Field._validate_gfa_field(sequence, line.get_datatype("sequence"),
+                                    "sequence")
+  line._data["sequence"] = handle
+  line._raw = None
+  return line
+
+def _detect_version(filename):
+  """Determine the version of an uncompressed GFA file from its first lines.
+
+  Returns:
+    str or None : 'gfa1' or 'gfa2'; None if no line implies the version
+  """
+  for string in _iter_lines(filename, False):
+    rt = string[:string.find("\t")]
+    if rt in ["H", "S"]:
+      version = _version_implied_by(gfapy.Line(string, vlevel = 0))
+      if version is not None:
+        return version
+    elif rt in ["E", "F", "G", "U", "O"]:
+      return "gfa2"
+  return None
+
+def _chunk_boundaries(filename, n_chunks):
+  """Split a file into byte ranges, aligned to line boundaries.
+
+  Returns:
+    list of (int, int) : start and end offsets of the chunks
+  """
+  size = os.path.getsize(filename)
+  offsets = [0]
+  with open(filename, "rb") as f:
+    for i in range(1, n_chunks):
+      pos = (size * i) // n_chunks
+      if pos <= offsets[-1]:
+        continue
+      f.seek(pos - 1)
+      f.readline()
+      pos = f.tell()
+      if pos >= size:
+        break
+      if pos > offsets[-1]:
+        offsets.append(pos)
+  offsets.append(size)
+  return list(zip(offsets[:-1], offsets[1:]))
+
+def _parse_chunk(filename, start, end, version, vlevel, dialect, lazy,
+                 projection_args):
+  """Parse the lines in a byte range of a file (run in worker processes).
+
+  Lines are returned in a form which is cheap to transfer between processes:
+  a tuple (class, version, data, datatypes, raw, sequence) for each line,
+  where sequence is the offset and length of the sequence in the file,
+  if sequences are loaded on demand, otherwise None; the string itself
+  for header, comment and custom record lines, which are constructed by
+  the parent process.
+  """
+  with open(filename, "rb") as f:
+    f.seek(start)
+    content = f.read(end - start)
+  projection = _projection(*projection_args)
+  on_demand = (projection_args[2] == "on_demand")
+  parsed = []
+  linestart = start
+  for string in content.split(b"\n"):
+    offset = linestart
+    linestart += len(string) + 1
+    string = string.decode().rstrip("\r")
+    if projection is not None:
+      string = projection(string)
+    if not string:
+      continue
+    if string[0] in "#H":
+      parsed.append(string)
+      continue
+    sequence = None
+    if on_demand and string[:2] == "S\t":
+      extracted = _extract_sequence(string)
+      if extracted is not None:
+        string, seqoffset, sequence = extracted
+    line = gfapy.Line(string, vlevel = vlevel, version = version,
+                      dialect = dialect, lazy = lazy)
+    if isinstance(line, gfapy.line.CustomRecord):
+      parsed.append(string)
+      continue
+    if sequence is not None:
+      if vlevel >= 1:
+        gfapy.Field._validate_gfa_field(sequence,
+            line.get_datatype("sequence"), "sequence")
+      sequence = (offset + seqoffset, len(sequence))
+    parsed.append((line.__class__, line._version, line._data,
+                   dict(line._datatype), line._raw, sequence))
+  return parsed
+
+def _iter_chunks_parallel(filename, workers, version = None, vlevel = 1,
+                          dialect = "standard", lazy = False,
+                          record_types = None, drop_tags = None,
+                          load_sequences = True, sequence_store = None):
+  """Parse an uncompressed GFA file using multiple processes.
+
+  The file is split into chunks of lines, which are parsed by a pool of
+  worker processes. The lines are instantiated in the calling process.
+  For record_types, drop_tags and load_sequences see `_projection`;
+  if load_sequences is 'on_demand', the sequences are replaced by handles
+  to the sequence_store, which must refer to the file itself.
+
+  Returns:
+    generator of list of (gfapy.Line or str) : the lines of each chunk
+      (in the order of the file); header, comment and custom record lines
+      are returned as strings
+  """
+  if version is None:
+    version = _detect_version(filename)
+  chunks = _chunk_boundaries(filename, workers * 4)
+  n = len(chunks)
+  projection_args = (record_types, drop_tags, load_sequences)
+  with ProcessPoolExecutor(max_workers = workers) as executor:
+    for parsed in executor.map(_parse_chunk, [filename] * n,
+                               [c[0] for c in chunks], [c[1] for c in chunks],
+                               [version] * n, [vlevel] * n, [dialect] * n,
+                               [lazy] * n, [projection_args] * n):
+      yield [_line_from_parsed(item, vlevel, dialect, sequence_store) \
+             for item in parsed]
+
+def _line_from_parsed(item, vlevel, dialect, sequence_store = None):
+  if isinstance(item, str):
+    return item
+  cls, version, data, datatype, raw, sequence = item
+  line = cls(data, vlevel = vlevel, version = version, dialect = dialect)
+  for fieldname, t in datatype.items():
+    line._store_datatype(fieldname, t)
+  line._raw = raw
+  line._decoded = raw is None
+  if sequence is not None:
+    line._data["sequence"] = sequence_store.handle(*sequence)
+    line._raw = None
+  return line
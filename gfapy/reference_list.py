@@ -0,0 +1,154 @@
+import gfapy
+
+class ReferenceList:
+  """Insertion-ordered collection of references to lines, keyed by identity.
+
+  Used for the collections of references (e.g. dovetails_L, paths) of lines
+  with many references. The lines are stored in a dict, indexed by their
+  ``id()``, so that references are added and removed in constant time,
+  while the iteration follows the order in which they were added. A line
+  can be contained more than once (e.g. a link connecting an end of a
+  segment to itself); its occurrences are counted and iterated consecutively.
+
+  The instances support the read-only operations of lists (len, iteration,
+  indexing, membership tests, comparison and concatenation with lists).
+  Iteration is done on a snapshot of the references, thus lines can be
+  disconnected while iterating over a collection.
+
+  Parameters:
+    lines (iterable) : the initial content
+  """
+
+  __slots__ = ("_lines", "_counts")
+
+  THRESHOLD = 16
+  """Number of references, above which a list is replaced by a
+  ReferenceList (see `Connection._add_reference`)."""
+
+  def __init__(self, lines = ()):
+    self._lines = {}
+    self._counts = {}
+    for line in lines:
+      self.append(line)
+
+  def append(self, line):
+    """Add a reference after the existing ones."""
+    key = id(line)
+    if key in self._lines:
+      self._counts[key] = self._counts.get(key, 1) + 1
+    else:
+      self._lines[key] = line
+
+  def insert(self, index, line):
+    """Add a reference; the index must be 0 or the number of references.
+
+    If the line is already contained, the new occurrence is placed
+    next to the existing ones.
+    """
+    if index != 0 and index != len(self):
+      raise gfapy.ArgumentError(
+          "References can only be inserted at the beginning or at the end")
+    key = id(line)
+    if index == 0 and key not in self._lines:
+      lines = {key: line}
+      lines.update(self._lines)
+      self._lines = lines
+    else:
+      self.append(line)
+
+  def discard(self, line):
+    """Remove an occurrence of a reference, if it is contained."""
+    key = id(line)
+    if self._lines.get(key) is not line:
+      return
+    count = self._counts.get(key)
+    if count is None:
+      del self._lines[key]
+    elif count == 2:
+      del self._counts[key]
+    else:
+      self._counts[key] = count - 1
+
+  def pop(self, index = -1):
+    """Remove and return the first (index 0) or last (index -1) reference."""
+    if index == 0:
+      line = self._lines[next(iter(self._lines))]
+    elif index == -1:
+      line = self._lines[next(reversed(self._lines))]
+    else:
+      raise gfapy.ArgumentError(
+          "Only the first or last reference can be removed by position")
+    self.discard(line)
+    return line
+
+  def replace(self, oldref, newref):
+    """Replace all occurrences of a reference, keeping their position.
+
+    If newref is None, the occurrences are removed (in constant time).
+    """
+    key = id(oldref)
+    if self._lines.get(key) is not oldref:
+      return
+    count = self._counts.pop(key, 1)
+    if newref is None or id(newref) in self._lines:
+      del self._lines[key]
+      if newref is not None:
+        newkey = id(newref)
+        self._counts[newkey] = self._counts.get(newkey, 1) + count
+      return
+    lines = {}
+    for k, line in self._lines.items():
+      if k != key:
+        lines[k] = line
+      else:
+        lines[id(newref)] = newref
+        if count > 1:
+          self._counts[id(newref)] = count
+    self._lines = lines
+
+  def copy(self):
+    """List of the references."""
+    return list(self)
+
+  def __len__(self):
+    return len(self._lines) + sum(self._counts.values()) - len(self._counts)
+
+  def __iter__(self):
+    # a snapshot is iterated, as the references may be removed meanwhile
+    # (e.g. disconnecting the lines of a collection in a loop)
+    if not self._counts:
+      return iter(list(self._lines.values()))
+    return iter(list(self.__iter_with_counts()))
+
+  def __iter_with_counts(self):
+    counts = self._counts
+    for key, line in self._lines.items():
+      for i in range(counts.get(key, 1)):
+        yield line
+
+  def __reversed__(self):
+    return reversed(list(self))
+
+  def __contains__(self, line):
+    return self._lines.get(id(line)) is line
+
+  def __getitem__(self, index):
+    if index == 0 and self._lines:
+      return self._lines[next(iter(self._lines))]
+    elif index == -1 and self._lines:
+      return self._lines[next(reversed(self._lines))]
+    return list(self)[index]
+
+  def __eq__(self, other):
+    if isinstance(other, (list, ReferenceList)):
+      return list(self) == list(other)
+    return NotImplemented
+
+  def __add__(self, other):
+    return list(self) + list(other)
+
+  def __radd__(self, other):
+    return list(other) + list(self)
+
+  def __repr__(self):
+    return "gfapy.ReferenceList({})".format(repr(list(self)))
@@ -19,7 +19,7 @@ class RGFA():
     if self._dialect != "rgfa":
       return []
     stable_seqs = set()
-    for s in self.segments:
+    for s in self.iter_segments():
       stable_seqs.add(s.SN)
     return list(stable_seqs)
 
@@ -37,8 +37,8 @@ class RGFA():
     self._validate_rgfa_no_headers()
     self._validate_rgfa_no_containments()
     self._validate_rgfa_no_paths()
-    self._validate_rgfa_tags_in_lines(self.segments)
-    self._validate_rgfa_tags_in_lines(self.dovetails)
+    self._validate_rgfa_tags_in_lines(self.iter_segments())
+    self._validate_rgfa_tags_in_lines(self.iter_dovetails())
     self._validate_rgfa_link_overlaps()
 
   def _validate_rgfa_version(self):
@@ -95,7 +95,7 @@ class RGFA():
               "offending line:\n{}".format(str(line)))
 
   def _validate_rgfa_link_overlaps(self):
-    for link in self.dovetails:
+    for link in self.iter_dovetails():
       if link.field_to_s("overlap") != "0M":
         raise gfapy.ValueError("rGFA CIGARs must be 0M\n",
               "offending line:\n{}".format(str(link)))
@@ -22,6 +22,8 @@ class SegmentEnd:
       end symbol the second
   """
 
+  __slots__ = ("__segment", "__end_type")
+
   def __new__(cls, *args):
     if isinstance(args[0], SegmentEnd):
       return args[0]
@@ -145,3 +147,7 @@ class SegmentEnd:
 
   def __getattr__(self, name):
     return getattr(self.__segment, name)
+
+  def __reduce__(self):
+    # required for pickling, as attribute lookups are delegated to the segment
+    return (self.__class__, (self.__segment, self.__end_type))
@@ -0,0 +1,326 @@
+import gfapy
+from array import array
+from functools import wraps
+
+_UNDEFINED = float("nan")
+
+class SegmentTable:
+  """Columnar representation of the segments of a Gfa instance.
+
+  Each segment is assigned a dense integer ID, which is the index of its row
+  in the columns of the table. The columns are arrays (see the array module of
+  the standard library) and contain, for each segment:
+
+  - ``length``: the length of the segment (-1 if not available)
+  - ``RC``, ``KC``, ``FC``: the values of the count tags (NaN if undefined)
+  - ``degree_L``, ``degree_R``: the number of dovetail overlaps of the
+    two ends of the segment
+
+  The table is kept in sync with the Gfa instance: rows are added and
+  removed when segments are added or removed, the degrees are updated when
+  edges are added or removed and the other values when the corresponding
+  fields of a segment are changed. The rows of removed segments are reused
+  for new segments, thus the IDs of the segments are dense, but they are
+  only valid until the segment is removed.
+
+  The table is only maintained after it has been requested explicitly (see
+  `Gfa.segment_table`), so that the instances which do not use it do not pay
+  the cost of maintaining it. Otherwise the graph operations which use the
+  table construct a temporary one, which is dropped when they return (see
+  `with_segment_table`).
+
+  Parameters:
+    gfa (gfapy.Gfa) : the instance whose segments shall be stored
+  """
+
+  COUNT_TAGS = ["RC", "KC", "FC"]
+  """Count tags, whose values are stored in the table."""
+
+  FIELDS = ["LN", "slen", "sequence"] + COUNT_TAGS
+  """Fields of the segments, whose changes are propagated to the table."""
+
+  def __init__(self, gfa):
+    self._gfa = gfa
+    self._lines = []
+    self._row = {}
+    self._free = []
+    self._adjacency = None
+    self._cut_index = None
+    self.length = array("q")
+    self.degree_L = array("q")
+    self.degree_R = array("q")
+    self._counts = {tag: array("d") for tag in self.COUNT_TAGS}
+    for segment in gfa.segments:
+      self._add_row(segment)
+
+  def __len__(self):
+    return len(self._row)
+
+  def __getattr__(self, name):
+    counts = self.__dict__.get("_counts")
+    if counts is not None and name in counts:
+      return counts[name]
+    raise AttributeError(name)
+
+  def segment_id(self, segment):
+    """The dense ID of a segment.
+
+    Parameters:
+      segment (str, gfapy.line.segment.GFA1, gfapy.line.segment.GFA2) :
+        a segment or its name
+
+    Raises:
+      gfapy.NotFoundError : if the segment is not contained in the table
+    """
+    if not isinstance(segment, gfapy.Line):
+      segment = self._gfa.try_get_segment(segment)
+    row = self._row.get(id(segment))
+    if row is None:
+      raise gfapy.NotFoundError(
+          "Segment {} not found in the segment table".format(segment.name))
+    return row
+
+  def segment(self, segment_id):
+    """The segment with a given dense ID, or None if the row is unused."""
+    return self._lines[segment_id]
+
+  @property
+  def adjacency(self):
+    """Adjacency of the segment ends (see `Adjacency`).
+
+    The adjacency is computed on demand, updated when edges are removed and
+    recomputed after segments or edges have been added.
+    """
+    if self._adjacency is None:
+      self._adjacency = gfapy.Adjacency(self)
+    return self._adjacency
+
+  def segment_end(self, node):
+    """The segment end corresponding to a node of the adjacency.
+
+    Returns:
+      gfapy.SegmentEnd : the segment is represented by its name
+    """
+    return gfapy.SegmentEnd(self._lines[node >> 1].name,
+                            "R" if node & 1 else "L")
+
+  @property
+  def segment_ids(self):
+    """The IDs of the rows of the table which are in use."""
+    return [i for i, line in enumerate(self._lines) if line is not None]
+
+  def count(self, count_tag):
+    """The column of the values of a count tag.
+
+    Parameters:
+      count_tag (str) : the count tag; if it is not one of COUNT_TAGS,
+        the values are collected from the segments
+
+    Returns:
+      array : NaN for unused rows and segments, where the tag is undefined
+    """
+    if count_tag in self._counts:
+      return self._counts[count_tag]
+    return array("d", [self._value(line, count_tag) if line is not None \
+                       else _UNDEFINED for line in self._lines])
+
+  def coverage(self, count_tag = "RC", unit_length = 1):
+    """Compute the coverage of all segments.
+
+    The values are computed as in `Coverage.coverage`, as
+    count / (length - unit_length + 1).
+
+    Parameters:
+      count_tag (str) : the count tag (RC, KC or FC)
+      unit_length (int) : the average length of the counted units
+
+    Returns:
+      array : the coverage of each row; NaN for unused rows and segments
+        whose count or length is undefined
+    """
+    delta = 1 - unit_length
+    return array("d", [c / (l + delta) if l > 0 else _UNDEFINED \
+                       for c, l in zip(self.count(count_tag), self.length)])
+
+  @staticmethod
+  def _value(line, tag):
+    value = line.get(tag)
+    return _UNDEFINED if value is None else float(value)
+
+  @staticmethod
+  def _length(line):
+    length = line.get("LN")
+    if length:
+      return length
+    sequence = line._data.get("sequence")
+    if gfapy.is_placeholder(sequence):
+      return -1
+    return len(sequence)
+
+  def _add_row(self, line):
+    if self._free:
+      row = self._free.pop()
+      self._lines[row] = line
+    else:
+      row = len(self._lines)
+      self._lines.append(line)
+      self.length.append(-1)
+      self.degree_L.append(0)
+      self.degree_R.append(0)
+      for column in self._counts.values():
+        column.append(_UNDEFINED)
+    self._row[id(line)] = row
+    self._update_row(line, row)
+    self._update_degrees(line, row)
+
+  def _update_row(self, line, row):
+    if line.virtual:
+      self.length[row] = -1
+      for column in self._counts.values():
+        column[row] = _UNDEFINED
+    else:
+      self.length[row] = self._length(line)
+      for tag, column in self._counts.items():
+        column[row] = self._value(line, tag)
+
+  def _update_degrees(self, line, row):
+    refs = line._refs or {}
+    self.degree_L[row] = len(refs.get("dovetails_L", ()))
+    self.degree_R[row] = len(refs.get("dovetails_R", ()))
+
+  def _segments_of_edge(self, edge):
+    if edge.record_type == "L":
+      refs = [edge.get("from_segment"), edge.get("to_segment")]
+    else:
+      refs = [edge.get("sid1"), edge.get("sid2")]
+    for ref in refs:
+      if isinstance(ref, gfapy.OrientedLine):
+        ref = ref.line
+      line = self._gfa.segment(ref)
+      if line is not None:
+        yield line
+
+  def _update_edge_segments(self, edge):
+    rows = []
+    for segment in self._segments_of_edge(edge):
+      row = self._row.get(id(segment))
+      if row is not None:
+        self._update_degrees(segment, row)
+        rows.append(row)
+    return rows
+
+  def _register(self, line):
+    rt = line.record_type
+    if rt == "S":
+      self._adjacency = None
+      self._cut_index = None
+      self._add_row(line)
+    elif rt == "L" or rt == "E":
+      self._adjacency = None
+      self._cut_index = None
+      self._update_edge_segments(line)
+
+  def _unregister(self, line):
+    rt = line.record_type
+    if rt == "S":
+      row = self._row.pop(id(line), None)
+      if row is not None:
+        self.__segment_removed_from_cut_index(row)
+        self.__remove_row(row)
+    elif rt == "L" or rt == "E":
+      # the references to the segments were already removed
+      rows = self._update_edge_segments(line)
+      if self._adjacency is not None:
+        self._adjacency._remove_edge(line, rows)
+      self.__edge_removed_from_cut_index(rows)
+
+  def _unregister_many(self, lines, segments):
+    """Remove multiple lines at once (see `Gfa.rm_many`).
+
+    Differently from _unregister, the adjacency and the cut index are
+    discarded, instead of being updated, and the degrees of each segment
+    are computed only once.
+
+    Parameters:
+      lines (list of gfapy.Line) : the removed lines
+      segments (list of gfapy.Line) : the remaining segments, whose
+        references to the removed lines were deleted
+    """
+    self._adjacency = None
+    self._cut_index = None
+    for line in lines:
+      if line.record_type == "S":
+        row = self._row.pop(id(line), None)
+        if row is not None:
+          self.__remove_row(row)
+    for segment in segments:
+      row = self._row.get(id(segment))
+      if row is not None:
+        self._update_degrees(segment, row)
+
+  def __remove_row(self, row):
+    self._lines[row] = None
+    self.length[row] = -1
+    self.degree_L[row] = 0
+    self.degree_R[row] = 0
+    for column in self._counts.values():
+      column[row] = _UNDEFINED
+    self._free.append(row)
+
+  def _field_changed(self, line, fieldname):
+    if fieldname in self.FIELDS and line.record_type == "S":
+      row = self._row.get(id(line))
+      if row is not None:
+        self._update_row(line, row)
+
+  def __segment_removed_from_cut_index(self, row):
+    cuts = self._cut_index
+    if cuts is None:
+      return
+    if cuts.articulation[row]:
+      self._cut_index = None
+    else:
+      cuts.dirty.update(cuts.blocks[cuts.block_of[row]])
+
+  def __edge_removed_from_cut_index(self, rows):
+    cuts = self._cut_index
+    if cuts is None:
+      return
+    for row in rows:
+      if not cuts.articulation[row]:
+        # the edge belongs to the only biconnected component of the segment
+        cuts.dirty.update(cuts.blocks[cuts.block_of[row]])
+        return
+    self._cut_index = None
+
+  @property
+  def cut_index(self):
+    """Articulation points and bridges of the graph (see `CutIndex`).
+
+    The index is computed on demand. It is kept when segments or edges are
+    removed, marking the segments whose information could be out of date
+    as dirty, and discarded when segments or edges are added or an
+    articulation point is removed.
+    """
+    if self._cut_index is None:
+      self._cut_index = gfapy.adjacency.CutIndex(self.adjacency)
+    return self._cut_index
+
+def with_segment_table(method):
+  """Decorator for the methods of Gfa which use the segment table.
+
+  If the segment table is not maintained by the Gfa instance, a temporary
+  table is constructed for the duration of the call, so that it is shared
+  by the nested calls and kept in sync with the changes done by the method,
+  and dropped afterwards.
+  """
+  @wraps(method)
+  def wrapper(self, *args, **kwargs):
+    if self._segment_table is not None:
+      return method(self, *args, **kwargs)
+    self._segment_table = SegmentTable(self)
+    try:
+      return method(self, *args, **kwargs)
+    finally:
+      self._segment_table = None
+  return wrapper
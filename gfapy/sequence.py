@@ -2,6 +2,7 @@
 Methods for processing strings as nucleotidic sequences
 """
 import gfapy
+import re
 
 def rc(sequence, valid = False, rna = False):
   """Compute the reverse complement of a nucleotidic sequence.
@@ -12,7 +13,9 @@ def rc(sequence, valid = False, rna = False):
 
   Returns
     str : reverse complement, without newlines and spaces;
-         	"*" if string is "*"
+         	"*" if string is "*"; if the sequence is a gfapy.PackedSequence
+          and rna is False, the reverse complement is computed on the packed
+          representation and a gfapy.PackedSequence is returned
 
   Parameters:
     sequence (str) : the sequence to reverse-complement
@@ -26,15 +29,34 @@ def rc(sequence, valid = False, rna = False):
       spaces or newline) is found
   """
   if gfapy.is_placeholder(sequence): return sequence
-  def fun(c):
-    wcc = WCC.get(c, c if valid else None)
-    if not wcc:
-      raise gfapy.ValueError("{}: no Watson-Crick complement for {}".format(sequence, c))
-    return wcc
-  retval = "".join(reversed([ fun(c) for c in sequence ]))
-  if rna:
-    retval = retval.translate(str.maketrans("tT", "uU"))
-  return retval
+  if isinstance(sequence, gfapy.PackedSequence):
+    if not rna:
+      return sequence.rc(valid = valid)
+    sequence = str(sequence)
+  if not valid:
+    m = _INVALID_RE.search(sequence)
+    if m:
+      raise gfapy.ValueError("{}: no Watson-Crick complement for {}"
+                             .format(sequence, m.group()))
+  return sequence.translate(_RC_RNA_TABLE if rna else _RC_TABLE)[::-1]
+
+def rc_many(sequences, valid = False, rna = False):
+  """Compute the reverse complement of multiple nucleotidic sequences.
+
+  The result is the same as applying `rc` to each of the sequences.
+
+  Parameters:
+    sequences (iterable of str) : the sequences to reverse-complement
+    valid (bool) : see `rc`
+    rna (bool) : see `rc`
+
+  Returns:
+    list : the reverse complements, in the same order as the sequences
+
+  Raises:
+    gfapy.error.ValueError : see `rc`
+  """
+  return [rc(s, valid = valid, rna = rna) for s in sequences]
 
 WCC = {"a":"t","t":"a","A":"T","T":"A",
        "c":"g","g":"c","C":"G","G":"C",
@@ -48,6 +70,11 @@ WCC = {"a":"t","t":"a","A":"T","T":"A",
        " ":"","\n":""}
 """Watson-Crick Complements"""
 
+_RC_TABLE = str.maketrans(WCC)
+_RC_RNA_TABLE = str.maketrans({c: wcc.translate(str.maketrans("tT", "uU")) \
+                               for c, wcc in WCC.items()})
+_INVALID_RE = re.compile("[^{}]".format(re.escape("".join(WCC.keys()))))
+
 def Sequence(string):
   """Parses the content of a sequence field.
 
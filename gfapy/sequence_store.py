@@ -0,0 +1,165 @@
+import gfapy
+import mmap
+import tempfile
+from collections import OrderedDict
+
+class SequenceStore:
+  """Sequences stored in a file and read on demand.
+
+  The sequences are read from the file using mmap, when they are accessed.
+  A cache of the recently read sequences is kept, whose total size is
+  limited by the cache_size parameter.
+
+  The file can be a GFA file, where the sequences are found at known
+  offsets, or a sidecar file, to which the sequences are written using
+  `add`.
+
+  Parameters:
+    filename (str) : the file containing the sequences; if None,
+      an anonymous temporary file is used, which is deleted when the store
+      is closed or garbage collected
+    cache_size (int) : maximal total length of the sequences kept in the
+      cache (default: 64 MiB)
+  """
+
+  DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+
+  def __init__(self, filename = None, cache_size = DEFAULT_CACHE_SIZE):
+    if filename is None:
+      self._file = tempfile.TemporaryFile()
+      self._size = 0
+      self._writable = True
+    else:
+      self._file = open(filename, "rb")
+      self._file.seek(0, 2)
+      self._size = self._file.tell()
+      self._writable = False
+    self._mmap = None
+    self._cache = OrderedDict()
+    self._cache_bytes = 0
+    self.cache_size = cache_size
+
+  def add(self, sequence):
+    """Write a sequence at the end of the file of the store.
+
+    Only possible for stores without filename (sidecar file).
+
+    Parameters:
+      sequence (str)
+
+    Returns:
+      gfapy.SequenceHandle
+    """
+    if not self._writable:
+      raise gfapy.RuntimeError(
+          "Sequences can only be added to the temporary file of a store")
+    data = sequence.encode()
+    self._file.seek(self._size)
+    self._file.write(data)
+    handle = SequenceHandle(self, self._size, len(data))
+    self._size += len(data)
+    return handle
+
+  def handle(self, offset, length):
+    """Handle for a sequence stored at a given position of the file.
+
+    Parameters:
+      offset (int) : position of the first byte of the sequence in the file
+      length (int) : length of the sequence
+
+    Returns:
+      gfapy.SequenceHandle
+    """
+    if offset < 0 or length < 0 or offset + length > self._size:
+      raise gfapy.ValueError(
+          "Sequence at offset {} with length {} ".format(offset, length)+
+          "is outside of the file (size: {})".format(self._size))
+    return SequenceHandle(self, offset, length)
+
+  def read(self, offset, length):
+    """Read a sequence from the store.
+
+    Parameters:
+      offset (int) : position of the first byte of the sequence in the file
+      length (int) : length of the sequence
+
+    Returns:
+      str
+    """
+    key = (offset, length)
+    sequence = self._cache.get(key)
+    if sequence is not None:
+      self._cache.move_to_end(key)
+      return sequence
+    if self._mmap is None or offset + length > len(self._mmap):
+      self._remap()
+    sequence = self._mmap[offset:offset+length].decode()
+    if length <= self.cache_size:
+      self._cache[key] = sequence
+      self._cache_bytes += length
+      while self._cache_bytes > self.cache_size:
+        self._cache_bytes -= len(self._cache.popitem(last = False)[1])
+    return sequence
+
+  def clear_cache(self):
+    """Remove all sequences from the cache."""
+    self._cache.clear()
+    self._cache_bytes = 0
+
+  def close(self):
+    """Close the file of the store.
+
+    The handles of the store cannot be materialized anymore afterwards.
+    """
+    self.clear_cache()
+    if self._mmap is not None:
+      self._mmap.close()
+      self._mmap = None
+    self._file.close()
+
+  def _remap(self):
+    if self._mmap is not None:
+      self._mmap.close()
+    self._file.flush()
+    self._mmap = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_READ)
+
+class SequenceHandle:
+  """Reference to a sequence in a `SequenceStore`.
+
+  Instances are used as value of the sequence field of segments, when the
+  sequences are loaded on demand. The length of the sequence is known
+  without reading it; the sequence itself is read from the store when the
+  handle is converted to string.
+
+  Parameters:
+    store (gfapy.SequenceStore)
+    offset (int) : position of the sequence in the file of the store
+    length (int) : length of the sequence
+  """
+
+  def __init__(self, store, offset, length):
+    self.store = store
+    self.offset = offset
+    self.length = length
+
+  def __len__(self):
+    return self.length
+
+  def __str__(self):
+    return self.store.read(self.offset, self.length)
+
+  def __repr__(self):
+    return "gfapy.SequenceHandle(offset={},length={})".format(
+        self.offset, self.length)
+
+  def __eq__(self, other):
+    if isinstance(other, SequenceHandle):
+      if other.store is self.store and other.offset == self.offset:
+        return other.length == self.length
+      other = str(other)
+    elif not isinstance(other, str):
+      return False
+    return len(other) == self.length and str(self) == other
+
+  def __hash__(self):
+    return hash(str(self))
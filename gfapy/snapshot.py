@@ -0,0 +1,468 @@
+"""
+Binary snapshots of Gfa instances
+
+A snapshot stores the lines of a Gfa instance in a binary format, which can
+be loaded without parsing and validating the text of the lines again.
+
+The snapshot consists of:
+
+- a table of strings: each string (e.g. names, orientations, string values
+  of fields) is stored once and referred to by its position in the table;
+  the strings are interned when the snapshot is loaded
+- a table for each record type, in which the values of each field (positional
+  field or tag) are stored in a column; columns of integers, floats, strings,
+  references to lines (e.g. segments of links) and references to oriented
+  lines (e.g. segments of GFA2 edges) are stored as arrays; the sequences of
+  the segments are stored as a single text
+
+The lines are numbered in the order in which they are stored, segments first.
+References to lines stored before in the snapshot are stored as line
+numbers. Other references (e.g. to virtual lines) are stored as the names
+of the referenced lines and resolved, as usual, when the lines are connected.
+
+Values of other classes (e.g. alignments) are stored as their string
+representation and decoded, as in lines read with a low validation level,
+when they are accessed.
+"""
+import gfapy
+import mmap
+import struct
+import sys
+from array import array
+
+_MAGIC = b"GFAPYSNP"
+_FORMAT_VERSION = 1
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+_F64 = struct.Struct("<d")
+
+# encoding of the columns
+_C_INT, _C_FLOAT, _C_STR, _C_LINE, _C_ORIENTED, _C_TEXT, _C_ANY = range(7)
+
+# encoding of the values in columns of type _C_ANY
+_V_NONE, _V_INT, _V_FLOAT, _V_STR, _V_PLACEHOLDER, _V_LINE, _V_ORIENTED, \
+    _V_LIST, _V_FIELD_ARRAY, _V_LASTPOS = range(10)
+
+# codes for missing values and placeholders in columns of type _C_STR
+# and _C_TEXT
+_MISSING = -1
+_PLACEHOLDER = -2
+
+class _Unencodable(Exception):
+  pass
+
+def save(gfa, filename):
+  """Save a snapshot of a Gfa instance.
+
+  Virtual lines are not saved; they are created again, when the lines
+  referring to them are loaded.
+
+  Parameters:
+    gfa (gfapy.Gfa)
+    filename (str)
+  """
+  writer = _Writer()
+  meta = _I64.pack(writer.sid(gfa.version or "")) + \
+         _I64.pack(writer.sid(gfa.dialect))
+  tables = bytearray()
+  for record_type, lines in gfa._lines_by_record_type():
+    writer.write_table(tables, record_type, lines)
+  with open(filename, "wb") as f:
+    f.write(_MAGIC)
+    f.write(_U64.pack(_FORMAT_VERSION))
+    f.write(writer.strings_section())
+    f.write(meta)
+    f.write(tables)
+
+def load(filename, vlevel = 1, gfa_class = None):
+  """Load a snapshot saved by `save`.
+
+  The fields of the lines are not validated and the Gfa instance is not
+  validated, as they were when the snapshot was saved.
+
+  Parameters:
+    filename (str)
+    vlevel (int) : validation level of the Gfa instance
+    gfa_class (type) : class of the instance (default: gfapy.Gfa)
+
+  Returns:
+    gfapy.Gfa
+
+  Raises:
+    ~gfapy.error.FormatError: if the file is not a snapshot
+    ~gfapy.error.VersionError: if the snapshot was saved using an
+      unsupported version of the format
+  """
+  if gfa_class is None:
+    gfa_class = gfapy.Gfa
+  with open(filename, "rb") as f:
+    if f.read(len(_MAGIC)) != _MAGIC:
+      raise gfapy.FormatError(
+          "The file {} is not a Gfa snapshot".format(filename))
+    with mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as data:
+      return _Reader(data, len(_MAGIC)).read_gfa(gfa_class, vlevel)
+
+class _Writer:
+
+  def __init__(self):
+    self._sids = {}
+    self._line_ids = {}
+
+  def sid(self, string):
+    """Position of a string in the table of strings."""
+    sid = self._sids.get(string)
+    if sid is None:
+      sid = len(self._sids)
+      self._sids[string] = sid
+    return sid
+
+  def strings_section(self):
+    strings = list(self._sids.keys())
+    ends = []
+    end = 0
+    for s in strings:
+      end += len(s)
+      ends.append(end)
+    blob = "".join(strings).encode()
+    return _U64.pack(len(blob)) + blob + _array_bytes("q", ends)
+
+  def write_table(self, out, record_type, lines):
+    # the fields of each line are stored in the order of its data, as this
+    # determines the order of the tags in the string representation
+    layouts = {}
+    line_layouts = []
+    fieldnames = {}
+    datatype_names = {}
+    for line in lines:
+      layout = tuple(line._data.keys())
+      if layout not in layouts:
+        layouts[layout] = len(layouts)
+        for fieldname in layout:
+          fieldnames.setdefault(fieldname, len(fieldnames))
+      line_layouts.append(layouts[layout])
+      for fieldname in line._datatype:
+        datatype_names[fieldname] = True
+    out += _I64.pack(self.sid(record_type))
+    out += _I64.pack(self.sid(lines[0].version or ""))
+    out += _U64.pack(len(lines))
+    out += _U64.pack(len(fieldnames))
+    for fieldname in fieldnames:
+      out += _I64.pack(self.sid(fieldname))
+      self._write_column(out, fieldname,
+                         [l._data.get(fieldname) for l in lines], lines)
+    out += _U64.pack(len(layouts))
+    for layout in layouts:
+      out += _array_bytes("q", [fieldnames[f] for f in layout])
+    out += _array_bytes("q", line_layouts)
+    out += _U64.pack(len(datatype_names))
+    for fieldname in datatype_names:
+      out += _I64.pack(self.sid(fieldname))
+      self._write_column(out, None,
+                         [l._datatype.get(fieldname) for l in lines], lines)
+    # lines are numbered after writing the table, thus references to lines
+    # of the same table are stored as names
+    for line in lines:
+      self._line_ids[id(line)] = len(self._line_ids)
+
+  def _ref(self, target):
+    """Reference to a line: its number or (if negative) its name."""
+    if isinstance(target, gfapy.Line):
+      line_id = self._line_ids.get(id(target))
+      if line_id is not None:
+        return line_id
+      target = target.name
+      if gfapy.is_placeholder(target):
+        raise _Unencodable()
+    if not isinstance(target, str):
+      raise _Unencodable()
+    return -self.sid(target) - 1
+
+  def _column_type(self, fieldname, values):
+    if fieldname == "sequence":
+      return _C_TEXT
+    elif all(type(v) is int and _INT64_MIN <= v <= _INT64_MAX \
+             for v in values):
+      return _C_INT
+    elif all(type(v) is float for v in values):
+      return _C_FLOAT
+    elif all(v is None or type(v) is str or type(v) is gfapy.Placeholder \
+             for v in values):
+      return _C_STR
+    elif all(isinstance(v, gfapy.Line) and id(v) in self._line_ids \
+             for v in values):
+      return _C_LINE
+    elif all(isinstance(v, gfapy.OrientedLine) and \
+             isinstance(v.line, gfapy.Line) and \
+             id(v.line) in self._line_ids for v in values):
+      return _C_ORIENTED
+    else:
+      return _C_ANY
+
+  def _write_column(self, out, fieldname, values, lines):
+    column_type = self._column_type(fieldname, values)
+    out.append(column_type)
+    if column_type == _C_INT:
+      out += _array_bytes("q", values)
+    elif column_type == _C_FLOAT:
+      out += _array_bytes("d", values)
+    elif column_type == _C_STR:
+      out += _array_bytes("q", [self._str_code(v) for v in values])
+    elif column_type == _C_LINE:
+      out += _array_bytes("q", [self._line_ids[id(v)] for v in values])
+    elif column_type == _C_ORIENTED:
+      out += _array_bytes("q", [self._line_ids[id(v.line)] for v in values])
+      out += _array_bytes("q", [self.sid(v.orient) for v in values])
+    elif column_type == _C_TEXT:
+      lengths = []
+      texts = []
+      for v in values:
+        if v is None:
+          lengths.append(_MISSING)
+        elif gfapy.is_placeholder(v):
+          lengths.append(_PLACEHOLDER)
+        else:
+          v = str(v)
+          lengths.append(len(v))
+          texts.append(v)
+      blob = "".join(texts).encode()
+      out += _array_bytes("q", lengths)
+      out += _U64.pack(len(blob))
+      out += blob
+    else:
+      stream = bytearray()
+      for v, line in zip(values, lines):
+        start = len(stream)
+        try:
+          self._write_value(stream, v)
+        except (_Unencodable, OverflowError, struct.error):
+          # stored as string, decoded on access
+          del stream[start:]
+          stream.append(_V_STR)
+          stream += _I64.pack(self.sid(gfapy.Field._to_gfa_field(v,
+            datatype = line._field_datatype(fieldname),
+            fieldname = fieldname, line = line)))
+      out += _U64.pack(len(stream))
+      out += stream
+
+  def _str_code(self, value):
+    if value is None:
+      return _MISSING
+    elif type(value) is gfapy.Placeholder:
+      return _PLACEHOLDER
+    else:
+      return self.sid(value)
+
+  def _write_value(self, stream, v):
+    if v is None:
+      stream.append(_V_NONE)
+    elif type(v) is int:
+      stream.append(_V_INT)
+      stream += _I64.pack(v)
+    elif type(v) is float:
+      stream.append(_V_FLOAT)
+      stream += _F64.pack(v)
+    elif type(v) is str:
+      stream.append(_V_STR)
+      stream += _I64.pack(self.sid(v))
+    elif type(v) is gfapy.Placeholder:
+      stream.append(_V_PLACEHOLDER)
+    elif isinstance(v, gfapy.Line):
+      stream.append(_V_LINE)
+      stream += _I64.pack(self._ref(v))
+    elif isinstance(v, gfapy.OrientedLine):
+      stream.append(_V_ORIENTED)
+      stream += _I64.pack(self._ref(v.line))
+      stream += _I64.pack(self.sid(v.orient))
+    elif isinstance(v, gfapy.FieldArray):
+      stream.append(_V_FIELD_ARRAY)
+      stream += _I64.pack(self.sid(v.datatype))
+      items = list(v)
+      stream += _U64.pack(len(items))
+      for item in items:
+        self._write_value(stream, item)
+    elif isinstance(v, gfapy.LastPos):
+      stream.append(_V_LASTPOS)
+      stream += _I64.pack(v.value)
+    elif type(v) is list:
+      stream.append(_V_LIST)
+      stream += _U64.pack(len(v))
+      for item in v:
+        self._write_value(stream, item)
+    else:
+      raise _Unencodable()
+
+class _Reader:
+
+  def __init__(self, data, pos):
+    self._data = data
+    self._pos = pos
+    self._lines = []
+
+  def read_gfa(self, gfa_class, vlevel):
+    format_version = self._u64()
+    if format_version != _FORMAT_VERSION:
+      raise gfapy.VersionError(
+          "Gfa snapshot format version unknown ({})".format(format_version))
+    self._read_strings()
+    version = self._strings[self._i64()] or None
+    dialect = self._strings[self._i64()]
+    gfa = gfa_class(vlevel = vlevel, version = version, dialect = dialect)
+    while self._pos < len(self._data):
+      self._read_table(gfa, vlevel, dialect)
+    return gfa
+
+  def _u64(self):
+    value = _U64.unpack_from(self._data, self._pos)[0]
+    self._pos += _U64.size
+    return value
+
+  def _i64(self):
+    value = _I64.unpack_from(self._data, self._pos)[0]
+    self._pos += _I64.size
+    return value
+
+  def _bytes(self, size):
+    value = self._data[self._pos:self._pos+size]
+    self._pos += size
+    return value
+
+  def _array(self, typecode):
+    n = self._u64()
+    a = array(typecode)
+    a.frombytes(self._bytes(n * a.itemsize))
+    if sys.byteorder == "big":
+      a.byteswap()
+    return a
+
+  def _read_strings(self):
+    text = self._bytes(self._u64()).decode()
+    start = 0
+    strings = []
+    for end in self._array("q"):
+      strings.append(sys.intern(text[start:end]))
+      start = end
+    self._strings = strings
+
+  def _ref(self, ref):
+    return self._lines[ref] if ref >= 0 else self._strings[-ref-1]
+
+  def _read_table(self, gfa, vlevel, dialect):
+    record_type = self._strings[self._i64()]
+    version = self._strings[self._i64()] or None
+    n = self._u64()
+    columns = [(self._strings[self._i64()], self._read_column(n)) \
+               for i in range(self._u64())]
+    layouts = [[columns[c] for c in self._array("q")] \
+               for i in range(self._u64())]
+    line_layouts = self._array("q")
+    datatypes = [(self._strings[self._i64()], self._read_column(n)) \
+                 for i in range(self._u64())]
+    if record_type == "H":
+      klass = gfapy.line.Header
+    else:
+      klass = gfapy.Line._subclass([record_type], version = version)
+    for i in range(n):
+      data = {fieldname: values[i] \
+              for fieldname, values in layouts[line_layouts[i]]}
+      line = klass(data, vlevel = vlevel, version = version,
+                   dialect = dialect)
+      for fieldname, values in datatypes:
+        if values[i] is not None:
+          line._store_datatype(fieldname, values[i])
+      if klass is gfapy.line.CustomRecord:
+        # see CustomRecord._delayed_initialize_positional_fields
+        line._positional_fieldnames = [n for n in line._data \
+                                       if line._datatype.get(n) == "generic"]
+      gfa._add_unique_line(line)
+      self._lines.append(line)
+
+  def _read_column(self, n):
+    column_type = self._data[self._pos]
+    self._pos += 1
+    if column_type == _C_INT:
+      return self._array("q").tolist()
+    elif column_type == _C_FLOAT:
+      return self._array("d").tolist()
+    elif column_type == _C_STR:
+      return [self._str_value(code) for code in self._array("q")]
+    elif column_type == _C_LINE:
+      lines = self._lines
+      return [lines[i] for i in self._array("q")]
+    elif column_type == _C_ORIENTED:
+      lines = self._lines
+      refs = self._array("q")
+      orients = self._array("q")
+      return [gfapy.OrientedLine(lines[r], self._strings[o]) \
+              for r, o in zip(refs, orients)]
+    elif column_type == _C_TEXT:
+      lengths = self._array("q")
+      text = self._bytes(self._u64()).decode()
+      values = []
+      start = 0
+      for length in lengths:
+        if length == _MISSING:
+          values.append(None)
+        elif length == _PLACEHOLDER:
+          values.append(gfapy.Placeholder())
+        else:
+          values.append(text[start:start+length])
+          start += length
+      return values
+    elif column_type == _C_ANY:
+      end = self._u64() + self._pos
+      values = [self._read_value() for i in range(n)]
+      if self._pos != end:
+        raise gfapy.FormatError("Invalid column in Gfa snapshot")
+      return values
+    else:
+      raise gfapy.FormatError(
+          "Unknown column type in Gfa snapshot ({})".format(column_type))
+
+  def _str_value(self, code):
+    if code == _MISSING:
+      return None
+    elif code == _PLACEHOLDER:
+      return gfapy.Placeholder()
+    else:
+      return self._strings[code]
+
+  def _read_value(self):
+    value_type = self._data[self._pos]
+    self._pos += 1
+    if value_type == _V_NONE:
+      return None
+    elif value_type == _V_INT:
+      return self._i64()
+    elif value_type == _V_FLOAT:
+      value = _F64.unpack_from(self._data, self._pos)[0]
+      self._pos += _F64.size
+      return value
+    elif value_type == _V_STR:
+      return self._strings[self._i64()]
+    elif value_type == _V_PLACEHOLDER:
+      return gfapy.Placeholder()
+    elif value_type == _V_LINE:
+      return self._ref(self._i64())
+    elif value_type == _V_ORIENTED:
+      line = self._ref(self._i64())
+      return gfapy.OrientedLine(line, self._strings[self._i64()])
+    elif value_type == _V_FIELD_ARRAY:
+      datatype = self._strings[self._i64()]
+      return gfapy.FieldArray(datatype,
+          [self._read_value() for i in range(self._u64())])
+    elif value_type == _V_LASTPOS:
+      return gfapy.LastPos(self._i64(), valid = True)
+    elif value_type == _V_LIST:
+      return [self._read_value() for i in range(self._u64())]
+    else:
+      raise gfapy.FormatError(
+          "Unknown value type in Gfa snapshot ({})".format(value_type))
+
+def _array_bytes(typecode, values):
+  """Length and content of an array, in little endian byte order."""
+  a = array(typecode, values)
+  if sys.byteorder == "big":
+    a.byteswap()
+  return _U64.pack(len(a)) + a.tobytes()
@@ -0,0 +1,84 @@
+import gfapy
+import gzip
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+
+def bgzf_block(data):
+  compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+  cdata = compressor.compress(data) + compressor.flush()
+  header = struct.pack("<4sIBBHBBHH", b"\x1f\x8b\x08\x04", 0, 0, 255, 6,
+                       66, 67, 2, 25 + len(cdata))
+  return header + cdata + struct.pack("<II", zlib.crc32(data), len(data))
+
+def bgzip(data, blocksize):
+  blocks = [bgzf_block(data[i:i+blocksize]) \
+            for i in range(0, len(data), blocksize)]
+  return b"".join(blocks) + bgzf_block(b"")
+
+class TestAPIBgzf(unittest.TestCase):
+
+  def setUp(self):
+    self.tmpdir = tempfile.TemporaryDirectory()
+    with open("tests/testdata/example1.gfa", "rb") as f:
+      self.content = f.read()
+    self.filename = os.path.join(self.tmpdir.name, "example1.gfa.gz")
+    with open(self.filename, "wb") as f:
+      # small blocks, so that lines span multiple blocks
+      f.write(bgzip(self.content, 50))
+
+  def tearDown(self):
+    self.tmpdir.cleanup()
+
+  def test_is_bgzf(self):
+    self.assertTrue(gfapy.bgzf.is_bgzf(self.filename))
+    self.assertFalse(gfapy.bgzf.is_bgzf("tests/testdata/example1.gfa.gz"))
+    self.assertFalse(gfapy.bgzf.is_bgzf("tests/testdata/example1.gfa"))
+
+  def test_iter_strings(self):
+    expected = self.content.decode().split("\n")[:-1]
+    with gzip.open(self.filename, "rt") as f:
+      self.assertEqual(expected, f.read().split("\n")[:-1])
+    for threads in [1, 3]:
+      self.assertEqual(expected, [s for _, s in \
+          gfapy.bgzf.iter_strings(self.filename, threads = threads)])
+
+  def test_from_file(self):
+    gfa = gfapy.Gfa.from_file("tests/testdata/example1.gfa")
+    for threads in [1, 3]:
+      bgzfgfa = gfapy.Gfa.from_file(self.filename, threads = threads)
+      self.assertEqual(str(gfa), str(bgzfgfa))
+
+  def test_index(self):
+    index = gfapy.bgzf.build_index(self.filename)
+    self.assertEqual((0, 0), index[0])
+    self.assertEqual(50, index[1][1])
+    indexfn = gfapy.bgzf.write_index(self.filename)
+    self.assertEqual(self.filename + ".gzi", indexfn)
+    self.assertEqual(index, gfapy.bgzf.read_index(indexfn))
+
+  def test_virtual_offsets(self):
+    index = gfapy.bgzf.build_index(self.filename)
+    uoffset = 0
+    lines = list(gfapy.bgzf.iter_strings(self.filename))
+    for voffset, string in lines:
+      self.assertEqual(voffset, gfapy.bgzf.virtual_offset(index, uoffset))
+      uoffset += len(string) + 1
+    start = lines[3][0]
+    end = lines[6][0]
+    self.assertEqual(lines[3:6],
+        list(gfapy.bgzf.iter_strings(self.filename, start = start,
+                                     end = end)))
+    self.assertEqual(lines[3:],
+        list(gfapy.bgzf.iter_strings(self.filename, threads = 2,
+                                     start = start)))
+
+  def test_invalid_crc(self):
+    block = bytearray(bgzf_block(b"S\t1\t*\n"))
+    block[-8] ^= 0xFF
+    with open(self.filename, "wb") as f:
+      f.write(block)
+    with self.assertRaises(gfapy.FormatError):
+      list(gfapy.bgzf.iter_strings(self.filename))
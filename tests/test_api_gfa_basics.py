@@ -99,3 +99,18 @@ class TestAPIGfaBasics(unittest.TestCase):
     self.assertEqual(gfapy.Gfa, gfa2.__class__)
     self.assertEqual(str(gfa1), str(gfa2))
 
+
+  def test_clone(self):
+    for fn in ["all_line_types.gfa1.gfa", "all_line_types.gfa2.gfa"]:
+      gfa = gfapy.Gfa.from_file("tests/testdata/" + fn)
+      cpy = gfa.clone()
+      self.assertEqual(str(gfa), str(cpy))
+      cpy.validate()
+      for s in cpy.segments:
+        self.assertIs(cpy, s.gfa)
+        for l in s.dovetails + s.paths:
+          self.assertIs(cpy, l.gfa)
+      s = cpy.segments[0]
+      s.name = "renamed"
+      self.assertIsNone(gfa.segment("renamed"))
+      self.assertIsNotNone(gfa.segment(gfa.segments[0].name))
@@ -47,6 +47,25 @@ class TestAPILinearPaths(unittest.TestCase):
         lps.add(" ".join([s.name for s in lp]))
       self.assertEqual({"1 19 18", "11 9 12", "22 16 20 21 23"}, lps)
 
+  def test_linear_path_merge_example1_edges(self):
+    # edges between two merged segments are renamed at both ends
+    for sfx in ["gfa", "gfa2"]:
+      gfa = gfapy.Gfa.from_file("tests/testdata/example1."+"{}".format(sfx))
+      gfa.merge_linear_paths()
+      merged = {"18_19_1", "11_9_12", "22_16_20_21_23"}
+      self.assertTrue(merged.issubset(gfa.segment_names))
+      pairs = set()
+      for e in gfa.edges:
+        if sfx == "gfa2":
+          names = [e.sid1.name, e.sid2.name]
+        else:
+          names = [e.from_segment.name, e.to_segment.name]
+        if set(names).issubset(merged):
+          pairs.add(tuple(sorted(names)))
+      self.assertEqual({("11_9_12", "18_19_1"),
+                        ("18_19_1", "22_16_20_21_23")}, pairs)
+      gfa.validate()
+
   def test_linear_path_merge_6(self):
     gfa = gfapy.Gfa.from_file("tests/testdata/linear_merging.6.gfa")
     expected = gfapy.Gfa.from_file("tests/testdata/linear_merging.6.merged.gfa")
@@ -63,3 +82,42 @@ class TestAPILinearPaths(unittest.TestCase):
       self.assertEqual(1, len(gfa.segments))
       self.assertEqual("s1_s2_s3_s4", gfa.segments[0].name)
       self.assertEqual("CTGAAACGTGGCTCACA", gfa.segments[0].sequence)
+
+  def test_linear_path_merge_connected_paths(self):
+    gfa = gfapy.Gfa(["S\t1\tAC", "S\t2\tGT", "S\t3\tAA", "S\t4\tCC",
+                     "S\t5\tGG", "S\t6\tTT", "L\t1\t+\t2\t+\t*",
+                     "L\t2\t+\t3\t-\t*", "L\t2\t+\t5\t+\t*",
+                     "L\t6\t+\t3\t-\t*", "L\t4\t+\t3\t+\t*"])
+    gfa.merge_linear_paths()
+    self.assertEqual({"1_2", "4_3", "5", "6"}, set(gfa.segment_names))
+    self.assertEqual("CCAA", gfa.segment("4_3").sequence)
+    self.assertEqual({"L\t1_2\t+\t4_3\t-\t*", "L\t1_2\t+\t5\t+\t*",
+                      "L\t6\t+\t4_3\t-\t*"},
+                     {str(l) for l in gfa.dovetails})
+
+  def test_linear_path_merge_redundant_junctions(self):
+    gfa = gfapy.Gfa(["S\t1\tAAAC", "S\t2\tCGGT", "S\t3\tTAAA",
+                     "S\t4\tTCCA", "L\t1\t+\t2\t+\t1M", "L\t3\t+\t2\t-\t1M",
+                     "L\t2\t+\t4\t+\t1M"])
+    gfa.merge_linear_paths(redundant_junctions=True)
+    self.assertEqual({"1_2", "3_2", "2_4"}, set(gfa.segment_names))
+    self.assertEqual("AAACGGT", gfa.segment("1_2").sequence)
+    self.assertEqual("TAAACCG", gfa.segment("3_2").sequence)
+    self.assertEqual("CGGTCCA", gfa.segment("2_4").sequence)
+    self.assertEqual({"L\t1_2\t+\t3_2\t-\t4M", "L\t1_2\t+\t2_4\t+\t4M"},
+                     {str(l) for l in gfa.dovetails})
+    gfa.validate()
+    gfa = gfapy.Gfa(["S\t1\t4\tAAAC", "S\t2\t4\tCGGT", "S\t3\t4\tTTTA",
+                     "E\t*\t1+\t2+\t3\t4$\t0\t1\t1M",
+                     "E\t*\t2+\t3+\t3\t4$\t0\t1\t1M"])
+    gfa.add_line("S\t4\t4\tTCCA")
+    gfa.add_line("E\t*\t2+\t4+\t3\t4$\t0\t1\t1M")
+    gfa.merge_linear_paths(redundant_junctions=True)
+    self.assertEqual({"E\t*\t1_2+\t2_3+\t3\t7$\t0\t4\t4M",
+                      "E\t*\t1_2+\t2_4+\t3\t7$\t0\t4\t4M"},
+                     {str(l) for l in gfa.dovetails})
+    gfa.validate()
+    # circular paths have no junctions
+    gfa = gfapy.Gfa.from_file("tests/testdata/spec_q3.gfa")
+    gfa.merge_linear_paths(redundant_junctions=True)
+    self.assertEqual(["2_3_1"], gfa.segment_names)
@@ -93,3 +93,46 @@ class TestAPILinesCollections(unittest.TestCase):
     self.assertSetEqual(set([str(x) for x in gfa.comments + gfa.headers + gfa.segments + gfa.edges +
                  gfa.paths + gfa.sets + gfa.gaps + gfa.fragments +
                  gfa.custom_records]), set([str(x) for x in gfa.lines]))
+
+  def test_iterators(self):
+    for sfx in ["gfa1", "gfa2"]:
+      gfa = gfapy.Gfa.from_file("tests/testdata/all_line_types.{}.gfa".\
+                                format(sfx))
+      self.assertEqual(gfa.segments, list(gfa.iter_segments()))
+      self.assertEqual(gfa.segment_names, list(gfa.iter_segment_names()))
+      self.assertEqual({id(l) for l in gfa.edges},
+                       {id(l) for l in gfa.iter_edges()})
+      self.assertEqual({id(l) for l in gfa.dovetails},
+                       {id(l) for l in gfa.iter_dovetails()})
+      self.assertEqual({id(l) for l in gfa.containments},
+                       {id(l) for l in gfa.iter_containments()})
+      self.assertEqual({id(l) for l in gfa.paths},
+                       {id(l) for l in gfa.iter_paths()})
+      self.assertEqual({id(l) for l in gfa.fragments},
+                       {id(l) for l in gfa.iter_fragments()})
+
+  def test_views(self):
+    gfa = gfapy.Gfa.from_file("tests/testdata/all_line_types.gfa2.gfa")
+    segments = gfa.view("segments")
+    dovetails = gfa.view("dovetails")
+    self.assertEqual(9, len(segments))
+    self.assertEqual(4, len(dovetails))
+    self.assertIn("1", segments)
+    self.assertIn(gfa.segment("1"), segments)
+    self.assertNotIn("1_to_2", segments)
+    self.assertNotIn("x", segments)
+    self.assertIn("1_to_2", dovetails)
+    self.assertNotIn("1_to_5", dovetails)
+    self.assertIn("1_to_5", gfa.view("containments"))
+    self.assertEqual(2, len(gfa.view("fragments")))
+    self.assertEqual(2, len(gfa.view("gaps")))
+    # the views reflect the changes of the Gfa instance
+    gfa.rm("1_to_2")
+    self.assertEqual(3, len(dovetails))
+    self.assertNotIn("1_to_2", dovetails)
+    gfa.add_line("E\t7_to_1\t7+\t1+\t10\t20$\t0\t10\t*")
+    self.assertEqual(10, len(segments))
+    self.assertIn("7", segments)
+    self.assertIn("7_to_1", dovetails)
+    with self.assertRaises(gfapy.ArgumentError):
+      gfa.view("unknown")
@@ -72,6 +72,55 @@ class TestAPILinesCreators(unittest.TestCase):
     with self.assertRaises(gfapy.NotUniqueError): gfa.append(p2)
     gfa.append(p3) # nothing raised
 
+  def test_add_lines(self):
+    lines = ["P\t4\t1+,2+\t122M", "L\t1\t+\t2\t+\t122M",
+             "C\t1\t+\t3\t+\t12\t12M", "S\t1\t*", "S\t2\t*",
+             "S\t3\t*", "H\tVN:Z:1.0"]
+    gfa = gfapy.Gfa()
+    # virtual lines are not allowed in segments-first order; add_lines
+    # adds the referenced lines first, thus it does not need them
+    gfa._segments_first_order = True
+    gfa.add_lines(lines) # nothing raised
+    self.assertEqual("gfa1", gfa.version)
+    self.assertEqual(["1", "2", "3"], gfa.segment_names)
+    self.assertEqual(["4"], gfa.path_names)
+    self.assertEqual(1, len(gfa.dovetails))
+    self.assertEqual(1, len(gfa.containments))
+    self.assertFalse(any(l.virtual for l in gfa.lines))
+    gfa.validate() # nothing raised
+
+  def test_add_lines_group_references(self):
+    lines = ["O\to1\tu1+ o2- 1+", "U\tu1\t1 o2 u2", "U\tu2\t2",
+             gfapy.Line("O\to2\t1+ u3+"), "U\tu3\t1 u4", "U\tu4\t2 u3",
+             "S\t1\t4\t*", "S\t2\t4\t*", "# c1", "H\tVN:Z:2.0", "# c2"]
+    gfa = gfapy.Gfa()
+    gfa._segments_first_order = True
+    # u3 and u4 refer to each other, thus one is referenced before existing
+    with self.assertRaises(gfapy.NotFoundError):
+      gfa.add_lines(lines)
+    lines[5] = "U\tu4\t2"
+    gfa = gfapy.Gfa()
+    gfa._segments_first_order = True
+    gfa.add_lines(lines) # nothing raised
+    # the order of the input is kept
+    self.assertEqual(["o1", "o2"], gfa.path_names)
+    self.assertEqual(["u1", "u2", "u3", "u4"], gfa.set_names)
+    self.assertEqual(["c1", "c2"], [c.content for c in gfa.comments])
+    self.assertFalse(any(l.virtual for l in gfa.lines))
+    gfa.validate() # nothing raised
+    gfa = gfapy.Gfa()
+    gfa._segments_first_order = True
+    with self.assertRaises(gfapy.NotFoundError):
+      for l in lines: gfa.add_line(l)
+
+  def test_read_file_deferred_references(self):
+    for sfx in ["gfa1", "gfa2"]:
+      filename = "tests/testdata/all_line_types.{}.gfa".format(sfx)
+      gfa = gfapy.Gfa.from_file(filename)
+      gfa2 = gfapy.Gfa.from_file(filename, deferred_references=True)
+      self.assertEqual(set(str(l) for l in gfa.lines),
+                       set(str(l) for l in gfa2.lines))
+
 ##  def test_segments_first_order(self):
 ##    s1 = "S\t1\t*"
 ##    s2 = "S\t2\t*"
@@ -74,3 +74,43 @@ class TestAPILinesDestructors(unittest.TestCase):
     gfa.rm("2")
     self.assertEqual([], gfa.segments)
 
+  def test_delete_segment_with_self_loop(self):
+    gfa = gfapy.Gfa(["S\ta\t*", "S\tb\t*", "L\ta\t+\ta\t-\t*",
+                     "L\ta\t+\tb\t+\t*"])
+    gfa.rm("a")
+    self.assertEqual(["b"], gfa.segment_names)
+    self.assertEqual([], gfa.dovetails)
+    gfa = gfapy.Gfa.from_file("tests/testdata/loop.gfa")
+    for name in ["1", "2", "3", "4"]:
+      gfa.rm(name)
+      self.assertNotIn(name, gfa.segment_names)
+    self.assertEqual([], gfa.dovetails)
+    gfa.validate()
+
+  def test_rm_many(self):
+    lines = ["S\t0\t*", "S\t1\t*", "S\t2\t*", "S\t3\t*",
+             "L\t1\t+\t2\t+\t12M", "L\t2\t+\t3\t+\t12M",
+             "C\t1\t+\t0\t+\t12\t12M", "P\t4\t1+,2+,3+\t12M,12M",
+             "P\t5\t2+,3+\t12M"]
+    gfa = gfapy.Gfa(lines)
+    gfa.rm_many(["0", gfa.segment("2"), "5"])
+    self.assertEqual(["1", "3"], sorted(gfa.segment_names))
+    self.assertEqual([], gfa.edges)
+    self.assertEqual([], gfa.paths)
+    self.assertEqual([], gfa.segment("1").dovetails)
+    self.assertEqual([], gfa.segment("1").edges_to_contained)
+    self.assertEqual([], gfa.segment("3").dovetails)
+    self.assertEqual([], gfa.segment("3").paths)
+    gfa.validate()
+    # same result as rm() on each line
+    for selection in [lambda g: ["1", "3"], lambda g: ["4", "2"],
+                      lambda g: [g.dovetails[0], g.segment("1")]]:
+      gfa1 = gfapy.Gfa(lines)
+      gfa2 = gfapy.Gfa(lines)
+      for x in selection(gfa1):
+        gfa1.rm(x)
+      gfa2.rm_many(selection(gfa2))
+      self.assertEqual(str(gfa1), str(gfa2))
+    with self.assertRaises(gfapy.NotFoundError):
+      gfa.rm_many(["1", "9"])
+    self.assertEqual(["1", "3"], sorted(gfa.segment_names))
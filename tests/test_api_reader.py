@@ -0,0 +1,186 @@
+import gfapy
+import gzip
+import io
+import os
+import tempfile
+import unittest
+
+class TestAPIReader(unittest.TestCase):
+
+  def test_iter_lines(self):
+    filename = "tests/testdata/example1.gfa"
+    lines = list(gfapy.iter_lines(filename))
+    gfa = gfapy.Gfa.from_file(filename)
+    self.assertEqual(len(gfa.lines), len(lines))
+    self.assertEqual(sorted([str(l) for l in gfa.lines]),
+                     sorted([str(l) for l in lines]))
+    for l in lines:
+      self.assertIsInstance(l, gfapy.Line)
+      self.assertFalse(l.is_connected())
+
+  def test_iter_lines_gz(self):
+    lines = [str(l) for l in gfapy.iter_lines("tests/testdata/example1.gfa")]
+    linesgz = [str(l) for l in \
+        gfapy.iter_lines("tests/testdata/example1.gfa.gz")]
+    self.assertEqual(lines, linesgz)
+
+  def test_iter_lines_references_not_resolved(self):
+    for l in gfapy.iter_lines("tests/testdata/example1.gfa"):
+      if l.record_type == "L":
+        self.assertIsInstance(l.from_segment, str)
+        self.assertIsInstance(l.to_segment, str)
+
+  def test_iter_lines_version(self):
+    for sfx in ["gfa1", "gfa2"]:
+      filename = "tests/testdata/all_line_types.{}.gfa".format(sfx)
+      versions = set(l.version for l in gfapy.iter_lines(filename) \
+                     if l.record_type not in ["H", "#"])
+      self.assertEqual({sfx}, versions)
+    with self.assertRaises(gfapy.VersionError):
+      next(gfapy.iter_lines("tests/testdata/example1.gfa", version="gfa3"))
+
+  def test_iter_lines_vlevel(self):
+    filename = "tests/testdata/example1.gfa"
+    for l in gfapy.iter_lines(filename, vlevel=0):
+      self.assertEqual(0, l.vlevel)
+
+  def test_iter_lines_lazy(self):
+    filename = "tests/testdata/example1.gfa"
+    lines = [str(l) for l in gfapy.iter_lines(filename)]
+    lazylines = [str(l) for l in gfapy.iter_lines(filename, lazy = True)]
+    self.assertEqual(lines, lazylines)
+
+  def test_from_file_lazy(self):
+    filename = "tests/testdata/example1.gfa"
+    gfa = gfapy.Gfa.from_file(filename)
+    lazygfa = gfapy.Gfa.from_file(filename, lazy = True)
+    self.assertEqual(str(gfa), str(lazygfa))
+    self.assertEqual(gfa.segment_names, lazygfa.segment_names)
+    self.assertEqual(len(gfa.dovetails), len(lazygfa.dovetails))
+    # reading the file does not decode the segments
+    self.assertTrue(all(s._raw is not None for s in lazygfa.segments))
+    with self.assertRaises(gfapy.NotUniqueError):
+      gfapy.Gfa(["S\t1\t*", "S\t2\t*", "L\t1\t+\t2\t+\t*",
+                 "L\t1\t+\t2\t+\t*"], lazy = True)
+
+  def test_from_file_workers(self):
+    for filename in ["tests/testdata/example1.gfa",
+                     "tests/testdata/all_line_types.gfa2.gfa",
+                     "tests/testdata/links_distri.l1.gfa"]:
+      gfa = gfapy.Gfa.from_file(filename)
+      pgfa = gfapy.Gfa.from_file(filename, workers = 2)
+      self.assertEqual(str(gfa), str(pgfa))
+      self.assertEqual(gfa.version, pgfa.version)
+
+  def test_chunk_boundaries(self):
+    filename = "tests/testdata/example1.gfa"
+    with open(filename, "rb") as f:
+      content = f.read()
+    for n in [1, 2, 3, 10, 1000]:
+      chunks = gfapy.reader._chunk_boundaries(filename, n)
+      self.assertEqual(content, b"".join(content[s:e] for s, e in chunks))
+      for s, e in chunks:
+        self.assertTrue(s == 0 or content[s-1:s] == b"\n")
+
+  def test_iter_lines_and_offsets(self):
+    for filename in ["tests/testdata/example1.gfa",
+                     "tests/testdata/example1.gfa.gz"]:
+      with gzip.open("tests/testdata/example1.gfa.gz", "rt") as f:
+        expected = f.read().split("\n")[:-1]
+      lines = list(gfapy.reader._iter_lines_and_offsets(filename))
+      self.assertEqual(expected, [l for l, _, _ in lines])
+      offsets = [o for _, _, o in lines]
+      self.assertEqual(sorted(offsets), offsets)
+      self.assertEqual(os.path.getsize(filename), offsets[-1])
+      self.assertEqual([0] + offsets[:-1], [o for _, o, _ in lines])
+
+  def test_iter_lines_and_offsets_crlf(self):
+    with tempfile.TemporaryDirectory() as tmpdir:
+      filename = os.path.join(tmpdir, "crlf.gfa")
+      with open(filename, "wb") as f:
+        f.write(b"H\tVN:Z:1.0\r\nS\t1\t*")
+      self.assertEqual([("H\tVN:Z:1.0", 0, 12), ("S\t1\t*", 12, 17)],
+          list(gfapy.reader._iter_lines_and_offsets(filename)))
+      filename = os.path.join(tmpdir, "empty.gfa")
+      open(filename, "wb").close()
+      self.assertEqual([],
+          list(gfapy.reader._iter_lines_and_offsets(filename)))
+
+  def test_iter_lines_text(self):
+    with tempfile.TemporaryDirectory() as tmpdir:
+      filename = os.path.join(tmpdir, "crlf.gfa")
+      with open(filename, "wb") as f:
+        f.write(b"H\tVN:Z:1.0\r\nS\t1\t*\txx:Z:a\rb\n\nS\t2\t*")
+      for gzipped in [False, "auto"]:
+        self.assertEqual(["H\tVN:Z:1.0", "S\t1\t*\txx:Z:a\rb", "", "S\t2\t*"],
+            list(gfapy.reader._iter_lines(filename, gzipped)))
+      self.assertEqual(list(gfapy.reader._iter_lines(filename)),
+          [l for l, _, _ in gfapy.reader._iter_lines_and_offsets(filename)])
+    for filename in ["tests/testdata/example1.gfa",
+                     "tests/testdata/example1.gfa.gz"]:
+      self.assertEqual(
+          [l for l, _, _ in gfapy.reader._iter_lines_and_offsets(filename)],
+          list(gfapy.reader._iter_lines(filename)))
+
+  def test_read_file_progress(self):
+    filename = "tests/testdata/example1.gfa"
+    channel = io.StringIO()
+    gfa = gfapy.Gfa()
+    gfa.enable_progress_logging(part = 0.5, channel = channel)
+    gfa.read_file(filename)
+    self.assertIn("of size {} bytes".format(os.path.getsize(filename)),
+                  channel.getvalue())
+    self.assertIn("100.0% bytes processed", channel.getvalue())
+    channel = io.StringIO()
+    gfa = gfapy.Gfa()
+    gfa.enable_progress_logging(part = 0.5, channel = channel)
+    gfa.read_file(filename, deferred_references = True)
+    self.assertIn("100.0% bytes processed", channel.getvalue())
+    self.assertIn("100.0% lines processed", channel.getvalue())
+    self.assertEqual(str(gfapy.Gfa.from_file(filename)), str(gfa))
+
+  def test_projection(self):
+    project = gfapy.reader._projection(record_types = {"S"},
+                                       drop_tags = {"RC"},
+                                       load_sequences = False)
+    self.assertEqual(None, project("L\t1\t+\t2\t+\t*"))
+    self.assertEqual(None, project("# comment"))
+    self.assertEqual("H\tVN:Z:1.0", project("H\tVN:Z:1.0\tRC:i:1"))
+    self.assertEqual("S\t1\t*\tLN:i:4", project("S\t1\tACGT\tRC:i:1"))
+    self.assertEqual("S\t1\t*\tLN:i:5", project("S\t1\tACGT\tLN:i:5"))
+    self.assertEqual("S\t1\t4\t*\txx:Z:a", project("S\t1\t4\tACGT\txx:Z:a"))
+    self.assertIsNone(gfapy.reader._projection())
+
+  def test_from_file_projection(self):
+    filename = "tests/testdata/sample.gfa"
+    gfa = gfapy.Gfa.from_file(filename)
+    for workers in [None, 2]:
+      pgfa = gfapy.Gfa.from_file(filename, record_types = {"S", "L"},
+                                 drop_tags = {"RC"}, load_sequences = False,
+                                 workers = workers)
+      self.assertEqual(gfa.segment_names, pgfa.segment_names)
+      self.assertEqual(len(gfa.dovetails), len(pgfa.dovetails))
+      for s in pgfa.segments:
+        self.assertEqual(gfapy.Placeholder, s.sequence.__class__)
+        self.assertEqual(len(gfa.segment(s.name).sequence), s.LN)
+        self.assertIsNone(s.RC)
+    lines = list(gfapy.iter_lines("tests/testdata/all_line_types.gfa1.gfa",
+                                  record_types = {"P"}))
+    self.assertEqual({"H", "P"}, set(l.record_type for l in lines))
+
+  def test_from_file_sequences_on_demand(self):
+    filename = "tests/testdata/sample.gfa"
+    gfa = gfapy.Gfa.from_file(filename)
+    with tempfile.TemporaryDirectory() as tmpdir:
+      gzfilename = os.path.join(tmpdir, "sample.gfa.gz")
+      with open(filename, "rb") as f, gzip.open(gzfilename, "wb") as gzf:
+        gzf.write(f.read())
+      for fn, workers in [(filename, None), (filename, 2), (gzfilename, None)]:
+        odgfa = gfapy.Gfa.from_file(fn, load_sequences = "on_demand",
+                                    workers = workers)
+        for s in odgfa.segments:
+          self.assertIsInstance(s._data["sequence"], gfapy.SequenceHandle)
+          self.assertEqual(len(gfa.segment(s.name).sequence), s.length)
+          self.assertEqual(gfa.segment(s.name).sequence, s.sequence)
+          self.assertEqual(str(gfa.segment(s.name)), str(s))
+        self.assertEqual(str(gfa), str(odgfa))
@@ -0,0 +1,94 @@
+import gfapy
+import math
+import unittest
+
+class TestAPISegmentTable(unittest.TestCase):
+
+  def build(self):
+    return gfapy.Gfa(["S\t1\tACGT\tRC:i:40",
+                      "S\t2\t*\tLN:i:100\tKC:i:10",
+                      "S\t3\tACGTACGT",
+                      "L\t1\t+\t2\t+\t*",
+                      "L\t1\t+\t3\t-\t*",
+                      "L\t2\t-\t3\t+\t*"])
+
+  def test_columns(self):
+    gfa = self.build()
+    table = gfa.segment_table
+    self.assertEqual(3, len(table))
+    ids = [table.segment_id(sn) for sn in ["1", "2", "3"]]
+    self.assertEqual([0, 1, 2], sorted(ids))
+    self.assertEqual([4, 100, 8], [table.length[i] for i in ids])
+    self.assertEqual(40, table.RC[ids[0]])
+    self.assertTrue(math.isnan(table.RC[ids[1]]))
+    self.assertEqual(10, table.KC[ids[1]])
+    self.assertEqual([0, 2, 1], [table.degree_L[i] for i in ids])
+    self.assertEqual([2, 0, 1], [table.degree_R[i] for i in ids])
+    self.assertIs(gfa.segment("2"), table.segment(ids[1]))
+
+  def test_sync(self):
+    gfa = self.build()
+    table = gfa.segment_table
+    s1 = table.segment_id("1")
+    gfa.segment("1").sequence = "ACGTACGTAC"
+    self.assertEqual(10, table.length[s1])
+    gfa.segment("1").RC = 50
+    self.assertEqual(50, table.RC[s1])
+    gfa.segment("1").delete("RC")
+    self.assertTrue(math.isnan(table.RC[s1]))
+    gfa.rm(gfa.dovetails[0])
+    self.assertEqual(1, table.degree_R[s1])
+    gfa.rm("3")
+    self.assertEqual(0, table.degree_R[s1])
+    self.assertEqual(2, len(table))
+    gfa.add_line("L\t1\t-\t4\t+\t*")
+    self.assertEqual(1, table.degree_L[s1])
+    gfa.add_line("S\t4\tACG")
+    s4 = table.segment_id("4")
+    self.assertEqual(3, table.length[s4])
+    self.assertEqual(1, table.degree_L[s4])
+    self.assertEqual(3, len(table))
+    gfa.segment("4").name = "5"
+    self.assertEqual(3, table.length[table.segment_id("5")])
+    gfa.drop_segment_table()
+    gfa.rm("5")
+    self.assertEqual(2, len(gfa.segment_table))
+
+  def test_coverage(self):
+    gfa = self.build()
+    table = gfa.segment_table
+    cov = table.coverage()
+    self.assertEqual(10, cov[table.segment_id("1")])
+    self.assertTrue(math.isnan(cov[table.segment_id("2")]))
+    cov = table.coverage(count_tag="KC", unit_length=1)
+    self.assertEqual(0.1, cov[table.segment_id("2")])
+
+  def test_adjacency(self):
+    gfa = self.build()
+    table = gfa.segment_table
+    adjacency = table.adjacency
+    s1, s2, s3 = [table.segment_id(sn) for sn in ["1", "2", "3"]]
+    node = adjacency.node(s1, "R")
+    self.assertEqual(2, adjacency.degree(node))
+    self.assertEqual([adjacency.node(s2, "L"), adjacency.node(s3, "R")],
+                     list(adjacency.neighbours(node)))
+    self.assertEqual(["1R", "2L", "3R"],
+                     [str(table.segment_end(n)) for n in \
+                      [node] + list(adjacency.neighbours(node))])
+    self.assertEqual(0, adjacency.degree(adjacency.node(s1, "L")))
+    gfa.rm(gfa.dovetails[0])
+    self.assertIs(adjacency, table.adjacency)
+    self.assertEqual(1, table.adjacency.degree(node))
+
+  def test_temporary_table(self):
+    gfa = self.build()
+    self.assertEqual(1, len(gfa.connected_components()))
+    self.assertFalse(gfa.is_cut_link(gfa.dovetails[0]))
+    gfa.merge_linear_paths()
+    self.assertIsNone(gfa._segment_table)
+    gfa = self.build()
+    table = gfa.segment_table
+    self.assertEqual(1, len(gfa.connected_components()))
+    gfa.merge_linear_paths()
+    self.assertIs(table, gfa._segment_table)
+    self.assertEqual(len(gfa.segment_names), len(table))
@@ -0,0 +1,78 @@
+import gfapy
+import os
+import tempfile
+import unittest
+
+class TestAPISnapshot(unittest.TestCase):
+
+  def setUp(self):
+    self.tmpdir = tempfile.TemporaryDirectory()
+    self.filename = os.path.join(self.tmpdir.name, "snapshot")
+
+  def tearDown(self):
+    self.tmpdir.cleanup()
+
+  def roundtrip(self, gfa):
+    gfa.save_snapshot(self.filename)
+    return gfapy.Gfa.load_snapshot(self.filename)
+
+  def test_roundtrip(self):
+    for fn in ["example1.gfa", "all_line_types.gfa1.gfa",
+               "all_line_types.gfa2.gfa", "rgfa_example.1.gfa",
+               "example_from_spec2.gfa2", "sample.gfa2"]:
+      gfa = gfapy.Gfa.from_file("tests/testdata/" + fn)
+      loaded = self.roundtrip(gfa)
+      self.assertEqual(str(gfa), str(loaded))
+      self.assertEqual(gfa.version, loaded.version)
+      self.assertEqual(gfa.dialect, loaded.dialect)
+      loaded.validate()
+
+  def test_references(self):
+    gfa = gfapy.Gfa.from_file("tests/testdata/all_line_types.gfa1.gfa")
+    loaded = self.roundtrip(gfa)
+    for s in gfa.segments:
+      ls = loaded.segment(s.name)
+      for key in ["dovetails_L", "dovetails_R", "edges_to_contained",
+                  "edges_to_containers", "paths"]:
+        self.assertEqual([str(l) for l in getattr(s, key)],
+                         [str(l) for l in getattr(ls, key)])
+        for l in getattr(ls, key):
+          self.assertIs(loaded, l.gfa)
+    for p in loaded.paths:
+      for sn in p.segment_names:
+        self.assertIs(loaded.segment(sn.name), sn.line)
+      self.assertEqual(len(gfa.line(p.name).links), len(p.links))
+
+  def test_values(self):
+    gfa = gfapy.Gfa(version = "gfa1")
+    gfa.add_line("H\tVN:Z:1.0\txx:i:1")
+    gfa.add_line("H\txx:i:2")
+    gfa.add_line("S\t1\tACGT\tRC:i:10\tzz:f:1.5\tab:B:c,1,2")
+    gfa.add_line("S\t2\t*\tLN:i:100\tzz:J:{\"a\":1}")
+    gfa.add_line("L\t1\t+\t2\t-\t2M\tab:Z:x")
+    gfa.add_line("L\t3\t+\t2\t+\t*")
+    loaded = self.roundtrip(gfa)
+    self.assertEqual(str(gfa), str(loaded))
+    self.assertEqual([1, 2], list(loaded.header.xx))
+    self.assertEqual(1.5, loaded.segment("1").zz)
+    self.assertEqual({"a": 1}, loaded.segment("2").zz)
+    self.assertEqual([1, 2], list(loaded.segment("1").ab))
+    self.assertIsInstance(loaded.segment("2").sequence, gfapy.Placeholder)
+    self.assertEqual(gfapy.CIGAR, loaded.dovetails[0].overlap.__class__)
+    self.assertTrue(loaded.segment("3").virtual)
+
+  def test_large_integers(self):
+    big = 99999999999999999999
+    # integer column, column with values of different types
+    for lines in [["S\t1\t*\txx:i:{}".format(big), "S\t2\t*\txx:i:1"],
+                  ["S\t1\t*\txx:i:{}".format(-big), "S\t2\t*\txx:Z:a"]]:
+      gfa = gfapy.Gfa(lines)
+      loaded = self.roundtrip(gfa)
+      self.assertEqual(str(gfa), str(loaded))
+      self.assertEqual(gfa.segment("1").xx, loaded.segment("1").xx)
+      self.assertGreater(abs(loaded.segment("1").xx), 2 ** 63)
+      self.assertEqual(gfa.segment("2").xx, loaded.segment("2").xx)
+
+  def test_not_a_snapshot(self):
+    with self.assertRaises(gfapy.FormatError):
+      gfapy.Gfa.load_snapshot("tests/testdata/example1.gfa")
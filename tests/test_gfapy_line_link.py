@@ -47,6 +47,16 @@ class TestLineLink(unittest.TestCase):
       f[7]="NM:Z:1232"
       gfapy.Line("\t".join(f), vlevel = 2)
 
+  def test_hash(self):
+    l = gfapy.Line("L\t1\t+\t2\t-\t12M")
+    links = {l}
+    h = hash(l)
+    l.overlap = "10M"
+    l.to_orient = "+"
+    self.assertEqual(h, hash(l))
+    self.assertIn(l, links)
+    self.assertNotIn(l.clone(), links)
+
   #TODO
   #def test_coords
   #  g = RGFA.new(version: :gfa1)
@@ -2,17 +2,33 @@ import unittest
 import gfapy
 
 class TestSequence(unittest.TestCase):
-  pass
 
-  #TODO: fix test
-  #def test_rc(self):
-  #  self.assertEqual("gcatcgatcgt", gfapy.sequence.rc("acgatcgatgc"))
-  #  self.assertEqual("gCaTCgatcgt", gfapy.sequence.rc("acgatcGAtGc"))
-  #  self.assertEqual("gcatcnatcgt", gfapy.sequence.rc("acgatngatgc"))
-  #  self.assertEqual("gcatcYatcgt", gfapy.sequence.rc("acgatRgatgc"))
-  #  self.assertRaises(gfapy.InconsistencyError, gfapy.sequence.rc, "acgatUgatgc")
-  #  self.assertEqual("gcaucgaucgu", gfapy.sequence.rc("acgaucgaugc"))
-  #  self.assertEqual("===.", gfapy.sequence.rc(".==="))
-  #  self.assertRaises(gfapy.ValueError, gfapy.sequence.rc, "acgatXgatgc")
-  #  self.assertEqual("*", gfapy.sequence.rc("*"))
-  #  self.assertRaises(gfapy.ValueError, gfapy.sequence.rc, "**")
+  def test_rc(self):
+    self.assertEqual("gcatcgatcgt", gfapy.sequence.rc("acgatcgatgc"))
+    self.assertEqual("gCaTCgatcgt", gfapy.sequence.rc("acgatcGAtGc"))
+    self.assertEqual("gcatcnatcgt", gfapy.sequence.rc("acgatngatgc"))
+    self.assertEqual("gcatcYatcgt", gfapy.sequence.rc("acgatRgatgc"))
+    self.assertEqual("gcaucgaucgu",
+                     gfapy.sequence.rc("acgatcgatgc", rna = True))
+    self.assertEqual("gcatcgatcgt", gfapy.sequence.rc("acgaucgaugc"))
+    self.assertEqual("===.", gfapy.sequence.rc(".==="))
+    self.assertEqual("gcgatcgt", gfapy.sequence.rc("acg atc\ngc"))
+    self.assertRaises(gfapy.ValueError, gfapy.sequence.rc, "acgatXgatgc")
+    self.assertEqual("gcatcXatcgt",
+                     gfapy.sequence.rc("acgatXgatgc", valid = True))
+    self.assertEqual("*", gfapy.sequence.rc("*"))
+    self.assertRaises(gfapy.ValueError, gfapy.sequence.rc, "**")
+
+  def test_rc_many(self):
+    sequences = ["acgatcgatgc", "", "ACGTN", gfapy.Placeholder(), "a"]
+    self.assertEqual([gfapy.sequence.rc(s) for s in sequences],
+                     gfapy.sequence.rc_many(sequences))
+    self.assertEqual([gfapy.sequence.rc(s, rna = True) for s in sequences],
+                     gfapy.sequence.rc_many(iter(sequences), rna = True))
+    self.assertEqual(["gcgatcgt", "A"],
+                     gfapy.sequence.rc_many(["acg atc\ngc", "T"]))
+    self.assertRaises(gfapy.ValueError, gfapy.sequence.rc_many,
+                      ["ACGT", "acgatXgatgc"])
+    self.assertEqual(["ACGT", "gcatcXatcgt"],
+        gfapy.sequence.rc_many(["ACGT", "acgatXgatgc"], valid = True))
+    self.assertEqual([], gfapy.sequence.rc_many([]))
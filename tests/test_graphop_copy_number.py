@@ -14,6 +14,13 @@ class TestGraphopCopyNumber(unittest.TestCase):
       gfa.delete_low_coverage_segments(1000)
       self.assertEqual(set(), set(gfa.segment_names))
 
+  def test_delete_low_coverage_segments_undefined(self):
+    for line in ["S\t2\t*\tRC:i:1000", "S\t2\tACGT"]:
+      gfa = gfapy.Gfa(["S\t1\tACGT\tRC:i:4", line])
+      with self.assertRaises(gfapy.NotFoundError):
+        gfa.delete_low_coverage_segments(10)
+      self.assertEqual({"1","2"}, set(gfa.segment_names))
+
   def test_compute_copy_numbers(self):
     for sfx in ["gfa", "gfa2"]:
       gfa = gfapy.Gfa.from_file("tests/testdata/copynum.2.{}".format(sfx))
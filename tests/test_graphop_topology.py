@@ -0,0 +1,122 @@
+import gfapy
+import unittest
+
+class TestGraphOpTopology(unittest.TestCase):
+
+  def test_subgraph(self):
+    gfa = gfapy.Gfa(["S\t1\t*", "S\t2\t*", "S\t3\t*", "S\t4\t*",
+                     "L\t1\t+\t2\t+\t*", "L\t2\t+\t3\t-\t*",
+                     "L\t3\t-\t4\t+\t*", "C\t1\t+\t4\t-\t12\t*",
+                     "P\tp1\t1+,2+\t*", "P\tp2\t2+,3-\t*"], version = "gfa1")
+    sub = gfa.subgraph(["1", "2", "3"])
+    self.assertEqual(["1", "2", "3"], sub.segment_names)
+    self.assertEqual(["L\t1\t+\t2\t+\t*", "L\t2\t+\t3\t-\t*"],
+                     sorted(str(l) for l in sub.dovetails))
+    self.assertEqual([], sub.containments)
+    self.assertEqual(["p1", "p2"], sorted(sub.path_names))
+    sub.validate()
+    sub = gfa.subgraph([gfa.segment("1")])
+    self.assertEqual(["1"], sub.segment_names)
+    self.assertEqual([], sub.edges)
+    self.assertEqual([], sub.paths)
+    with self.assertRaises(gfapy.NotFoundError):
+      gfa.subgraph(["5"])
+
+  def test_subgraph_group_references(self):
+    gfa = gfapy.Gfa(["S\t1\t4\t*", "S\t2\t4\t*", "S\t3\t4\t*",
+                     "U\tu\t1 2", "O\to\t1+ u+", "O\tp\to+ 2+",
+                     "U\tv\t3 u"], version = "gfa2")
+    sub = gfa.subgraph(["1", "2"])
+    self.assertEqual(["1", "2", "o", "p", "u"], sorted(sub.names))
+    sub.validate()
+
+  def test_split_connected_components(self):
+    for sfx in ["gfa", "gfa2"]:
+      gfa = gfapy.Gfa.from_file(
+          "tests/testdata/two_components.{}".format(sfx))
+      components = gfa.split_connected_components()
+      self.assertEqual(2, len(components))
+      self.assertEqual(sorted(gfa.segment_names),
+          sorted(sn for c in components for sn in c.segment_names))
+      self.assertEqual(len(gfa.edges),
+          sum(len(c.edges) for c in components))
+      for c in components:
+        self.assertEqual(1, len(c.connected_components()))
+
+  def test_cut_links_and_segments(self):
+    gfa = gfapy.Gfa(["S\t1\t*", "S\t2\t*", "S\t3\t*", "S\t4\t*",
+                     "L\t1\t+\t2\t+\t*", "L\t2\t+\t3\t+\t*",
+                     "L\t3\t+\t1\t+\t*", "L\t3\t-\t4\t+\t*"])
+    self.assertEqual([False, False, False, True],
+                     [gfa.is_cut_link(l) for l in gfa.dovetails])
+    self.assertEqual([False, False, True, False],
+                     [gfa.is_cut_segment(sn) for sn in ["1", "2", "3", "4"]])
+    self.assertEqual([["1", "2", "3", "4"]],
+                     [sorted(s.name for s in c) \
+                      for c in gfa.connected_components()])
+
+  def test_cut_links_ignore_segment_ends(self):
+    # 3 has no dovetail overlaps at its right end, but the links of the
+    # triangle are no cut links, as the segment ends are not considered
+    gfa = gfapy.Gfa(["S\t1\t*", "S\t2\t*", "S\t3\t*",
+                     "L\t1\t+\t2\t+\t*", "L\t2\t+\t3\t+\t*",
+                     "L\t1\t+\t3\t+\t*"])
+    self.assertEqual([False, False, False],
+                     [gfa.is_cut_link(l) for l in gfa.dovetails])
+    self.assertEqual([False, False, False],
+                     [gfa.is_cut_segment(sn) for sn in ["1", "2", "3"]])
+    gfa.add_line("S\t4\t*")
+    gfa.add_line("L\t3\t+\t4\t+\t*")
+    self.assertEqual([False, False, False, True],
+                     [gfa.is_cut_link(l) for l in gfa.dovetails])
+    self.assertEqual([False, False, True, False],
+                     [gfa.is_cut_segment(sn) for sn in ["1", "2", "3", "4"]])
+
+  def test_cut_links_and_segments_after_removals(self):
+    gfa = gfapy.Gfa(["S\t1\t*", "S\t2\t*", "S\t3\t*", "S\t4\t*",
+                     "S\t5\t*", "L\t1\t+\t2\t+\t*", "L\t2\t+\t3\t+\t*",
+                     "L\t3\t+\t1\t+\t*", "L\t3\t-\t4\t+\t*",
+                     "L\t4\t-\t5\t+\t*", "L\t5\t-\t3\t-\t*"])
+    self.assertEqual([False, False, True, False, False],
+                     [gfa.is_cut_segment(str(i)) for i in range(1, 6)])
+    gfa.rm(gfa.dovetails[1])
+    self.assertEqual([True, True, False, False, False],
+                     [gfa.is_cut_link(l) for l in gfa.dovetails])
+    self.assertEqual([True, False, True, False, False],
+                     [gfa.is_cut_segment(str(i)) for i in range(1, 6)])
+    gfa.rm("4")
+    self.assertEqual([True, False, True, False],
+                     [gfa.is_cut_segment(sn) for sn in ["1", "2", "3", "5"]])
+    self.assertEqual([True, True, True],
+                     [gfa.is_cut_link(l) for l in gfa.dovetails])
+
+  def test_connected_components_stats(self):
+    gfa = gfapy.Gfa(["S\t1\tACGT", "S\t2\t*\tLN:i:100", "S\t3\t*",
+                     "S\t4\tACG", "L\t1\t+\t2\t+\t*", "L\t2\t+\t3\t-\t*"])
+    self.assertEqual([["1", "2", "3"], ["4"]],
+                     [sorted(s.name for s in c) \
+                      for c in gfa.connected_components()])
+    self.assertEqual([(3, 104), (1, 3)], gfa.connected_components_stats())
+
+  def test_long_chain_components(self):
+    n = 5000
+    gfa = gfapy.Gfa(["S\t{}\t*".format(i) for i in range(n)] +
+                    ["L\t{}\t+\t{}\t+\t*".format(i, i + 1) \
+                     for i in range(n - 1)])
+    self.assertEqual([(n, 0)], gfa.connected_components_stats())
+    self.assertEqual(n, len(gfa.segment_connected_component("0")))
+
+  def test_segment_connected_component_visited(self):
+    gfa = gfapy.Gfa(["S\t1\t*", "S\t2\t*", "S\t3\t*", "S\t4\t*",
+                     "L\t1\t+\t2\t+\t*", "L\t3\t+\t4\t+\t*"])
+    visited = set()
+    components = []
+    for sn in gfa.segment_names:
+      if sn not in visited:
+        components.append(sorted(s.name for s in \
+            gfa.segment_connected_component(sn, visited)))
+    self.assertEqual([["1", "2"], ["3", "4"]], components)
+    self.assertEqual({"1", "2", "3", "4"}, visited)
+    # segments in visited are not traversed
+    self.assertEqual(["3"], [s.name for s in \
+        gfa.segment_connected_component("3", {"4"})])
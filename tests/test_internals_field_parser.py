@@ -21,6 +21,15 @@ class TestInternalsFieldParser(unittest.TestCase):
     with self.assertRaises(gfapy.FormatError):
       gfapy.Field._parse_gfa_tag("AA:a:1")
 
+  def test_parse_gfa_tags(self):
+    self.assertEqual([["AA","i","1"],["b1","Z","x:y:z"]],
+        gfapy.Field._parse_gfa_tags(["AA:i:1", "b1:Z:x:y:z"]))
+    self.assertEqual([], gfapy.Field._parse_gfa_tags([]))
+    with self.assertRaises(gfapy.FormatError):
+      gfapy.Field._parse_gfa_tags(["AA:i:1", "AA:i:"])
+    with self.assertRaises(gfapy.FormatError):
+      gfapy.Field._parse_gfa_tags(["AA:i:1", "A1:C:1"])
+
   def test_parse_gfa_field_A(self):
     self.assertEqual("1", gfapy.Field._parse_gfa_field("1", "A"))
 
@@ -46,3 +55,17 @@ class TestInternalsFieldParser(unittest.TestCase):
   def test_parse_gfa_field_J(self):
     self.assertEqual({"1" : 2},
         gfapy.Field._parse_gfa_field("{\"1\":2}", "J"))
+
+  def test_parse_gfa_field_identifiers_interned(self):
+    # the parsed identifiers share a single string object for each name
+    name = "".join(["seg", "ment1"])
+    for datatype in ["segment_name_gfa1", "path_name_gfa1",
+                     "identifier_gfa2", "optional_identifier_gfa2"]:
+      self.assertIs(gfapy.Field._parse_gfa_field(name, datatype),
+          gfapy.Field._parse_gfa_field("".join(["segm", "ent1"]), datatype))
+    l = gfapy.Field._parse_gfa_field("segment1+,segment1-",
+                                     "oriented_identifier_list_gfa1")
+    self.assertIs(l[0].name, l[1].name)
+    l = gfapy.Field._parse_gfa_field("segment1 segment1",
+                                     "identifier_list_gfa2")
+    self.assertIs(l[0], l[1])
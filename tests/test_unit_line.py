@@ -86,3 +86,59 @@ class TestUnitLine(unittest.TestCase):
     l1.VN = "2.0"
     self.assertEqual("2.0", l.VN)
 
+
+  def test_lazy(self):
+    s = "S\t1\tACGT\tLN:i:4\txx:J:{\"a\": 1}\tyy:Z:ab"
+    l = gfapy.Line(s, lazy = True)
+    self.assertEqual("1", l._data["name"])
+    self.assertEqual("4", l._data["LN"])
+    self.assertEqual(s, str(l))
+    self.assertEqual(s.split("\t"), l.to_list())
+    self.assertEqual(4, l.LN)
+    self.assertEqual("ab", l.yy)
+    self.assertEqual(s, str(l))
+    l.xx["a"] = 2
+    self.assertEqual("S\t1\tACGT\tLN:i:4\txx:J:{\"a\": 2}\tyy:Z:ab", str(l))
+    l = gfapy.Line(s, lazy = True)
+    l.LN = 5
+    self.assertEqual("S\t1\tACGT\tLN:i:5\txx:J:{\"a\": 1}\tyy:Z:ab", str(l))
+    l = gfapy.Line(s, lazy = True)
+    l.delete("yy")
+    self.assertEqual("S\t1\tACGT\tLN:i:4\txx:J:{\"a\": 1}", str(l))
+    l = gfapy.Line(s, lazy = True, vlevel = 2)
+    self.assertEqual(4, l._data["LN"])
+
+  def test_lazy_validation_on_access(self):
+    l = gfapy.Line("S\t1\t*\tLN:i:x", lazy = True)
+    with self.assertRaises(gfapy.FormatError):
+      l.LN
+
+  def test_lazy_record_type_specific_validation(self):
+    s = "S\t1\tACGT\tLN:i:5"
+    with self.assertRaises(gfapy.InconsistencyError):
+      gfapy.Line(s)
+    l = gfapy.Line(s, lazy = True)
+    with self.assertRaises(gfapy.InconsistencyError):
+      l.validate()
+    # the lines are not decoded by the validation done on construction
+    g = gfapy.Gfa([s], lazy = True)
+    self.assertIsNotNone(g.segment("1")._raw)
+    with self.assertRaises(gfapy.InconsistencyError):
+      g.validate()
+
+  def test_compact_instances(self):
+    l1 = gfapy.Line("L\t1\t+\t2\t-\t10M")
+    l2 = gfapy.Line("L\t2\t+\t3\t-\t10M")
+    for obj in [l1, l1.oriented_from, l1.from_end, l1.overlap[0]]:
+      self.assertFalse(hasattr(obj, "__dict__"))
+    # lines without custom tags and references share empty defaults
+    self.assertIs(l1._datatype, l2._datatype)
+    self.assertIs(l1._refs, l2._refs)
+    l1.zz = "x"
+    self.assertEqual("Z", l1.get_datatype("zz"))
+    self.assertEqual({}, dict(l2._datatype))
+    self.assertEqual(["zz"], l1.tagnames)
+    self.assertEqual([], l2.tagnames)
+    l2.set("zz", 1)
+    self.assertEqual("x", l1.zz)
+    self.assertEqual(1, l2.zz)
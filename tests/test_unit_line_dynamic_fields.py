@@ -9,13 +9,11 @@ class TestUnitLineDynamicFields(unittest.TestCase):
     self.assertTrue(hasattr(l, "record_type"))
     # reqfields
     self.assertTrue(hasattr(l, "from_segment"))
-    self.assertIsInstance(object.__getattribute__(l, "from_segment"),
-                          gfapy.line.common.dynamic_fields.DynamicField)
+    self.assertIsInstance(getattr(l.__class__, "from_segment"), property)
     # predefined tags
     self.assertTrue(hasattr(l, "KC"))
     self.assertTrue(hasattr(l, "try_get_KC"))
-    self.assertIsInstance(object.__getattribute__(l, "KC"),
-                          gfapy.line.common.dynamic_fields.DynamicField)
+    self.assertIsInstance(getattr(l.__class__, "KC"), property)
     # custom tags
     self.assertTrue(hasattr(l, "zz"))
     self.assertTrue(hasattr(l, "try_get_zz"))
@@ -94,3 +92,26 @@ class TestUnitLineDynamicFields(unittest.TestCase):
     #with self.assertRaises(AttributeError):
     #  l.zzz="1"
 
+
+  def test_generated_accessors(self):
+    l = gfapy.Line("L\t1\t+\t2\t-\t10M\tKC:i:100")
+    self.assertEqual("1", l.from_segment)
+    self.assertEqual("+", l.from_orient)
+    self.assertEqual(100, l.try_get_KC())
+    self.assertEqual(None, l.RC)
+    with self.assertRaises(gfapy.NotFoundError):
+      l.try_get_RC()
+    # strings stored after the construction are decoded on access
+    l.from_orient = "x"
+    with self.assertRaises(gfapy.FormatError):
+      l.from_orient
+    l.KC = "12"
+    self.assertEqual(12, l.KC)
+    # the fields of lazy lines are decoded on the first access
+    l = gfapy.Line("L\t1\t+\t2\tx\t10M", lazy = True)
+    with self.assertRaises(gfapy.FormatError):
+      l.to_orient
+    s = gfapy.Line("S\t1\t*")
+    self.assertIsInstance(s.sequence, gfapy.Placeholder)
+    s.sequence = "*"
+    self.assertIsInstance(s.sequence, gfapy.Placeholder)
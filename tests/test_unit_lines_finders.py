@@ -47,6 +47,38 @@ class TestUnitLineFinders(unittest.TestCase):
     self.assertEqual(TestUnitLineFinders.l_gfa1[5],
                  TestUnitLineFinders.gfa1._search_link(gfapy.OrientedLine("1","-"), gfapy.OrientedLine("3","+"), "*"))
 
+  def test_search_link_after_changes(self):
+    g = gfapy.Gfa(["L\t1\t+\t2\t-\t*", "S\t1\t*", "S\t2\t*"])
+    l = g.dovetails[0]
+    # virtual segments substituted by the real ones
+    self.assertIs(l, g._search_link(gfapy.OrientedLine("1","+"),
+                                    gfapy.OrientedLine("2","-"), "*"))
+    g.segment("2").name = "3"
+    self.assertIsNone(g._search_link(gfapy.OrientedLine("1","+"),
+                                     gfapy.OrientedLine("2","-"), "*"))
+    self.assertIs(l, g._search_link(gfapy.OrientedLine("3","+"),
+                                    gfapy.OrientedLine("1","-"), "*"))
+    g.rm(l)
+    self.assertIsNone(g._search_link(gfapy.OrientedLine("1","+"),
+                                     gfapy.OrientedLine("3","-"), "*"))
+    self.assertEqual({}, g._link_index)
+
+  def test_search_link_multiple_links(self):
+    g = gfapy.Gfa(["S\t1\t*", "S\t2\t*", "L\t1\t+\t2\t+\t5M",
+                   "L\t2\t-\t1\t-\t3M"])
+    l1, l2 = g.dovetails
+    self.assertIs(l1, g._search_link(gfapy.OrientedLine("1","+"),
+                                     gfapy.OrientedLine("2","+"), "5M"))
+    self.assertIs(l2, g._search_link(gfapy.OrientedLine("1","+"),
+                                     gfapy.OrientedLine("2","+"), "3M"))
+    g.rm(l1)
+    self.assertIsNone(g._search_link(gfapy.OrientedLine("1","+"),
+                                     gfapy.OrientedLine("2","+"), "5M"))
+    self.assertIs(l2, g._search_link(gfapy.OrientedLine("2","-"),
+                                     gfapy.OrientedLine("1","-"), "3M"))
+    g.rm(l2)
+    self.assertEqual({}, g._link_index)
+
   def test_search_duplicate_gfa1(self):
     # link
     self.assertEqual(TestUnitLineFinders.l_gfa1[4], TestUnitLineFinders.gfa1._search_duplicate(TestUnitLineFinders.l_gfa1[4]))
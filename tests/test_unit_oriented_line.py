@@ -1,4 +1,5 @@
 import unittest
+import pickle
 import gfapy
 
 class TestUnitOrientedLine(unittest.TestCase):
@@ -98,3 +99,9 @@ class TestUnitOrientedLine(unittest.TestCase):
     self.assertEqual("CACAC", ol.field_to_s("sequence"))
     ol.set("xx", 1)
     self.assertEqual("xx:i:1", ol.field_to_s("xx", True))
+
+  def test_pickle(self):
+    a = gfapy.OrientedLine("a", "-")
+    b = pickle.loads(pickle.dumps(a))
+    self.assertEqual(a, b)
+    self.assertEqual("-", b.orient)
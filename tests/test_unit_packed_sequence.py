@@ -0,0 +1,57 @@
+import gfapy
+import unittest
+
+class TestUnitPackedSequence(unittest.TestCase):
+
+  def test_pack(self):
+    for s in ["", "A", "ACGTA", "ACGTNNNNacgtRYnA", "nnnn", "acgTTGCAaggc"]:
+      p = gfapy.PackedSequence(s)
+      self.assertEqual(s, str(p))
+      self.assertEqual(len(s), len(p))
+      self.assertEqual(p, s)
+      self.assertEqual(p, gfapy.PackedSequence(s))
+      self.assertEqual(hash(s), hash(p))
+    self.assertEqual(3, len(gfapy.PackedSequence("ACGTACGTACGT")._data))
+    self.assertNotEqual(gfapy.PackedSequence("ACGT"), "ACGA")
+
+  def test_getitem(self):
+    s = "ACGTNNacgtRYnACG"
+    p = gfapy.PackedSequence(s)
+    for i in range(-len(s), len(s)):
+      self.assertEqual(s[i], p[i])
+    for i in range(len(s)):
+      for j in range(i, len(s) + 1):
+        self.assertEqual(s[i:j], p[i:j])
+    self.assertEqual(s[::3], p[::3])
+    self.assertEqual(list(s), list(p))
+    self.assertEqual(s + "A", p + "A")
+    self.assertEqual("A" + s, "A" + p)
+    with self.assertRaises(IndexError):
+      p[len(s)]
+
+  def test_rc(self):
+    for s in ["ACGTA", "ACGTNNNNacgtRYnA", "acgTTGCAaggc", "ACGTACGT"]:
+      p = gfapy.PackedSequence(s)
+      rc = gfapy.sequence.rc(p)
+      self.assertIsInstance(rc, gfapy.PackedSequence)
+      self.assertEqual(gfapy.sequence.rc(s), str(rc))
+      self.assertEqual(p, rc.rc())
+    p = gfapy.PackedSequence("ACGU")
+    self.assertEqual("ACGU", gfapy.sequence.rc(p, rna = True))
+    with self.assertRaises(gfapy.ValueError):
+      gfapy.sequence.rc(gfapy.PackedSequence("ACGTZ"))
+    self.assertEqual("ZACGT",
+        str(gfapy.sequence.rc(gfapy.PackedSequence("ACGTZ"), valid = True)))
+
+  def test_pack_sequences(self):
+    gfa = gfapy.Gfa.from_file("tests/testdata/sample.gfa")
+    expected = str(gfa)
+    gfa.pack_sequences()
+    self.assertEqual(expected, str(gfa))
+    for s in gfa.segments:
+      self.assertIsInstance(s.sequence, gfapy.PackedSequence)
+    gfa = gfapy.Gfa(["S\t1\t*", "S\t2\tACGT"], vlevel = 3)
+    gfa.pack_sequences()
+    self.assertEqual(gfapy.Placeholder, gfa.segment("1").sequence.__class__)
+    self.assertEqual("ACGT", gfa.segment("2").sequence)
+    self.assertEqual(4, gfa.segment("2").length)
@@ -0,0 +1,73 @@
+import unittest
+import gfapy
+
+class TestUnitReferenceList(unittest.TestCase):
+
+  def test_list_operations(self):
+    a, b, c = [gfapy.Line("S\t{}\t*".format(n)) for n in "abc"]
+    refs = gfapy.ReferenceList([a, b])
+    refs.insert(0, c)
+    self.assertEqual([c, a, b], refs)
+    refs.append(c)
+    self.assertEqual([c, c, a, b], list(refs))
+    self.assertEqual(4, len(refs))
+    self.assertIs(c, refs[0])
+    self.assertIs(b, refs[-1])
+    self.assertIs(a, refs[2])
+    self.assertIn(a, refs)
+    self.assertNotIn(gfapy.Line("S\ta\t*"), refs)
+    self.assertEqual([a, c, c, a, b], [a] + refs)
+    self.assertEqual([c, c, a, b, a], refs + [a])
+
+  def test_removal(self):
+    a, b, c = [gfapy.Line("S\t{}\t*".format(n)) for n in "abc"]
+    refs = gfapy.ReferenceList([a, b, b, c])
+    refs.discard(b)
+    self.assertEqual([a, b, c], refs)
+    refs.discard(gfapy.Line("S\ta\t*"))
+    self.assertEqual([a, b, c], refs)
+    self.assertIs(a, refs.pop(0))
+    self.assertIs(c, refs.pop())
+    self.assertEqual([b], refs)
+    with self.assertRaises(gfapy.ArgumentError):
+      refs.pop(1)
+
+  def test_replace(self):
+    a, b, c = [gfapy.Line("S\t{}\t*".format(n)) for n in "abc"]
+    refs = gfapy.ReferenceList([a, b, b, c])
+    d = gfapy.Line("S\td\t*")
+    refs.replace(b, d)
+    self.assertEqual([a, d, d, c], refs)
+    refs.replace(d, a)
+    self.assertEqual([a, a, a, c], refs)
+    refs.replace(a, None)
+    self.assertEqual([c], refs)
+
+  def test_high_degree_segment(self):
+    n = 3 * gfapy.ReferenceList.THRESHOLD
+    gfa = gfapy.Gfa(["S\thub\t*"] +
+                    ["S\t{}\t*".format(i) for i in range(n)] +
+                    ["L\thub\t+\t{}\t+\t*".format(i) for i in range(n)] +
+                    ["P\tp{}\thub+,{}+\t*".format(i, i) for i in range(n)])
+    hub = gfa.segment("hub")
+    self.assertIsInstance(hub._refs["dovetails_R"], gfapy.ReferenceList)
+    for i in range(0, n, 2):
+      gfa.rm(str(i))
+    self.assertEqual([str(i) for i in range(1, n, 2)],
+                     [l.to_segment.name for l in hub.dovetails_R])
+    self.assertEqual(["p{}".format(i) for i in range(1, n, 2)],
+                     [p.name for p in hub.paths])
+    gfa.validate()
+
+  def test_disconnect_while_iterating(self):
+    n = 40
+    gfa = gfapy.Gfa(["S\thub\t*"] +
+                    ["S\t{}\t*".format(i) for i in range(n)] +
+                    ["L\thub\t+\t{}\t+\t*".format(i) for i in range(n)])
+    hub = gfa.segment("hub")
+    self.assertIsInstance(hub._refs["dovetails_R"], gfapy.ReferenceList)
+    for l in hub.dovetails_R:
+      l.disconnect()
+    self.assertEqual([], hub.dovetails_R)
+    self.assertEqual([], gfa.dovetails)
+    gfa.validate()
@@ -1,4 +1,5 @@
 import unittest
+import pickle
 import gfapy
 
 class TestUnitSegmentEnd(unittest.TestCase):
@@ -94,3 +95,7 @@ class TestUnitSegmentEnd(unittest.TestCase):
     sep.reverse()
     self.assertEqual([gfapy.SegmentEnd("b","L"),gfapy.SegmentEnd("a","R")],
       sep)
+
+  def test_pickle(self):
+    a = gfapy.SegmentEnd("a", "L")
+    self.assertEqual(a, pickle.loads(pickle.dumps(a)))
@@ -0,0 +1,63 @@
+import gfapy
+import os
+import tempfile
+import unittest
+
+class TestUnitSequenceStore(unittest.TestCase):
+
+  def test_handle(self):
+    with tempfile.TemporaryDirectory() as tmpdir:
+      filename = os.path.join(tmpdir, "seqs")
+      with open(filename, "w") as f:
+        f.write("S\t1\tACGT\nS\t2\tTTGCA\n")
+      store = gfapy.SequenceStore(filename)
+      h = store.handle(4, 4)
+      self.assertEqual(4, len(h))
+      self.assertEqual("ACGT", str(h))
+      self.assertEqual("TTGCA", str(store.handle(13, 5)))
+      self.assertEqual(h, "ACGT")
+      self.assertEqual(h, store.handle(4, 4))
+      self.assertNotEqual(h, store.handle(13, 5))
+      with self.assertRaises(gfapy.ValueError):
+        store.handle(13, 7)
+      with self.assertRaises(gfapy.RuntimeError):
+        store.add("ACGT")
+      store.close()
+
+  def test_add(self):
+    store = gfapy.SequenceStore()
+    h1 = store.add("ACGT")
+    self.assertEqual("ACGT", str(h1))
+    h2 = store.add("TTGCA")
+    self.assertEqual("TTGCA", str(h2))
+    self.assertEqual("ACGT", str(h1))
+    store.close()
+
+  def test_cache(self):
+    store = gfapy.SequenceStore(cache_size = 10)
+    h1 = store.add("AAAA")
+    h2 = store.add("CCCC")
+    h3 = store.add("GGGG")
+    h4 = store.add("T" * 11)
+    str(h1)
+    str(h2)
+    self.assertEqual(8, store._cache_bytes)
+    str(h1)
+    str(h3)
+    # h2 is the least recently used
+    self.assertEqual([(0, 4), (8, 4)], list(store._cache.keys()))
+    # sequences larger than the cache are not cached
+    self.assertEqual("T" * 11, str(h4))
+    self.assertEqual(8, store._cache_bytes)
+    store.clear_cache()
+    self.assertEqual(0, store._cache_bytes)
+    store.close()
+
+  def test_segment_sequence(self):
+    store = gfapy.SequenceStore()
+    s = gfapy.Line("S\t1\t*\tLN:i:4")
+    s._data["sequence"] = store.add("ACGT")
+    self.assertEqual("ACGT", s.sequence)
+    self.assertEqual("S\t1\tACGT\tLN:i:4", str(s))
+    self.assertEqual(4, s.length)
+    store.close()